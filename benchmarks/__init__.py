@@ -0,0 +1 @@
+"""Spectra 性能基准"""
@@ -0,0 +1,141 @@
+"""无显示 GUI 基准套件入口
+
+在 offscreen QPA 下运行全部（或筛选的）基准用例，结果保存为 JSON，
+并可与基线比较，超过阈值时以非零状态退出。
+
+用法:
+    python -m benchmarks                               # 运行全部用例
+    python -m benchmarks -k font -k page               # 只运行名称包含 font/page 的用例
+    python -m benchmarks --output results.json         # 保存结果
+    python -m benchmarks --baseline baseline.json --threshold 0.15 \\
+                         --threshold-for set_background_image_8k=0.5
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+from benchmarks import harness
+from managers import language
+from utils.icon_atlas import icon_atlas
+from benchmarks import bench_ui  # noqa: F401  注册用例
+
+
+class BenchContext:
+    """传递给用例的运行环境"""
+
+    def __init__(self, app, workdir):
+        self.app = app
+        self.workdir = workdir
+        self.windows = []
+
+    def process_events(self):
+        self.app.processEvents()
+
+    def wait_for_background(self, window, timeout=10.0):
+        """等待背景渲染完成"""
+        deadline = time.perf_counter() + timeout
+        manager = window.bg_manager
+        while getattr(manager, "is_busy", lambda: False)() and time.perf_counter() < deadline:
+            self.app.processEvents()
+            time.sleep(0.001)
+        self.app.processEvents()
+
+    def cleanup(self):
+        for window in self.windows:
+            window.close()
+            window.deleteLater()
+        self.windows = []
+        self.app.processEvents()
+
+
+def _prepare_workdir():
+    """创建隔离的工作目录，避免基准改写项目中的 config.json 和缓存"""
+    workdir = tempfile.mkdtemp(prefix="spectra-bench-")
+    # 图集与语言索引默认位于项目根目录的 cache/，这里改为工作目录中的副本
+    icon_atlas.atlas_path = os.path.join(workdir, "cache", "icon_atlas.bin")
+    language.DEFAULT_INDEX_PATH = os.path.join(workdir, "cache", "lang_index.json")
+    shutil.copytree(os.path.join(ROOT_DIR, "lang"), os.path.join(workdir, "lang"))
+    icon = os.path.join(ROOT_DIR, "icon.png")
+    if os.path.exists(icon):
+        shutil.copy(icon, workdir)
+    return workdir
+
+
+def _parse_overrides(values):
+    overrides = {}
+    for value in values or []:
+        name, _, limit = value.partition("=")
+        overrides[name] = float(limit)
+    return overrides
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Spectra headless GUI benchmarks")
+    parser.add_argument("-k", dest="filters", action="append", help="只运行名称包含该子串的用例")
+    parser.add_argument("--rounds", type=int, help="覆盖每个用例的轮数")
+    parser.add_argument("--output", help="结果 JSON 输出路径")
+    parser.add_argument("--baseline", help="用于比较的基线 JSON")
+    parser.add_argument("--threshold", type=float, default=0.2, help="允许的相对变慢比例，默认 0.2")
+    parser.add_argument("--threshold-for", action="append", metavar="NAME=RATIO", help="为单个用例指定阈值")
+    parser.add_argument("--list", action="store_true", help="列出全部用例")
+    args = parser.parse_args()
+
+    cases = harness.registered_cases()
+    if args.filters:
+        cases = [c for c in cases if any(f in c.name for f in args.filters)]
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return
+
+    workdir = _prepare_workdir()
+    os.chdir(workdir)
+    # 与 main.py 相同：字体随 QApplication.setFont 传播
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_UseStyleSheetPropagationInWidgetStyles)
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    results = {}
+    try:
+        for case in cases:
+            context = BenchContext(app, workdir)
+            try:
+                results[case.name] = harness.run_case(case, context, args.rounds)
+            finally:
+                context.cleanup()
+            r = results[case.name]
+            print(f"{case.name:28} median {r['median_ms']:9.2f} ms   min {r['min_ms']:9.2f} ms   ({r['rounds']} rounds)")
+    finally:
+        os.chdir(ROOT_DIR)
+        # 在删除工作目录之前写入，退出时不再写入已删除的目录
+        icon_atlas.save()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        harness.save_results(args.output, results)
+
+    if args.baseline:
+        rows = harness.compare(results, harness.load_results(args.baseline),
+                               args.threshold, _parse_overrides(args.threshold_for))
+        regressions = [row for row in rows if row[4]]
+        print()
+        for name, base, value, change, regressed in rows:
+            mark = "REGRESSION" if regressed else "ok"
+            print(f"{name:28} {base:9.2f} -> {value:9.2f} ms  {change * 100:+6.1f}%  {mark}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
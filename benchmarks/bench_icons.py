@@ -0,0 +1,82 @@
+"""SVG 图标渲染微基准
+
+对比旧的逐像素着色流程（32px 渲染 + pixelColor/setPixelColor + 二次缩放）、
+新的按目标尺寸直接渲染 + 整体着色流程，以及经过 icon_cache 命中时的单图标耗时。
+
+用法: python benchmarks/bench_icons.py [--dpi 1.5] [--rounds 5]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QIcon, QPixmap, QColor
+from PyQt6.QtCore import Qt
+
+from utils.icons import render_svg_icon, load_svg_icon, DEFAULT_ICON_SIZE
+
+
+def legacy_load(svg_path, dpi_scale):
+    """旧实现：固定 32px 渲染后逐像素改色，再缩放到显示尺寸"""
+    icon = QIcon(svg_path)
+    pixmap = icon.pixmap(32, 32)
+    image = pixmap.toImage()
+    for y in range(image.height()):
+        for x in range(image.width()):
+            color = image.pixelColor(x, y)
+            if color.alpha() > 0:
+                image.setPixelColor(x, y, QColor(255, 255, 255, color.alpha()))
+    result = QPixmap.fromImage(image)
+    target_size = int(DEFAULT_ICON_SIZE * dpi_scale)
+    return result.scaled(target_size, target_size, Qt.AspectRatioMode.KeepAspectRatio,
+                         Qt.TransformationMode.SmoothTransformation)
+
+
+def new_load(svg_path, dpi_scale):
+    return render_svg_icon(svg_path, int(DEFAULT_ICON_SIZE * dpi_scale))
+
+
+def cached_load(svg_path, dpi_scale):
+    return load_svg_icon(os.path.relpath(svg_path, ROOT_DIR), dpi_scale)
+
+
+def bench(func, paths, dpi_scale, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for path in paths:
+            func(path, dpi_scale)
+        best = min(best, time.perf_counter() - start)
+    return best / len(paths)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dpi", type=float, default=1.0)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    svg_dir = os.path.join(ROOT_DIR, "svg")
+    paths = sorted(glob.glob(os.path.join(svg_dir, "*.svg")))
+
+    legacy = bench(legacy_load, paths, args.dpi, args.rounds)
+    new = bench(new_load, paths, args.dpi, args.rounds)
+    cached = bench(cached_load, paths, args.dpi, args.rounds)
+
+    print(f"icons: {len(paths)}  dpi_scale: {args.dpi}")
+    print(f"legacy  per icon: {legacy * 1e6:9.1f} us")
+    print(f"new     per icon: {new * 1e6:9.1f} us")
+    print(f"cached  per icon: {cached * 1e6:9.1f} us")
+    print(f"speedup: {legacy / new:.1f}x (render), {legacy / cached:.0f}x (cached)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""启动基准
+
+在独立子进程中测量启动阶段的耗时：
+- 无磁盘图集（冷启动）与已有图集（热启动）时加载侧边栏和设置页全部图标的开销；
+- 页面延迟构建与一次性构建全部页面时，主窗口的首帧耗时和控件数峰值。
+
+用法: python benchmarks/bench_startup.py [--dpi 1.5] [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# Window 构建侧边栏与设置页时加载的图标
+STARTUP_ICONS = [
+    "svg/chevron-bar-right.svg", "svg/chevron-bar-left.svg",
+    "svg/grid-1x2.svg", "svg/grid-1x2-fill.svg",
+    "svg/box.svg", "svg/box-fill.svg",
+    "svg/arrow-down-circle.svg", "svg/arrow-down-circle-fill.svg",
+    "svg/gear.svg", "svg/gear-fill.svg",
+    "svg/palette.svg", "svg/translate.svg", "svg/type.svg",
+    "svg/check-lg.svg", "svg/folder2.svg",
+]
+
+
+def child(atlas_path, dpi_scale):
+    """子进程：加载启动图标并输出耗时（毫秒）"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, ROOT_DIR)
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+
+    from utils.icon_atlas import icon_atlas
+    from utils import load_svg_icon
+    icon_atlas.atlas_path = atlas_path
+
+    start = time.perf_counter()
+    for path in STARTUP_ICONS:
+        load_svg_icon(path, dpi_scale)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({"icons_ms": elapsed * 1000}))
+
+
+def child_window(lazy):
+    """子进程：构建并显示主窗口，输出首帧耗时（毫秒）与控件数峰值"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, ROOT_DIR)
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtWidgets import QApplication
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_UseStyleSheetPropagationInWidgetStyles)
+    app = QApplication(sys.argv)
+
+    start = time.perf_counter()
+    from window import Window
+    Window.LAZY_PAGES = lazy
+    # 首帧后的空闲预构建不计入首帧，这里关闭以统计首帧时刻的控件数
+    Window.PREBUILD_PAGES_WHEN_IDLE = False
+    window = Window()
+    result = {}
+
+    def on_first_frame():
+        result["first_frame_ms"] = (time.perf_counter() - start) * 1000
+        result["widgets"] = len(QApplication.allWidgets())
+        app.quit()
+
+    window.first_frame_shown.connect(on_first_frame)
+    window.show()
+    app.exec()
+    print(json.dumps(result))
+
+
+def run_child(atlas_path, dpi_scale):
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", atlas_path, "--dpi", str(dpi_scale)],
+        capture_output=True, text=True, check=True, cwd=ROOT_DIR
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def run_window_child(lazy):
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child-window", "lazy" if lazy else "eager"],
+        capture_output=True, text=True, check=True, cwd=ROOT_DIR
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dpi", type=float, default=1.0)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", metavar="ATLAS", help=argparse.SUPPRESS)
+    parser.add_argument("--child-window", choices=["lazy", "eager"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.dpi)
+        return
+    if args.child_window:
+        child_window(args.child_window == "lazy")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        atlas_path = os.path.join(tmp, "icon_atlas.bin")
+        cold, warm = [], []
+        for _ in range(args.runs):
+            if os.path.exists(atlas_path):
+                os.remove(atlas_path)
+            cold.append(run_child(atlas_path, args.dpi)["icons_ms"])
+            warm.append(run_child(atlas_path, args.dpi)["icons_ms"])
+
+    cold_ms, warm_ms = min(cold), min(warm)
+    print(f"startup icons: {len(STARTUP_ICONS)}  dpi_scale: {args.dpi}")
+    print(f"cold (no atlas):   {cold_ms:8.2f} ms")
+    print(f"warm (icon atlas): {warm_ms:8.2f} ms")
+    print(f"saved: {cold_ms - warm_ms:.2f} ms ({(1 - warm_ms / cold_ms) * 100:.0f}%)")
+
+    for lazy in (False, True):
+        runs = [run_window_child(lazy) for _ in range(args.runs)]
+        first_frame = min(r["first_frame_ms"] for r in runs)
+        widgets = max(r["widgets"] for r in runs)
+        label = "lazy pages" if lazy else "eager pages"
+        print(f"{label:12} first frame: {first_frame:8.1f} ms  widgets: {widgets}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""主窗口交互基准用例"""
+
+import os
+
+from PyQt6.QtGui import QImage, QLinearGradient, QPainter, QColor
+
+from benchmarks.harness import benchmark
+
+
+def _make_window(context):
+    from window import Window
+    # 基准中不发起新闻网络请求
+    Window.NEWS_URL = ""
+    window = Window()
+    window.show()
+    context.process_events()
+    context.windows.append(window)
+    return window
+
+
+def generate_image(path, width, height):
+    """生成带渐变的大尺寸测试图片"""
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    painter = QPainter(image)
+    gradient = QLinearGradient(0, 0, width, height)
+    gradient.setColorAt(0, QColor(30, 60, 120))
+    gradient.setColorAt(0.5, QColor(200, 120, 40))
+    gradient.setColorAt(1, QColor(20, 160, 90))
+    painter.fillRect(image.rect(), gradient)
+    painter.end()
+    image.save(path)
+    return path
+
+
+@benchmark("window_construct", rounds=5)
+def bench_window_construct(context):
+    def run():
+        window = _make_window(context)
+        window.close()
+        window.deleteLater()
+        context.process_events()
+    return run
+
+
+@benchmark("switch_page_all", rounds=20)
+def bench_switch_page(context):
+    window = _make_window(context)
+
+    def run():
+        for index in (1, 2, 3, 0):
+            window.switch_page(index)
+        context.process_events()
+    return run
+
+
+@benchmark("toggle_sidebar", rounds=20)
+def bench_toggle_sidebar(context):
+    window = _make_window(context)
+
+    def run():
+        window.toggle_sidebar()
+        window.anim.stop()
+        window.anim2.stop()
+        context.process_events()
+    return run
+
+
+@benchmark("apply_font_new_family", rounds=10)
+def bench_apply_font(context):
+    window = _make_window(context)
+    window.switch_page(3)
+    families = ["Arial", "Verdana", "Tahoma", "Segoe UI"]
+    state = {"i": 0}
+
+    def run():
+        state["i"] += 1
+        window.config["font_mode"] = 0
+        window.config["custom_font_family"] = families[state["i"] % len(families)]
+        window.apply_font()
+        context.process_events()
+    return run
+
+
+@benchmark("change_language", rounds=10)
+def bench_change_language(context):
+    window = _make_window(context)
+    window.switch_page(3)
+    count = max(1, len(window.language_manager.get_all_languages()))
+    state = {"i": 0}
+
+    def run():
+        state["i"] += 1
+        window.change_language(state["i"] % count)
+        context.process_events()
+    return run
+
+
+@benchmark("opacity_slider_sweep", rounds=5)
+def bench_opacity_sweep(context):
+    window = _make_window(context)
+    window.switch_page(3)
+
+    def run():
+        for value in range(10, 256, 5):
+            window.on_opacity_changed(value)
+        context.process_events()
+    return run
+
+
+@benchmark("set_background_image_8k", rounds=5)
+def bench_background_image(context):
+    path = generate_image(os.path.join(context.workdir, "bench_8k.png"), 7680, 4320)
+    window = _make_window(context)
+    window.resize(1280, 800)
+    context.process_events()
+
+    def run():
+        # 每轮都从文件冷解码
+        window.bg_manager.clear_cache()
+        window.set_background_image(path)
+        context.wait_for_background(window)
+    return run
+
+
+@benchmark("retranslate_ui", rounds=20)
+def bench_retranslate_ui(context):
+    window = _make_window(context)
+    # 构建全部页面，覆盖完整的重新翻译路径
+    for index in range(window.stack.count()):
+        window.switch_page(index)
+    window.switch_page(0)
+    context.process_events()
+    codes = window.language_manager.get_available_languages()
+    state = {"i": 0}
+
+    def run():
+        # 在各语言间轮换，保证每轮文本都确实发生变化
+        state["i"] += 1
+        window.language_manager.set_language(codes[state["i"] % len(codes)])
+        window.update_ui_language()
+        context.process_events()
+    return run
+
+
+@benchmark("translate_lookup_x10000", rounds=10)
+def bench_translate_lookup(context):
+    from managers import LanguageManager
+    manager = LanguageManager()
+    keys = list(manager.get_translations("en_US")) + ["missing_key"]
+
+    def run():
+        translate = manager.translate
+        for _ in range(10000 // len(keys) + 1):
+            for key in keys:
+                translate(key)
+    return run
+
+
+def generate_language_packs(directory, count, keys):
+    """生成 count 个各含 keys 条翻译的语言文件（另含 en_US）"""
+    import json
+    os.makedirs(directory, exist_ok=True)
+    for index in range(count + 1):
+        code = "en_US" if index == 0 else f"x{index:03d}_XX"
+        data = {
+            "metadata": {"name": code, "code": code, "author": "bench"},
+            "translations": {f"key_{n}": f"{code} text {n}" for n in range(keys)},
+        }
+        with open(os.path.join(directory, f"{code}.json"), "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    return directory
+
+
+@benchmark("language_discovery_60_packs", rounds=10)
+def bench_language_discovery(context):
+    from managers import LanguageManager
+    lang_dir = generate_language_packs(os.path.join(context.workdir, "bench_lang"), 60, 3000)
+    LanguageManager(lang_dir=lang_dir)
+
+    def run():
+        LanguageManager(lang_dir=lang_dir)
+    return run
@@ -0,0 +1,100 @@
+"""背景视频 CPU 占用基准
+
+用 ffmpeg 在本地生成一段 1080p60 测试视频，分别在 QGraphicsVideoItem 模式（帧率不限）
+和 QVideoSink 低功耗模式（不同帧率上限）下，在独立子进程中播放固定时长，
+输出该时段内进程消耗的 CPU 时间（用户态 + 内核态，包含解码线程）。
+
+用法: python benchmarks/bench_video.py [--seconds 10] [--fps 0 30 15]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+WINDOW_SIZE = (1280, 720)
+WARMUP_SECONDS = 2.0
+
+
+def generate_clip(path, seconds=12, size="1920x1080", rate=60):
+    """生成测试视频，需要 PATH 中有 ffmpeg"""
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        print("ffmpeg not found in PATH; it is needed to generate the test clip")
+        sys.exit(2)
+    subprocess.run([
+        ffmpeg, "-v", "error", "-y",
+        "-f", "lavfi", "-i", f"testsrc2=size={size}:rate={rate}",
+        "-t", str(seconds), "-c:v", "libx264", "-pix_fmt", "yuv420p", path,
+    ], check=True)
+    return path
+
+
+def child(clip, fps, seconds):
+    """子进程：播放视频背景并输出 CPU 时间"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, ROOT_DIR)
+    from PyQt6.QtWidgets import QApplication, QWidget
+    app = QApplication(sys.argv)
+
+    from managers.background import BackgroundManager
+    widget = QWidget()
+    widget.resize(*WINDOW_SIZE)
+    widget.show()
+    manager = BackgroundManager(widget, video_max_fps=fps)
+    manager.set_background_image(clip)
+
+    def run_for(duration):
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline:
+            app.processEvents()
+            time.sleep(0.001)
+
+    run_for(WARMUP_SECONDS)
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    run_for(seconds)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    manager.shutdown()
+    print(json.dumps({"cpu_s": cpu, "wall_s": wall}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--fps", type=int, nargs="+", default=[0, 30, 15])
+    parser.add_argument("--clip", help="使用已有视频而不是生成测试视频")
+    parser.add_argument("--child", nargs=2, metavar=("CLIP", "FPS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child[0], int(args.child[1]), args.seconds)
+        return
+
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    with tempfile.TemporaryDirectory(prefix="spectra-video-") as tmp:
+        clip = args.clip or generate_clip(os.path.join(tmp, "clip.mp4"),
+                                          seconds=int(args.seconds + WARMUP_SECONDS) + 2)
+        print(f"clip {clip}, window {WINDOW_SIZE[0]}x{WINDOW_SIZE[1]}, {args.seconds:.0f} s per mode")
+        for fps in args.fps:
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--seconds", str(args.seconds),
+                 "--child", clip, str(fps)],
+                capture_output=True, text=True, cwd=ROOT_DIR, env=env
+            )
+            if out.returncode != 0:
+                print(out.stderr)
+                sys.exit(out.returncode)
+            result = json.loads(out.stdout.strip().splitlines()[-1])
+            mode = "video item (unlimited)" if fps <= 0 else f"video sink {fps} fps"
+            print(f"{mode:24} cpu {result['cpu_s']:6.2f} s  ({result['cpu_s'] / result['wall_s'] * 100:5.1f}% of one core)")
+
+
+if __name__ == "__main__":
+    main()
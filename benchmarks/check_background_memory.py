@@ -0,0 +1,177 @@
+"""超大背景图片的内存峰值检查
+
+生成超大尺寸（默认 16384x9216）的 JPEG 和 PNG，在独立子进程中通过
+ImageDecodeThread 按屏幕尺寸解码，记录解码前后的峰值 RSS（Windows 上为峰值工作集）。
+作为对照，同时测量不限制分配上限、完整解码时的峰值。
+
+JPEG 应在解码阶段缩小，峰值增量需低于内存上限；PNG 无法在解码阶段缩小，
+只能临时按原尺寸解码，峰值增量不应超过 MAX_FULL_DECODE_MB 加内存上限。
+两者都必须成功显示（原尺寸超过 MAX_FULL_DECODE_MB 的 PNG 除外，此时应报告错误）。
+不满足时以非零状态退出。
+
+用法: python benchmarks/check_background_memory.py [--size 16384x9216] [--limit 256]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+from managers.image_decoder import MAX_FULL_DECODE_MB
+
+# 模拟的屏幕尺寸
+SCREEN_SIZE = (2560, 1440)
+
+
+def _peak_rss_mb():
+    """当前进程的峰值常驻内存（MB），平台不支持时返回 None"""
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        get_current_process = ctypes.windll.kernel32.GetCurrentProcess
+        get_current_process.restype = wintypes.HANDLE
+        get_memory_info = ctypes.windll.psapi.GetProcessMemoryInfo
+        get_memory_info.argtypes = [wintypes.HANDLE, ctypes.POINTER(ProcessMemoryCounters), wintypes.DWORD]
+        if not get_memory_info(get_current_process(), ctypes.byref(counters), counters.cb):
+            return None
+        return counters.PeakWorkingSetSize / (1024 * 1024)
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 以 KB 为单位，macOS 以字节为单位
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def child_generate(path, width, height):
+    """子进程：生成测试图片（生成本身需要全尺寸内存，因此与测量进程分离）"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtGui import QImage, QLinearGradient, QPainter, QColor
+    image = QImage(width, height, QImage.Format.Format_RGB888)
+    painter = QPainter(image)
+    gradient = QLinearGradient(0, 0, width, height)
+    gradient.setColorAt(0, QColor(30, 60, 120))
+    gradient.setColorAt(1, QColor(200, 120, 40))
+    painter.fillRect(image.rect(), gradient)
+    painter.end()
+    quality = 85 if path.endswith(".jpg") else -1
+    if not image.save(path, quality=quality):
+        sys.exit(1)
+
+
+def child_decode(path, limit_mb, full):
+    """子进程：解码图片并输出峰值 RSS 增量（MB）"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtCore import QCoreApplication
+    from PyQt6.QtGui import QImageReader
+    app = QCoreApplication(sys.argv)
+
+    from managers.image_decoder import ImageDecodeThread
+    baseline = _peak_rss_mb()
+    start = time.perf_counter()
+
+    if full:
+        # 对照：不设分配上限，完整解码
+        reader = QImageReader(path)
+        reader.setAllocationLimit(0)
+        image = reader.read()
+        result = {"ok": not image.isNull(), "width": image.width(), "height": image.height()}
+    else:
+        result = {}
+        decoder = ImageDecodeThread(limit_mb)
+        decoder.decoded.connect(lambda rid, p, img: result.update(ok=True, width=img.width(), height=img.height()))
+        decoder.failed.connect(lambda rid, p, error: result.update(ok=False, width=0, height=0, error=error))
+        decoder.start()
+        decoder.request(1, path, 1280, 720, source_size=SCREEN_SIZE)
+        while not result:
+            app.processEvents()
+            time.sleep(0.005)
+        decoder.stop()
+
+    result["ms"] = (time.perf_counter() - start) * 1000
+    result["peak_delta_mb"] = _peak_rss_mb() - baseline
+    print(json.dumps(result))
+
+
+def _run(args):
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    out = subprocess.run([sys.executable, os.path.abspath(__file__)] + args,
+                         capture_output=True, text=True, cwd=ROOT_DIR, env=env)
+    if out.returncode != 0:
+        print(out.stderr)
+        sys.exit(out.returncode)
+    return json.loads(out.stdout.strip().splitlines()[-1]) if out.stdout.strip() else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", default="16384x9216")
+    parser.add_argument("--limit", type=int, default=256, help="背景资源内存上限 (MB)")
+    parser.add_argument("--child-generate", nargs=3, help=argparse.SUPPRESS)
+    parser.add_argument("--child-decode", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child_generate:
+        path, width, height = args.child_generate
+        child_generate(path, int(width), int(height))
+        return
+    if args.child_decode:
+        path, limit, full = args.child_decode
+        child_decode(path, int(limit), full == "1")
+        return
+
+    if _peak_rss_mb() is None:
+        print(f"SKIP: peak RSS is not available on {sys.platform}")
+        return
+
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    full_mb = width * height * 4 / (1024 * 1024)
+    print(f"image {width}x{height} (full decode ~{full_mb:.0f} MB), limit {args.limit} MB, screen {SCREEN_SIZE[0]}x{SCREEN_SIZE[1]}")
+
+    failed = False
+    with tempfile.TemporaryDirectory(prefix="spectra-mem-") as tmp:
+        for ext in ("jpg", "png"):
+            path = os.path.join(tmp, f"oversized.{ext}")
+            _run(["--child-generate", path, str(width), str(height)])
+            full = _run(["--child-decode", path, "0", "1"])
+            scaled = _run(["--child-decode", path, str(args.limit), "0"])
+            print(f"{ext}: full decode   peak +{full['peak_delta_mb']:7.1f} MB  {full['ms']:8.1f} ms")
+            status = f"{scaled['width']}x{scaled['height']}" if scaled["ok"] else f"failed: {scaled['error']}"
+            print(f"{ext}: background    peak +{scaled['peak_delta_mb']:7.1f} MB  {scaled['ms']:8.1f} ms  ({status})")
+            # JPEG 在解码阶段缩小；PNG 需要临时的原尺寸图片
+            peak_limit = args.limit if ext == "jpg" else MAX_FULL_DECODE_MB + args.limit
+            if scaled["peak_delta_mb"] > peak_limit:
+                print(f"FAIL: {ext} peak exceeds {peak_limit} MB")
+                failed = True
+            if not scaled["ok"] and (ext == "jpg" or full_mb <= MAX_FULL_DECODE_MB):
+                print(f"FAIL: {ext} should be displayed")
+                failed = True
+            if not scaled["ok"] and not scaled["error"]:
+                print(f"FAIL: {ext} failed without an error message")
+                failed = True
+
+    if failed:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
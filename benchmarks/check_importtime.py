@@ -0,0 +1,76 @@
+"""导入耗时回归检查
+
+通过 `python -X importtime` 分别导入主窗口模块和程序入口，确认重量级子系统
+（QtMultimedia、QtNetwork、BlurWindow）没有在启动时被导入，
+并输出各模块的累计导入耗时。存在回归时以非零状态退出。
+
+用法: python benchmarks/check_importtime.py [--module window] [--module main]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# 只应在实际需要时才导入的模块
+DEFERRED_MODULES = [
+    "PyQt6.QtMultimedia",
+    "PyQt6.QtMultimediaWidgets",
+    "PyQt6.QtNetwork",
+    "BlurWindow",
+]
+
+
+def parse_importtime(stderr):
+    """解析 -X importtime 输出，返回 {模块名: (自身耗时us, 累计耗时us)}"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        name = parts[2].strip()
+        modules[name] = (int(parts[0]), int(parts[1]))
+    return modules
+
+
+def check_module(module, env):
+    """导入 module，返回提前导入的延迟模块列表"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=ROOT_DIR, env=env
+    )
+    if result.returncode != 0:
+        print(result.stderr)
+        sys.exit(result.returncode)
+
+    modules = parse_importtime(result.stderr)
+    if module in modules:
+        print(f"import {module}: {modules[module][1] / 1000:.1f} ms cumulative")
+    return [name for name in modules
+            if any(name == m or name.startswith(m + ".") for m in DEFERRED_MODULES)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", dest="modules", action="append",
+                        help="要检查的模块，可重复，默认 window 与 main")
+    args = parser.parse_args()
+
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    failed = False
+    for module in args.modules or ["window", "main"]:
+        leaked = check_module(module, env)
+        if leaked:
+            print(f"FAIL: deferred modules imported by {module}: " + ", ".join(sorted(leaked)))
+            failed = True
+    if failed:
+        sys.exit(1)
+    print("OK: no deferred modules imported at startup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""单实例检查
+
+在临时工作目录中无显示启动两个实例：第一个实例完成启动后再启动第二个，
+确认第二个实例把命令行参数转发给第一个实例并迅速退出，
+且第一个实例收到了这些参数。不满足时以非零状态退出。
+
+用法: python benchmarks/check_single_instance.py [--timeout 30]
+"""
+
+import argparse
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+MAIN_SCRIPT = os.path.join(ROOT_DIR, "main.py")
+
+# 第二个实例的参数（模拟打开一个整合包文件）
+FORWARDED_ARGS = ["--import", "example pack.zip"]
+# 第二个实例从启动到退出的上限（包含解释器启动）
+MAX_FORWARD_SECONDS = 2.0
+
+
+def _read_lines(stream, lines):
+    for line in stream:
+        lines.put(line.rstrip("\n"))
+
+
+def _wait_for(lines, text, timeout):
+    """等待输出中出现 text，返回该行（超时返回 None）"""
+    deadline = time.perf_counter() + timeout
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return None
+        try:
+            line = lines.get(timeout=remaining)
+        except queue.Empty:
+            return None
+        if text in line:
+            return line
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    with tempfile.TemporaryDirectory(prefix="spectra-instance-") as tmp:
+        # 资源按工作目录的相对路径加载；独立的工作目录也不会连接到正在使用的实例
+        for name in ("lang", "svg"):
+            shutil.copytree(os.path.join(ROOT_DIR, name), os.path.join(tmp, name))
+
+        start = time.perf_counter()
+        first = subprocess.Popen([sys.executable, MAIN_SCRIPT], cwd=tmp, env=env,
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        lines = queue.Queue()
+        threading.Thread(target=_read_lines, args=(first.stderr, lines), daemon=True).start()
+        try:
+            if _wait_for(lines, "time to interactive", args.timeout) is None:
+                print("first instance did not finish starting up")
+                sys.exit(1)
+            first_startup = time.perf_counter() - start
+
+            start = time.perf_counter()
+            second = subprocess.run([sys.executable, MAIN_SCRIPT] + FORWARDED_ARGS, cwd=tmp, env=env,
+                                    capture_output=True, text=True, timeout=args.timeout)
+            forward_time = time.perf_counter() - start
+
+            received = _wait_for(lines, "arguments from another instance", 5.0)
+        finally:
+            first.terminate()
+            first.wait()
+
+    print(f"first instance startup:   {first_startup * 1000:8.1f} ms")
+    print(f"second instance exit:     {forward_time * 1000:8.1f} ms  (returncode {second.returncode})")
+    print(f"received: {received}")
+
+    failures = []
+    if second.returncode != 0:
+        failures.append(f"second instance exited with {second.returncode}: {second.stderr.strip()}")
+    if forward_time > MAX_FORWARD_SECONDS:
+        failures.append(f"second instance took longer than {MAX_FORWARD_SECONDS:.1f} s")
+    if received is None or repr(FORWARDED_ARGS) not in received:
+        failures.append("first instance did not receive the forwarded arguments")
+    for failure in failures:
+        print("FAIL:", failure)
+    if failures:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
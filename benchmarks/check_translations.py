@@ -0,0 +1,37 @@
+"""翻译完整性检查
+
+加载 lang 目录中的全部语言文件，列出每种语言缺少的翻译键
+（其他语言中存在、该语言中没有的键，运行时会回退到 en_US 或显示键名）。
+存在缺失时以非零状态退出。
+
+用法: python benchmarks/check_translations.py [--lang-dir lang]
+"""
+
+import argparse
+import os
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+from managers.language import LanguageManager
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lang-dir", default=os.path.join(ROOT_DIR, "lang"))
+    args = parser.parse_args()
+
+    manager = LanguageManager(lang_dir=args.lang_dir)
+    missing = manager.get_missing_keys()
+    for code, keys in sorted(missing.items()):
+        print(f"{code:8} {len(manager.get_translations(code)):4} keys, {len(keys)} missing")
+        for key in keys:
+            print(f"    {key}")
+    if any(missing.values()):
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""背景视频播放状态检查
+
+用记录调用的替身播放器代替 QMediaPlayer，模拟“视频背景 → 切换为纯色/模糊背景 →
+窗口隐藏 → 窗口显示”，确认切换后的暂停与恢复不会再次播放已停止的视频；
+视频仍是当前背景时则应正常暂停与恢复。不满足时以非零状态退出。
+
+用法: python benchmarks/check_video_playback.py
+"""
+
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from managers.background import BackgroundManager
+
+
+class StubPlayer:
+    """只记录 stop/pause/play 调用的播放器"""
+
+    def __init__(self):
+        self.calls = []
+
+    def stop(self):
+        self.calls.append("stop")
+
+    def pause(self):
+        self.calls.append("pause")
+
+    def play(self):
+        self.calls.append("play")
+
+
+def _manager_playing_video(parent):
+    """返回一个正在播放视频背景（替身播放器）的 BackgroundManager"""
+    manager = BackgroundManager(parent)
+    manager.player = StubPlayer()
+    manager.video_view = QWidget(parent)
+    manager.current_video_path = os.path.join(ROOT_DIR, "background.mp4")
+    return manager
+
+
+def _hide_and_show(manager):
+    manager.set_video_playback_allowed(False)
+    manager.set_video_playback_allowed(True)
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    parent = QWidget()
+    parent.resize(800, 600)
+
+    cases = {}
+
+    manager = _manager_playing_video(parent)
+    _hide_and_show(manager)
+    cases["video -> hide -> show"] = (manager.player.calls, ["pause", "play"])
+
+    manager = _manager_playing_video(parent)
+    manager.set_solid_color("#ff203040")
+    _hide_and_show(manager)
+    cases["video -> solid -> hide -> show"] = (manager.player.calls, ["stop"])
+
+    manager = _manager_playing_video(parent)
+    manager.hide()
+    _hide_and_show(manager)
+    cases["video -> blur -> hide -> show"] = (manager.player.calls, ["stop"])
+
+    failed = False
+    for name, (calls, expected) in cases.items():
+        ok = calls == expected
+        failed |= not ok
+        print(f"{name:32} {calls}" + ("" if ok else f"  FAIL: expected {expected}"))
+    parent.deleteLater()
+    app.processEvents()
+    if failed:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""基准测试框架
+
+负责注册与运行基准用例、统计耗时、保存 JSON 结果，并与基线比较检测回归。
+"""
+
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+
+_registry = []
+
+
+class BenchmarkCase:
+    def __init__(self, name, func, rounds, warmup):
+        self.name = name
+        self.func = func
+        self.rounds = rounds
+        self.warmup = warmup
+
+
+def benchmark(name, rounds=10, warmup=1):
+    """注册基准用例
+
+    被装饰的函数接收 context，返回一个无参的 run() 可调用对象；
+    setup 在函数体中完成，只有 run() 的耗时被统计。
+    """
+    def decorator(func):
+        _registry.append(BenchmarkCase(name, func, rounds, warmup))
+        return func
+    return decorator
+
+
+def registered_cases():
+    return list(_registry)
+
+
+def run_case(case, context, rounds=None):
+    """运行单个用例，返回耗时统计（毫秒）"""
+    run = case.func(context)
+    for _ in range(case.warmup):
+        run()
+    samples = []
+    for _ in range(rounds or case.rounds):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "max_ms": round(max(samples), 3),
+        "rounds": len(samples),
+    }
+
+
+def environment_info():
+    from PyQt6.QtCore import QT_VERSION_STR, PYQT_VERSION_STR
+    return {
+        "python": platform.python_version(),
+        "qt": QT_VERSION_STR,
+        "pyqt": PYQT_VERSION_STR,
+        "platform": sys.platform,
+        "machine": platform.machine(),
+        "qpa": os.environ.get("QT_QPA_PLATFORM", ""),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def save_results(path, results):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"meta": environment_info(), "results": results}, f, ensure_ascii=False, indent=2)
+
+
+def load_results(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def compare(results, baseline, threshold=0.2, overrides=None, metric="median_ms"):
+    """与基线比较，返回 [(名称, 基线, 当前, 变化比例, 是否回归)]
+
+    threshold 为允许的相对变慢比例（0.2 表示 20%），overrides 可按用例名单独指定。
+    """
+    overrides = overrides or {}
+    rows = []
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        base_value = baseline[name][metric]
+        value = current[metric]
+        change = (value - base_value) / base_value if base_value > 0 else 0.0
+        limit = overrides.get(name, threshold)
+        rows.append((name, base_value, value, change, change > limit))
+    return rows
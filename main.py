@@ -1,7 +1,9 @@
 """Spectra 主程序入口"""
 
+import logging
 import os
 import sys
+import time
 
 # 禁用 FFmpeg 日志输出
 if sys.platform == 'win32':
@@ -13,36 +15,105 @@ os.environ["QT_LOGGING_RULES"] = "qt.multimedia*=false"
 os.environ["QT_MEDIA_BACKEND"] = "ffmpeg"
 os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = "hwaccel;none"
 
+
+def pop_trace_argument(argv):
+    """从 argv 中移除 --trace [输出路径]，返回 (是否启用, 输出路径)"""
+    if "--trace" not in argv:
+        return False, None
+    index = argv.index("--trace")
+    path = None
+    if index + 1 < len(argv) and not argv[index + 1].startswith("-"):
+        path = argv.pop(index + 1)
+    argv.pop(index)
+    return True, path
+
+
+if __name__ == "__main__":
+    # --trace 只作用于本次启动，不转发给已运行的实例
+    _trace_enabled, _trace_path = pop_trace_argument(sys.argv)
+
+    # 已有实例在运行时转发命令行参数后立即退出（在导入 QtWidgets 与主窗口之前完成）
+    _forward_start = time.perf_counter()
+    from single_instance import forward_arguments
+    if forward_arguments(sys.argv[1:]):
+        sys.exit(0)
+    _forward_ms = (time.perf_counter() - _forward_start) * 1000
+
+# 追踪需在导入被追踪模块之前启用
+from utils import tracing
+if __name__ == "__main__" and _trace_enabled:
+    tracing.enable(_trace_path)
+    tracing.instant("forward_arguments", elapsed_ms=round(_forward_ms, 1))
+
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QTimer, Qt
 from splash_screen import SplashScreen
 from window import Window
 
+# 启动画面最短显示时间（毫秒），为 0 时主窗口就绪后立即关闭
+SPLASH_MIN_DISPLAY_MS = 300
+
+logger = logging.getLogger("spectra")
+
 
 if __name__ == "__main__":
+    start_time = time.perf_counter()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s: %(message)s")
+
     # 禁用 Qt 的高 DPI 自动缩放，使屏幕显示的物理像素与配置一致，但需要手动处理控件的 DPI 缩放
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
     os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "0"
     os.environ["QT_SCALE_FACTOR"] = "1"
+    # 样式表只指定字号，字体随 QApplication.setFont 传播到各控件（见 ui.theme.Theme）
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_UseStyleSheetPropagationInWidgetStyles)
+
+    with tracing.trace_span("QApplication"):
+        app = QApplication(sys.argv)
+
+    from single_instance import SingleInstanceServer
+    instance_server = SingleInstanceServer()
+    if not instance_server.listen():
+        logger.warning("single instance server unavailable: %s", instance_server.name)
 
-    app = QApplication(sys.argv)
+    window = None
+
+    def on_instance_arguments(args):
+        logger.info("arguments from another instance: %s", args)
+        # 主窗口仍在构建时无需处理，构建完成后会自行显示
+        if window is not None:
+            window.bring_to_front()
+
+    instance_server.arguments_received.connect(on_instance_arguments)
 
     # 创建并显示启动画面
-    splash = SplashScreen()
-    splash.show()
+    with tracing.trace_span("SplashScreen"):
+        splash = SplashScreen()
+        splash.show()
+        splash.repaint()
 
-    # 创建主窗口但不显示
-    window = Window()
+    def report_progress(percent, phase):
+        splash.set_progress(percent, phase)
+        logger.debug("startup phase %s (%d%%) at %.1f ms", phase, percent,
+                     (time.perf_counter() - start_time) * 1000)
+
+    # 分阶段构建主窗口，进度实时反馈到启动画面
+    window = Window(progress=report_progress)
 
-    # 2秒后关闭启动画面并显示主窗口
     def show_main_window():
         splash.close()
-        window.show()
         window.raise_()
         window.activateWindow()
 
-    QTimer.singleShot(2000, show_main_window)
+    # 首个页面绘制完成即视为可交互，关闭启动画面
+    def on_first_frame():
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        tracing.instant("first_frame_shown", elapsed_ms=round(elapsed_ms, 1))
+        logger.info("time to interactive: %.1f ms", elapsed_ms)
+        QTimer.singleShot(max(0, int(SPLASH_MIN_DISPLAY_MS - elapsed_ms)), show_main_window)
+
+    window.first_frame_shown.connect(on_first_frame)
+    window.show()
 
     sys.exit(app.exec())
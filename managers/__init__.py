@@ -3,5 +3,7 @@
 from .config import ConfigManager
 from .background import BackgroundManager
 from .language import LanguageManager
+from .language_watcher import LanguageWatcher
+from .playback import PlaybackController
 
-__all__ = ['ConfigManager', 'BackgroundManager', 'LanguageManager']
+__all__ = ['ConfigManager', 'BackgroundManager', 'LanguageManager', 'LanguageWatcher', 'PlaybackController']
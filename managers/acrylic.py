@@ -0,0 +1,61 @@
+"""软件亚克力模糊
+
+在没有系统模糊（BlurWindow / DWM）的平台上，为"模糊背景"模式生成模糊背景图。
+先把源图缩小到窗口尺寸的 1/DOWNSCALE 再做模糊，显示时由 QLabel 平滑放大，
+因此每个窗口尺寸只需处理一张很小的图片。有 NumPy 时使用可分离的盒式模糊
+（三次近似高斯），否则退化为多级缩小再放大。
+"""
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage
+
+from .image_decoder import cover_image
+
+DOWNSCALE = 8
+BLUR_RADIUS = 6
+BLUR_PASSES = 3
+
+
+def acrylic_image(source, width, height, downscale=DOWNSCALE, radius=BLUR_RADIUS):
+    """返回覆盖 width x height 的模糊图，尺寸为窗口的 1/downscale"""
+    small_w, small_h = max(1, width // downscale), max(1, height // downscale)
+    small = cover_image(source, small_w, small_h).convertToFormat(QImage.Format.Format_RGB32)
+    if small.isNull():
+        return small
+    try:
+        import numpy
+    except ImportError:
+        return _blur_by_scaling(small)
+    return _box_blur(numpy, small, radius)
+
+
+def _box_blur(np, image, radius, passes=BLUR_PASSES):
+    w, h = image.width(), image.height()
+    ptr = image.constBits()
+    ptr.setsize(image.sizeInBytes())
+    pixels = np.frombuffer(ptr, np.uint8).reshape(h, image.bytesPerLine())[:, :w * 4]
+    data = pixels.reshape(h, w, 4).astype(np.float32)
+
+    size = 2 * radius + 1
+    for _ in range(passes):
+        for axis in (0, 1):
+            # 用前缀和实现滑动窗口求和，边缘按最近像素延伸
+            pad = [(0, 0)] * 3
+            pad[axis] = (radius + 1, radius)
+            padded = np.pad(data, pad, mode="edge")
+            summed = np.cumsum(padded, axis=axis)
+            if axis == 0:
+                data = (summed[size:] - summed[:-size]) / size
+            else:
+                data = (summed[:, size:] - summed[:, :-size]) / size
+
+    result = np.ascontiguousarray(np.clip(data + 0.5, 0, 255).astype(np.uint8))
+    return QImage(result.data, w, h, w * 4, QImage.Format.Format_RGB32).copy()
+
+
+def _blur_by_scaling(image):
+    """无 NumPy 时的退化方案：继续缩小到极小尺寸再平滑放大回来"""
+    w, h = image.width(), image.height()
+    tiny = image.scaled(max(1, w // 4), max(1, h // 4), Qt.AspectRatioMode.IgnoreAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation)
+    return tiny.scaled(w, h, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation)
@@ -0,0 +1,228 @@
+"""动画图片背景（GIF / WebP 等）"""
+
+import threading
+
+from PyQt6.QtCore import QThread, QTimer, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader, QPixmap
+
+from .image_decoder import DEFAULT_MEMORY_LIMIT_MB, cover_image
+
+# 帧间隔下限，避免延迟为 0 的 GIF 占满 CPU
+MIN_FRAME_DELAY_MS = 20
+# 整轮帧放不进内存上限时，帧最多缩小到窗口尺寸的这一比例（显示时由背景标签放大）
+MIN_FRAME_SCALE = 0.5
+
+
+def is_animated(path):
+    """图片是否包含多帧动画（是否支持取决于已安装的 Qt 图片插件）"""
+    reader = QImageReader(path)
+    return reader.supportsAnimation() and reader.imageCount() != 1
+
+
+class AnimationDecodeThread(QThread):
+    """按顺序解码动画帧并缩放到窗口尺寸
+
+    帧数不超过 capacity 时只解码一轮，之后全部由缓存播放；否则最多领先
+    已显示的帧 capacity 帧，循环播放时从头重新读取。
+    """
+
+    frame_ready = pyqtSignal(int, int, QImage, int)
+    failed = pyqtSignal(int)
+
+    def __init__(self, generation, path, width, height, capacity, cache_all, memory_limit_mb):
+        super().__init__()
+        self.generation = generation
+        self.path = path
+        self.width = width
+        self.height = height
+        self.capacity = capacity
+        self.cache_all = cache_all
+        self.memory_limit_mb = memory_limit_mb
+        self._cond = threading.Condition()
+        self._consumed = 0
+        self._running = True
+
+    def consumed(self, sequence):
+        """GUI 已显示到第 sequence 帧，允许继续向前解码"""
+        with self._cond:
+            self._consumed = sequence
+            self._cond.notify()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self.wait()
+
+    def _open(self):
+        reader = QImageReader(self.path)
+        reader.setAllocationLimit(self.memory_limit_mb)
+        return reader
+
+    def run(self):
+        reader = self._open()
+        sequence = 0
+        while True:
+            with self._cond:
+                while self._running and sequence - self._consumed >= self.capacity:
+                    self._cond.wait()
+                if not self._running:
+                    return
+
+            image = reader.read()
+            if image.isNull():
+                if sequence == 0:
+                    self.failed.emit(self.generation)
+                    return
+                if self.cache_all:
+                    return
+                # 一轮结束，重新打开继续循环
+                reader = self._open()
+                continue
+
+            delay = reader.nextImageDelay()
+            frame = cover_image(image, self.width, self.height)
+            self.frame_ready.emit(self.generation, sequence, frame, delay)
+            sequence += 1
+
+
+class AnimatedBackground:
+    """在背景标签上播放动画图片
+
+    帧在工作线程中按需解码并只缩放一次，缓存受内存上限约束：帧尺寸不超过动画原始分辨率，
+    整轮放不下时先缩小帧（不低于 MIN_FRAME_SCALE），能完整放下时整个动画只解码一次，
+    否则使用环形缓存（每轮重新解码）。播放由单个定时器驱动，窗口不可见时暂停。
+    """
+
+    def __init__(self, label_getter, memory_limit_mb=DEFAULT_MEMORY_LIMIT_MB):
+        self._label_getter = label_getter
+        self.memory_limit_mb = memory_limit_mb
+        self.path = None
+        self.size = None
+        self.frame_size = None
+        self._source_size = None
+        self._generation = 0
+        self._decoder = None
+        self._frames = {}
+        self._frame_count = 0
+        self._cache_all = False
+        self._sequence = 0
+        self._waiting = False
+        self._running = True
+
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._show_next)
+
+    def start(self, path, width, height):
+        self.stop()
+        self.path = path
+        reader = QImageReader(path)
+        self._frame_count = reader.imageCount()
+        size = reader.size()
+        self._source_size = (size.width(), size.height()) if size.isValid() else None
+        self._begin(width, height)
+
+    def resize(self, width, height):
+        """窗口尺寸变化后按新尺寸重新解码（期间标签拉伸显示当前帧）"""
+        if self.path is None or self.size == (width, height):
+            return
+        self._stop_decoder()
+        self._begin(width, height)
+
+    def stop(self):
+        self._timer.stop()
+        self._stop_decoder()
+        self.path = None
+        self.size = None
+
+    def set_running(self, running):
+        if running == self._running:
+            return
+        self._running = running
+        if not running:
+            self._timer.stop()
+        elif self.path is not None:
+            self._show_next()
+
+    def _begin(self, width, height):
+        self.size = (width, height)
+        self._frames = {}
+        self._sequence = 0
+        self._waiting = True
+
+        frame_w, frame_h, self._cache_all = self._plan_frames(width, height)
+        self.frame_size = (frame_w, frame_h)
+        if self._cache_all:
+            capacity = self._frame_count
+        else:
+            capacity = max(2, self.memory_limit_mb * 1024 * 1024 // (frame_w * frame_h * 4))
+
+        self._generation += 1
+        self._decoder = AnimationDecodeThread(self._generation, self.path, frame_w, frame_h,
+                                              capacity, self._cache_all, self.memory_limit_mb)
+        self._decoder.frame_ready.connect(self._on_frame_ready)
+        self._decoder.failed.connect(self._on_failed)
+        self._decoder.start()
+
+    def _plan_frames(self, width, height):
+        """返回缓存帧的 (宽, 高, 是否整轮缓存)"""
+        # 不超过原始分辨率：放大由背景标签完成，缓存更小的帧
+        scale = 1.0
+        if self._source_size and min(self._source_size) > 0:
+            cover = max(width / self._source_size[0], height / self._source_size[1])
+            scale = min(1.0, 1.0 / cover)
+
+        cache_all = False
+        if self._frame_count > 0:
+            # 整轮帧恰好放入内存上限的缩放比例；缩小幅度不超过 MIN_FRAME_SCALE 时整轮缓存
+            budget = self.memory_limit_mb * 1024 * 1024
+            fit = (budget / (self._frame_count * width * height * 4)) ** 0.5
+            if fit >= min(scale, MIN_FRAME_SCALE):
+                scale = min(scale, fit)
+                cache_all = True
+        return max(1, int(width * scale)), max(1, int(height * scale)), cache_all
+
+    def _stop_decoder(self):
+        self._timer.stop()
+        if self._decoder is not None:
+            self._generation += 1
+            self._decoder.stop()
+            self._decoder = None
+        self._frames = {}
+
+    def _key(self, sequence):
+        return sequence % self._frame_count if self._cache_all else sequence
+
+    def _on_frame_ready(self, generation, sequence, image, delay):
+        if generation != self._generation:
+            return
+        self._frames[self._key(sequence)] = (QPixmap.fromImage(image), delay)
+        if self._waiting and self._key(sequence) == self._key(self._sequence):
+            self._show_next()
+
+    def _on_failed(self, generation):
+        if generation == self._generation:
+            self._stop_decoder()
+
+    def _show_next(self):
+        if not self._running or self._decoder is None:
+            return
+        frame = self._frames.get(self._key(self._sequence))
+        if frame is None:
+            # 下一帧尚未解码完成，到达后立即显示
+            self._waiting = True
+            return
+        self._waiting = False
+        pixmap, delay = frame
+
+        label = self._label_getter()
+        label.setPixmap(pixmap)
+        label.show()
+
+        if not self._cache_all:
+            # 环形缓存：已显示过的帧不再保留
+            self._frames.pop(self._sequence - 1, None)
+        self._sequence += 1
+        self._decoder.consumed(self._sequence)
+        self._timer.start(max(MIN_FRAME_DELAY_MS, delay))
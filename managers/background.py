@@ -1,22 +1,113 @@
 """背景管理器"""
 
+import logging
 import os
-from PyQt6.QtCore import Qt, QUrl, QSizeF
+import time
+from collections import OrderedDict
+
+from PyQt6.QtCore import Qt, QUrl, QSizeF, QTimer
 from PyQt6.QtGui import QPixmap
-from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
-from PyQt6.QtWidgets import QLabel, QGraphicsView, QGraphicsScene
-from PyQt6.QtMultimediaWidgets import QGraphicsVideoItem
+from PyQt6.QtWidgets import QLabel, QApplication
+
+from utils.tracing import traced
+from .image_decoder import ImageDecodeThread, DEFAULT_MEMORY_LIMIT_MB, cover_image
+from .acrylic import acrylic_image, DOWNSCALE as ACRYLIC_DOWNSCALE
+from .slideshow import BackgroundSlideshow, DEFAULT_ROTATION_INTERVAL
+from .animation import AnimatedBackground, is_animated
+
+
+VIDEO_EXTENSIONS = ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm']
+
+# 元数据和首帧都未提供尺寸前使用的视频尺寸
+DEFAULT_VIDEO_SIZE = (1920, 1080)
+# 调整窗口大小停止后多久进行一次高质量重绘
+SMOOTH_RENDER_DELAY_MS = 150
+# 缓存最近几个窗口尺寸的渲染结果（如最大化/还原切换）
+RENDER_CACHE_SIZE = 4
+# 软件亚克力模糊结果缓存的窗口尺寸数（模糊图很小）
+ACRYLIC_CACHE_SIZE = 8
+
+logger = logging.getLogger("spectra")
 
 
 class BackgroundManager:
-    def __init__(self, parent_widget):
+    def __init__(self, parent_widget, memory_limit_mb=DEFAULT_MEMORY_LIMIT_MB, video_max_fps=0,
+                 rotation_interval=DEFAULT_ROTATION_INTERVAL, on_image_error=None):
         self.parent = parent_widget
+        # 用户选择的背景图片无法显示时调用 on_image_error(path, error)
+        self.on_image_error = on_image_error
+        # 视频帧率上限，大于 0 时使用 QVideoSink 低功耗渲染
+        self.video_max_fps = video_max_fps
+        # 源图与渲染缓存共用的内存上限
+        self.memory_limit_mb = memory_limit_mb
         self.current_bg_path = None
         self.current_video_path = None
         self.bg_label_widget = None
         self.solid_bg_widget = None
 
-        # 初始化视频组件
+        # 图片解码线程在首次设置图片背景时创建
+        self._decoder = None
+        self._request_id = 0
+        self._pending_request = None
+
+        # 缩小到接近屏幕分辨率的源图，以及最近几个窗口尺寸的渲染结果
+        self._source = None
+        self._source_key = None
+        self._pending_source_key = None
+        self._rendered = OrderedDict()
+        self._settle_timer = QTimer()
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(SMOOTH_RENDER_DELAY_MS)
+        self._settle_timer.timeout.connect(self._render_smooth)
+
+        # 软件亚克力模糊：缩小后的源图与按窗口尺寸缓存的模糊结果
+        self._acrylic_active = False
+        self._acrylic_key = None
+        self._acrylic_source = None
+        self._acrylic_request = None
+        self._acrylic_cache = OrderedDict()
+        self._acrylic_timer = QTimer()
+        self._acrylic_timer.setSingleShot(True)
+        self._acrylic_timer.setInterval(SMOOTH_RENDER_DELAY_MS)
+        self._acrylic_timer.timeout.connect(self._show_acrylic)
+
+        # background_image_path 为文件夹时按 rotation_interval（秒）轮播
+        self._slideshow = BackgroundSlideshow(self, rotation_interval)
+
+        # 动画图片（GIF / WebP 等）
+        self._animation = AnimatedBackground(lambda: self.bg_label_widget, memory_limit_mb)
+        self._animation_resize_timer = QTimer()
+        self._animation_resize_timer.setSingleShot(True)
+        self._animation_resize_timer.setInterval(SMOOTH_RENDER_DELAY_MS)
+        self._animation_resize_timer.timeout.connect(self._resize_animation)
+
+        # 视频组件（QtMultimedia）在首次使用视频背景时才加载和创建
+        self.video_scene = None
+        self.video_view = None
+        self.video_item = None
+        self.player = None
+        self.audio_output = None
+        self.video_sink = None
+        self._last_frame_time = 0.0
+        # 由 PlaybackController 根据窗口可见性控制
+        self._playback_allowed = True
+        # 视频实际尺寸按 (路径, 修改时间) 缓存，来自元数据或首帧
+        self._video_sizes = {}
+        self._video_key = None
+        self._video_geometry = None
+        # 图片是否为动画按 (路径, 修改时间) 缓存，调整窗口大小时无需重新打开文件
+        self._animated = {}
+
+    @traced()
+    def _ensure_video(self):
+        """按需导入 QtMultimedia 并创建视频播放组件"""
+        if self.player is not None:
+            return
+        from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
+        from PyQt6.QtMultimediaWidgets import QGraphicsVideoItem
+        from PyQt6.QtWidgets import QGraphicsView, QGraphicsScene
+
+        parent_widget = self.parent
         self.video_scene = QGraphicsScene()
         self.video_view = QGraphicsView(self.video_scene, parent_widget)
         self.video_view.setStyleSheet("border:none;background:black;")
@@ -35,75 +126,380 @@ class BackgroundManager:
         self.player.setAudioOutput(self.audio_output)
         self.player.setLoops(QMediaPlayer.Loops.Infinite)
 
+        self.player.metaDataChanged.connect(self._on_video_metadata)
+        self.video_item.nativeSizeChanged.connect(self._on_video_native_size)
+
+    def _uses_video_sink(self):
+        return self.video_max_fps > 0
+
+    def _apply_video_output(self):
+        """按帧率上限选择视频输出：QGraphicsVideoItem 或 QVideoSink"""
+        if self._uses_video_sink():
+            if self.video_sink is None:
+                from PyQt6.QtMultimedia import QVideoSink
+                self.video_sink = QVideoSink()
+                self.video_sink.videoFrameChanged.connect(self._on_video_frame)
+            if self.player.videoSink() is not self.video_sink:
+                self.player.setVideoSink(self.video_sink)
+        elif self.player.videoOutput() is not self.video_item:
+            self.player.setVideoOutput(self.video_item)
+
+    def _on_video_frame(self, frame):
+        """QVideoSink 模式：按帧率上限丢帧，保留的帧缩小到窗口尺寸后显示"""
+        if not frame.isValid() or self.bg_label_widget is None or not self.bg_label_widget.isVisible():
+            return
+        now = time.monotonic()
+        if now - self._last_frame_time < 1.0 / self.video_max_fps:
+            return
+        self._last_frame_time = now
+
+        size = frame.size()
+        self._remember_video_size(size.width(), size.height())
+        # 先丢帧再转换，被丢弃的帧不做颜色转换和缩放
+        image = frame.toImage()
+        if image.isNull():
+            return
+        w, h = self.parent.width(), self.parent.height()
+        scaled = cover_image(image, w, h, Qt.TransformationMode.FastTransformation)
+        self.bg_label_widget.setPixmap(QPixmap.fromImage(scaled))
+
+    def set_video_max_fps(self, fps):
+        """修改视频帧率上限，0 表示不限制（使用 QGraphicsVideoItem）"""
+        if fps == self.video_max_fps:
+            return
+        self.video_max_fps = fps
+        if self.current_video_path:
+            self.set_background_image(self.current_video_path)
+
+    def _on_video_metadata(self):
+        from PyQt6.QtMultimedia import QMediaMetaData
+        size = self.player.metaData().value(QMediaMetaData.Key.Resolution)
+        # 元数据只作为首帧到达前的预估，不覆盖已从视频帧得到的尺寸
+        if size and size.isValid() and self._video_key not in self._video_sizes:
+            self._remember_video_size(size.width(), size.height())
+
+    def _on_video_native_size(self, size):
+        if not size.isEmpty():
+            self._remember_video_size(round(size.width()), round(size.height()))
+
+    def _remember_video_size(self, width, height):
+        if self._video_key is None or self._video_sizes.get(self._video_key) == (width, height):
+            return
+        self._video_sizes[self._video_key] = (width, height)
+        if self.video_view is not None and self.video_view.isVisible():
+            self._update_video_geometry()
+
+    def _update_video_geometry(self):
+        """按视频实际尺寸计算覆盖窗口的区域，区域不变时不更新场景"""
+        w, h = self.parent.width(), self.parent.height()
+        video_w, video_h = self._video_sizes.get(self._video_key, DEFAULT_VIDEO_SIZE)
+        scale = max(w / video_w, h / video_h)
+        scaled_w, scaled_h = round(video_w * scale), round(video_h * scale)
+
+        geometry = (w, h, scaled_w, scaled_h)
+        if geometry == self._video_geometry:
+            return
+        self._video_geometry = geometry
+
+        self.video_view.setGeometry(0, 0, w, h)
+        self.video_scene.setSceneRect(0, 0, w, h)
+        self.video_item.setSize(QSizeF(scaled_w, scaled_h))
+        self.video_item.setPos((w - scaled_w) / 2, (h - scaled_h) / 2)
+
+    def _stop_video(self):
+        """停止视频播放并清除当前视频，之后恢复播放（如窗口还原）不会再启动它"""
+        self.current_video_path = None
+        if self.player is None:
+            return
+        self.player.stop()
+        self.video_view.hide()
+
+    def set_video_playback_allowed(self, allowed):
+        """暂停或恢复背景视频；暂停保留当前帧，恢复时不会黑屏"""
+        if allowed == self._playback_allowed:
+            return
+        self._playback_allowed = allowed
+        if self.player is None or not self.current_video_path:
+            return
+        if allowed:
+            self.player.play()
+        else:
+            self.player.pause()
+
+    @traced()
     def set_background_image(self, path):
         if not os.path.exists(path):
             return
+        self._acrylic_active = False
+        if self._acrylic_request is not None:
+            self._cancel_image_requests()
 
         ext = os.path.splitext(path)[1].lower()
 
         # 视频格式
-        if ext in ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm']:
-            if self.bg_label_widget:
-                self.bg_label_widget.hide()
-
-            w, h = self.parent.width(), self.parent.height()
+        if ext in VIDEO_EXTENSIONS:
+            from PyQt6.QtMultimedia import QMediaPlayer
+            self._slideshow.stop()
+            self._animation.stop()
+            self._cancel_image_requests()
+            self.clear_cache()
+            self._ensure_video()
+            self._apply_video_output()
 
             # 只在首次加载或路径改变时重新加载视频
             if self.current_video_path != path:
+                self._video_key = (path, os.path.getmtime(path))
                 self.player.setSource(QUrl.fromLocalFile(path))
                 self.current_video_path = path
 
-            # 确保视频在播放状态（修复切换背景后黑屏问题）
-            if self.player.playbackState() != QMediaPlayer.PlaybackState.PlayingState:
+            # 确保视频在播放状态（修复切换背景后黑屏问题）；窗口不可见时保持暂停
+            if self._playback_allowed and self.player.playbackState() != QMediaPlayer.PlaybackState.PlayingState:
                 self.player.play()
 
-            # 使用固定 16:9 比例计算
-            video_w, video_h = 1920, 1080
-            scale = max(w / video_w, h / video_h)
-            scaled_w, scaled_h = video_w * scale, video_h * scale
+            if self._uses_video_sink():
+                # 帧缩小到窗口尺寸后画在背景标签上
+                self.video_view.hide()
+                self._ensure_label()
+                self.bg_label_widget.setGeometry(0, 0, self.parent.width(), self.parent.height())
+                self.bg_label_widget.show()
+            else:
+                if self.bg_label_widget:
+                    self.bg_label_widget.hide()
+                self._update_video_geometry()
+                self.video_view.lower()
+                self.video_view.show()
 
-            self.video_view.setGeometry(0, 0, w, h)
-            self.video_scene.setSceneRect(0, 0, w, h)
-            self.video_item.setSize(QSizeF(scaled_w, scaled_h))
-            self.video_item.setPos((w - scaled_w) / 2, (h - scaled_h) / 2)
-            self.video_view.lower()
-            self.video_view.show()
+            self.current_bg_path = path
 
+        elif os.path.isdir(path):
+            self._stop_video()
+            self._animation.stop()
+            # 文件夹：轮播其中的图片，调整窗口大小时只重新显示当前图片
+            if self._slideshow.folder != path:
+                current = self._slideshow.start(path)
+            else:
+                current = self._slideshow.current_path()
+            if current:
+                self._show_image(current)
             self.current_bg_path = path
 
         else:
-            self.player.stop()
-            self.video_view.hide()
-            self.current_video_path = None
+            self._slideshow.stop()
+            self._stop_video()
+            if path == self._animation.path or self._is_animated(path):
+                self._show_animation(path)
+            else:
+                self._animation.stop()
+                self._show_image(path)
+            self.current_bg_path = path
 
-            if not self.bg_label_widget:
-                self.bg_label_widget = QLabel(self.parent)
-                self.bg_label_widget.lower()
+    def _is_animated(self, path):
+        try:
+            key = (path, os.path.getmtime(path))
+        except OSError:
+            return False
+        animated = self._animated.get(key)
+        if animated is None:
+            animated = self._animated[key] = is_animated(path)
+        return animated
 
-            pixmap = QPixmap(path)
-            w, h = self.parent.width(), self.parent.height()
+    def _show_animation(self, path):
+        """动画图片：帧由 AnimatedBackground 解码、缩放并缓存"""
+        self._cancel_image_requests()
+        self.clear_cache()
+        self._ensure_label()
+        w, h = self.parent.width(), self.parent.height()
+        self.bg_label_widget.setGeometry(0, 0, w, h)
+        if self._animation.path != path:
+            self._animation.start(path, w, h)
+        else:
+            # 调整窗口大小期间拉伸当前帧，停止后再按新尺寸重新解码
+            self._animation_resize_timer.start()
+
+    def _resize_animation(self):
+        self._animation.resize(self.parent.width(), self.parent.height())
 
-            img_w, img_h = pixmap.width(), pixmap.height()
-            scale = max(w / img_w, h / img_h)
-            scaled_w, scaled_h = int(img_w * scale), int(img_h * scale)
+    def _show_image(self, path):
+        self._ensure_label()
+        w, h = self.parent.width(), self.parent.height()
+        self.bg_label_widget.setGeometry(0, 0, w, h)
 
-            scaled_pixmap = pixmap.scaled(scaled_w, scaled_h, Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                                          Qt.TransformationMode.SmoothTransformation)
+        source_key = (path, os.path.getmtime(path))
+        if self._source is not None and self._source_key == source_key:
+            self._show_from_source(w, h)
+            return
 
-            x = (scaled_w - w) // 2
-            y = (scaled_h - h) // 2
-            cropped = scaled_pixmap.copy(x, y, w, h)
+        # 解码与缩放在工作线程完成，上一帧保留显示直到新图片就绪
+        self._settle_timer.stop()
+        self._request_id += 1
+        self._pending_request = self._request_id
+        self._pending_source_key = source_key
+        self._ensure_decoder().request(self._request_id, path, w, h,
+                                       source_size=self.screen_size())
+
+    def show_slideshow_image(self, path, prefetched=None):
+        """显示轮播的下一张图片；已预取时直接使用预取的源图和缩放结果"""
+        if not os.path.exists(path):
+            return
+        if prefetched is not None and prefetched.source is not None:
+            # 预取结果成为当前图片的缓存，旧图片的缓存随之释放
+            self._source = prefetched.source
+            self._source_key = prefetched.key
+            self._rendered.clear()
+            if prefetched.image is not None:
+                size = (prefetched.image.width(), prefetched.image.height())
+                self._rendered[size] = QPixmap.fromImage(prefetched.image)
+        self._show_image(path)
 
-            self.bg_label_widget.setPixmap(cropped)
-            self.bg_label_widget.setGeometry(0, 0, w, h)
+    def set_background_visible(self, visible):
+        """窗口不可见时暂停文件夹轮播和动画图片"""
+        self._slideshow.set_running(visible)
+        self._animation.set_running(visible)
+
+    def screen_size(self):
+        """窗口可能出现的最大屏幕尺寸，作为源图缓存的目标尺寸"""
+        app = QApplication.instance()
+        screens = app.screens() if app else []
+        if not screens:
+            return None
+        return (max(s.size().width() for s in screens),
+                max(s.size().height() for s in screens))
+
+    def _show_from_source(self, w, h):
+        """从内存中的源图显示背景：命中尺寸缓存直接使用，否则先快速缩放，停止调整后再平滑重绘"""
+        # 丢弃针对旧尺寸的平滑缩放结果
+        self._cancel_image_requests()
+        cached = self._rendered.get((w, h))
+        if cached is not None:
+            self._rendered.move_to_end((w, h))
+            self._settle_timer.stop()
+            self.bg_label_widget.setPixmap(cached)
             self.bg_label_widget.show()
-            self.current_bg_path = path
+            return
+
+        fast = cover_image(self._source, w, h, Qt.TransformationMode.FastTransformation)
+        self.bg_label_widget.setPixmap(QPixmap.fromImage(fast))
+        self.bg_label_widget.show()
+        self._settle_timer.start()
+
+    def _render_smooth(self):
+        """窗口尺寸稳定后，在工作线程中从源图做一次高质量缩放"""
+        self._slideshow.refresh_prefetch()
+        if self._source is None or not self.bg_label_widget or not self.bg_label_widget.isVisible():
+            return
+        w, h = self.parent.width(), self.parent.height()
+        if (w, h) in self._rendered:
+            return
+        self._request_id += 1
+        self._pending_request = self._request_id
+        self._ensure_decoder().request(self._request_id, self._source_key[0], w, h, source=self._source)
+
+    def _trim_render_cache(self):
+        """按数量和内存上限淘汰最久未用的渲染结果，至少保留当前一张"""
+        limit = self.memory_limit_mb * 1024 * 1024
+        used = self._source.sizeInBytes() if self._source is not None else 0
+        used += sum(p.width() * p.height() * 4 for p in self._rendered.values())
+        while len(self._rendered) > 1 and (len(self._rendered) > RENDER_CACHE_SIZE or used > limit):
+            _, pixmap = self._rendered.popitem(last=False)
+            used -= pixmap.width() * pixmap.height() * 4
+
+    def clear_cache(self):
+        """释放源图与尺寸缓存（切换到非图片背景时调用）"""
+        self._settle_timer.stop()
+        self._source = None
+        self._source_key = None
+        self._rendered.clear()
+
+    def _ensure_label(self):
+        if not self.bg_label_widget:
+            self.bg_label_widget = QLabel(self.parent)
+            # 新图片就绪前，拉伸显示上一帧以覆盖整个窗口
+            self.bg_label_widget.setScaledContents(True)
+            self.bg_label_widget.lower()
+
+    def _ensure_decoder(self):
+        """按需创建并启动解码线程"""
+        if self._decoder is None:
+            self._decoder = ImageDecodeThread(self.memory_limit_mb)
+            self._decoder.source_ready.connect(self._on_source_ready)
+            self._decoder.decoded.connect(self._on_image_decoded)
+            self._decoder.failed.connect(self._on_image_failed)
+            self._decoder.start()
+            app = QApplication.instance()
+            if app:
+                app.aboutToQuit.connect(self.shutdown)
+        return self._decoder
+
+    def _cancel_image_requests(self):
+        """使所有未完成的图片请求失效，避免切换背景后旧结果再次显示"""
+        self._request_id += 1
+        self._pending_request = None
+        if self._acrylic_request is not None:
+            # 亚克力源图未解码完成，下次需要重新请求
+            self._acrylic_request = None
+            self._acrylic_key = None
+        if self._decoder is not None:
+            self._decoder.cancel(self._request_id)
+
+    def _on_source_ready(self, request_id, path, image):
+        if request_id != self._request_id:
+            return
+        if request_id == self._acrylic_request:
+            self._acrylic_source = image
+            return
+        self._source = image
+        self._source_key = self._pending_source_key
+        self._rendered.clear()
+
+    def _on_image_decoded(self, request_id, path, image):
+        if request_id != self._request_id:
+            return
+        self._pending_request = None
+        if request_id == self._acrylic_request:
+            self._acrylic_request = None
+            self._show_acrylic()
+            return
+        pixmap = QPixmap.fromImage(image)
+        self._rendered[(image.width(), image.height())] = pixmap
+        self._trim_render_cache()
+        self.bg_label_widget.setPixmap(pixmap)
+        self.bg_label_widget.setGeometry(0, 0, self.parent.width(), self.parent.height())
+        self.bg_label_widget.show()
+
+    def _on_image_failed(self, request_id, path, error):
+        if request_id != self._request_id:
+            return
+        selected = path == self.current_bg_path or request_id == self._acrylic_request
+        self._pending_request = None
+        self._acrylic_request = None
+        logger.warning("failed to decode background image %s: %s", path, error)
+        # 轮播中的单张图片只记录日志，继续显示上一张
+        if selected and self.on_image_error:
+            self.on_image_error(path, error)
+
+    def is_busy(self):
+        """是否有尚未完成的背景图片请求"""
+        return self._pending_request is not None
+
+    def shutdown(self):
+        """停止工作线程，窗口关闭或程序退出时调用"""
+        self._slideshow.shutdown()
+        self._animation.stop()
+        self._settle_timer.stop()
+        self._cancel_image_requests()
+        if self._decoder is not None:
+            self._decoder.stop()
+            self._decoder = None
 
     def set_solid_color(self, color):
+        self._acrylic_active = False
+        self._slideshow.stop()
+        self._animation.stop()
+        self._cancel_image_requests()
+        self.clear_cache()
         if self.bg_label_widget:
             self.bg_label_widget.hide()
-        self.player.stop()
-        self.video_view.hide()
+        self._stop_video()
 
         if not self.solid_bg_widget:
             self.solid_bg_widget = QLabel(self.parent)
@@ -114,10 +510,71 @@ class BackgroundManager:
         self.solid_bg_widget.setGeometry(0, 0, w, h)
         self.solid_bg_widget.show()
 
+    def set_acrylic(self, path):
+        """软件亚克力背景：模糊图片 path，结果按窗口尺寸缓存
+
+        用于没有系统模糊的平台；透明度着色仍由窗口面板的半透明背景提供。
+        """
+        self._stop_video()
+        self._slideshow.stop()
+        self._animation.stop()
+        if self.solid_bg_widget:
+            self.solid_bg_widget.hide()
+        self._acrylic_active = True
+
+        key = (path, os.path.getmtime(path))
+        if key != self._acrylic_key:
+            self._acrylic_key = key
+            self._acrylic_source = None
+            self._acrylic_cache.clear()
+            # 源图只需窗口的 1/DOWNSCALE 大小，在工作线程中按此尺寸解码
+            w, h = self.parent.width(), self.parent.height()
+            screen = self.screen_size() or (w, h)
+            small = (max(1, screen[0] // ACRYLIC_DOWNSCALE), max(1, screen[1] // ACRYLIC_DOWNSCALE))
+            self._request_id += 1
+            self._pending_request = self._acrylic_request = self._request_id
+            self._ensure_decoder().request(self._request_id, path, *small, source_size=small)
+            return
+
+        self._ensure_label()
+        if self._acrylic_request is not None:
+            # 源图仍在解码，完成后自动显示
+            return
+        self._cancel_image_requests()
+        self.bg_label_widget.setGeometry(0, 0, self.parent.width(), self.parent.height())
+        if not self.bg_label_widget.isVisible() or (self.parent.width(), self.parent.height()) in self._acrylic_cache:
+            self._show_acrylic()
+        else:
+            # 调整窗口大小期间拉伸上一张模糊图，停止后再重新计算
+            self._acrylic_timer.start()
+
+    def _show_acrylic(self):
+        if not self._acrylic_active or self._acrylic_source is None:
+            return
+        w, h = self.parent.width(), self.parent.height()
+        pixmap = self._acrylic_cache.get((w, h))
+        if pixmap is None:
+            pixmap = QPixmap.fromImage(acrylic_image(self._acrylic_source, w, h, ACRYLIC_DOWNSCALE))
+            self._acrylic_cache[(w, h)] = pixmap
+            while len(self._acrylic_cache) > ACRYLIC_CACHE_SIZE:
+                self._acrylic_cache.popitem(last=False)
+        else:
+            self._acrylic_cache.move_to_end((w, h))
+        self._ensure_label()
+        # 模糊图为窗口的 1/DOWNSCALE，由 QLabel 平滑放大显示
+        self.bg_label_widget.setPixmap(pixmap)
+        self.bg_label_widget.setGeometry(0, 0, w, h)
+        self.bg_label_widget.show()
+
     def hide(self):
+        self._acrylic_active = False
+        self._slideshow.stop()
+        self._animation.stop()
+        self._acrylic_timer.stop()
+        self._cancel_image_requests()
+        self._settle_timer.stop()
         if self.bg_label_widget:
             self.bg_label_widget.hide()
         if self.solid_bg_widget:
             self.solid_bg_widget.hide()
-        self.player.stop()
-        self.video_view.hide()
+        self._stop_video()
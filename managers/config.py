@@ -1,13 +1,46 @@
 """配置管理器"""
 
+import atexit
 import json
 import os
+import weakref
+
+from PyQt6.QtCore import QCoreApplication, QTimer
+
+
+# 未指明具体键的修改
+ALL_KEYS = "*"
+# 退出时补写修改的管理器（不延长其生命周期）
+_instances = weakref.WeakSet()
+
+
+@atexit.register
+def _write_all_at_exit():
+    for manager in list(_instances):
+        manager._write_at_exit()
 
 
 class ConfigManager:
+    """配置存储
+
+    控件通过 subscribe() 订阅自己依赖的配置项，set() 修改后只通知对应的订阅者；
+    同一轮事件循环内的多次修改合并为一次通知，回调收到的是最新值。
+    """
+
+    # 最后一次修改后等待多久写入磁盘
+    FLUSH_DELAY_MS = 500
+
     def __init__(self, config_file="config.json"):
-        self.config_file = config_file
+        # 退出时才写入的修改不应受之后工作目录变化的影响
+        self.config_file = os.path.abspath(config_file)
         self.config = self.load_config()
+        self._dirty = set()
+        self._flush_timer = None
+        self._subscribers = {}
+        self._changed = {}
+        self._dispatch_pending = False
+        # 退出时写入尚未保存的修改
+        _instances.add(self)
 
     def load_config(self):
         try:
@@ -20,6 +53,9 @@ class ConfigManager:
                     "window_width": config.get("window_width", 900),
                     "window_height": config.get("window_height", 600),
                     "blur_opacity": config.get("blur_opacity", 80),
+                    "background_memory_limit_mb": config.get("background_memory_limit_mb", 256),
+                    "video_max_fps": config.get("video_max_fps", 0),
+                    "background_rotation_interval": config.get("background_rotation_interval", 300),
                     "font_mode": config.get("font_mode", 0),
                     "custom_font_family": config.get("custom_font_family", "Microsoft YaHei UI"),
                     "custom_font_path": config.get("custom_font_path", ""),
@@ -33,14 +69,43 @@ class ConfigManager:
                 "window_width": 900,
                 "window_height": 600,
                 "blur_opacity": 80,
+                "background_memory_limit_mb": 256,
+                "video_max_fps": 0,
+                "background_rotation_interval": 300,
                 "font_mode": 0,
                 "custom_font_family": "Microsoft YaHei UI",
                 "custom_font_path": "",
                 "language": "zh_CN"
             }
 
-    def save_config(self):
-        """保存配置，保留所有现有配置"""
+    def save_config(self, key=None):
+        """标记配置已修改，安静期结束后统一写入磁盘
+
+        内存中的 self.config 始终是权威数据，连续修改（如拖动滑块）期间不产生磁盘读写。
+        没有 Qt 事件循环时立即写入。
+        """
+        self._dirty.add(key if key is not None else ALL_KEYS)
+        if QCoreApplication.instance() is None:
+            self.flush()
+            return
+        if self._flush_timer is None:
+            self._flush_timer = QTimer()
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.setInterval(self.FLUSH_DELAY_MS)
+            self._flush_timer.timeout.connect(self.flush)
+        self._flush_timer.start()
+
+    def flush(self):
+        """立即写入尚未保存的修改"""
+        if self._flush_timer is not None and self._flush_timer.isActive():
+            self._flush_timer.stop()
+        self._write_dirty()
+
+    def _write_dirty(self):
+        """将修改写入磁盘（保留文件中的其他字段），通过临时文件 + 重命名原子替换"""
+        if not self._dirty:
+            return
+        dirty = self._dirty
         try:
             # 读取现有配置
             existing_config = {}
@@ -51,19 +116,67 @@ class ConfigManager:
             # 合并配置：self.config优先，但保留existing_config中的其他字段
             if existing_config is None:
                 existing_config = {}
-            existing_config.update(self.config)
-
-            # 保存合并后的配置
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(existing_config, f, ensure_ascii=False, indent=2)
+            if ALL_KEYS in dirty:
+                existing_config.update(self.config)
+            else:
+                existing_config.update({key: self.config[key] for key in dirty if key in self.config})
         except:
-            # 如果读取失败，使用原始保存方式
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=2)
+            # 如果读取失败，只保存当前配置
+            existing_config = dict(self.config)
+        self._write_atomic(existing_config)
+        # 写入失败时保留待写入的键，下次写入时重试
+        self._dirty = set()
+
+    def _write_at_exit(self):
+        """退出时补写未保存的修改；配置目录已不存在等写入失败时忽略"""
+        try:
+            self._write_dirty()
+        except OSError:
+            pass
+
+    def _write_atomic(self, data):
+        tmp_path = self.config_file + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.config_file)
 
     def get(self, key, default=None):
         return self.config.get(key, default)
 
     def set(self, key, value):
+        if key in self.config and self.config[key] == value:
+            return
         self.config[key] = value
-        self.save_config()
+        self.save_config(key)
+        self.notify(key)
+
+    def subscribe(self, key, callback):
+        """订阅配置项 key 的变化，callback(value)"""
+        self._subscribers.setdefault(key, []).append(callback)
+        return callback
+
+    def unsubscribe(self, key, callback):
+        callbacks = self._subscribers.get(key)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+
+    def notify(self, key):
+        """在本轮事件循环结束后通知 key 的订阅者（重复调用只通知一次）"""
+        if not self._subscribers.get(key):
+            return
+        self._changed[key] = True
+        if QCoreApplication.instance() is None:
+            self._dispatch()
+        elif not self._dispatch_pending:
+            self._dispatch_pending = True
+            QTimer.singleShot(0, self._dispatch)
+
+    def _dispatch(self):
+        self._dispatch_pending = False
+        changed, self._changed = self._changed, {}
+        for key in changed:
+            value = self.config.get(key)
+            for callback in list(self._subscribers.get(key, ())):
+                callback(value)
@@ -0,0 +1,161 @@
+"""背景图片解码线程"""
+
+import threading
+
+from PyQt6.QtCore import QThread, QSize, pyqtSignal, Qt
+from PyQt6.QtGui import QImage, QImageReader, QImageIOHandler
+
+# 背景资源（源图与渲染缓存）默认内存上限，与 Qt 6 默认的读取分配上限一致
+DEFAULT_MEMORY_LIMIT_MB = 256
+# 无法在解码阶段缩小的格式（PNG、BMP、WebP 等）只能先按原尺寸解码再缩小，
+# 原尺寸图片在缩小后立即释放，允许临时超过内存上限，但不超过此值
+MAX_FULL_DECODE_MB = 1024
+
+
+def fit_source_size(width, height, max_width, max_height):
+    """计算覆盖 max_width x max_height 所需的最小源图尺寸（不放大）"""
+    if width <= 0 or height <= 0 or max_width <= 0 or max_height <= 0:
+        return width, height
+    scale = min(1.0, max(max_width / width, max_height / height))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def fit_memory_limit(width, height, limit_bytes, bytes_per_pixel=4):
+    """按比例缩小尺寸，使解码后的图片不超过 limit_bytes"""
+    if limit_bytes <= 0 or width * height * bytes_per_pixel <= limit_bytes:
+        return width, height
+    scale = (limit_bytes / (width * height * bytes_per_pixel)) ** 0.5
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def cover_image(image, width, height, mode=Qt.TransformationMode.SmoothTransformation):
+    """按“覆盖”方式缩放图片并居中裁剪到 width x height"""
+    img_w, img_h = image.width(), image.height()
+    if img_w <= 0 or img_h <= 0 or width <= 0 or height <= 0:
+        return QImage()
+    scale = max(width / img_w, height / img_h)
+    scaled_w, scaled_h = max(width, round(img_w * scale)), max(height, round(img_h * scale))
+    scaled = image.scaled(scaled_w, scaled_h, Qt.AspectRatioMode.IgnoreAspectRatio, mode)
+    x = (scaled_w - width) // 2
+    y = (scaled_h - height) // 2
+    return scaled.copy(x, y, width, height)
+
+
+class ImageDecodeThread(QThread):
+    """在工作线程中用 QImageReader 解码并缩放背景图片
+
+    只保留最新的一个待处理请求：新请求到达时旧的待处理请求被直接丢弃，
+    正在处理的请求在每个阶段之间检查是否已过时，过时则放弃。
+
+    从文件解码时，直接请求读取器按接近屏幕分辨率的尺寸解码（JPEG 等格式可在
+    解码阶段缩小，无需先得到全尺寸图片），源图通过 source_ready 返回供调用方缓存；
+    之后可直接传入缓存的源图，只做缩放而不再读取文件。
+
+    memory_limit_mb 同时作为读取器的分配上限；无法在解码阶段缩小的图片临时按原尺寸解码，
+    上限为 MAX_FULL_DECODE_MB。解码失败时 failed 信号附带错误说明。
+    """
+
+    source_ready = pyqtSignal(int, str, QImage)
+    decoded = pyqtSignal(int, str, QImage)
+    failed = pyqtSignal(int, str, str)
+
+    def __init__(self, memory_limit_mb=DEFAULT_MEMORY_LIMIT_MB, parent=None):
+        super().__init__(parent)
+        self.memory_limit_mb = memory_limit_mb
+        self._cond = threading.Condition()
+        self._pending = None
+        self._latest_id = 0
+        self._running = True
+
+    def request(self, request_id, path, width, height, source=None, source_size=None):
+        """提交解码请求，结果通过 decoded 信号返回
+
+        source: 已缓存的源图，提供时跳过文件解码
+        source_size: 源图缓存的目标尺寸 (宽, 高)，通常为屏幕尺寸
+        """
+        with self._cond:
+            self._latest_id = request_id
+            self._pending = (request_id, path, width, height, source, source_size)
+            self._cond.notify()
+
+    def cancel(self, request_id):
+        """取消所有早于 request_id 的请求"""
+        with self._cond:
+            self._latest_id = request_id
+            self._pending = None
+
+    def _is_stale(self, request_id):
+        with self._cond:
+            return not self._running or request_id != self._latest_id
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._pending = None
+            self._cond.notify()
+        self.wait()
+
+    def run(self):
+        while True:
+            with self._cond:
+                while self._running and self._pending is None:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                request_id, path, width, height, image, source_size = self._pending
+                self._pending = None
+
+            if image is None:
+                image, error = self._decode(path, source_size)
+                if self._is_stale(request_id):
+                    continue
+                if image.isNull():
+                    self.failed.emit(request_id, path, error)
+                    continue
+                if source_size:
+                    image = self._downsample(image, *source_size)
+                    if self._is_stale(request_id):
+                        continue
+                self.source_ready.emit(request_id, path, image)
+
+            result = cover_image(image, width, height)
+            if self._is_stale(request_id):
+                continue
+            self.decoded.emit(request_id, path, result)
+
+    def _decode(self, path, source_size=None):
+        """返回 (图片, 错误说明)"""
+        reader = QImageReader(path)
+        reader.setAutoTransform(True)
+        limit_mb = self.memory_limit_mb
+
+        size = reader.size()
+        if size.isValid():
+            width, height = size.width(), size.height()
+            # EXIF 旋转 90° 时，屏幕方向上的宽高与文件中的相反
+            rotated = bool(reader.transformation() & QImageIOHandler.Transformation.TransformationRotate90)
+            if rotated:
+                width, height = height, width
+            target_w, target_h = width, height
+            if source_size:
+                target_w, target_h = fit_source_size(width, height, *source_size)
+            target_w, target_h = fit_memory_limit(target_w, target_h, self.memory_limit_mb * 1024 * 1024)
+            if (target_w, target_h) != (width, height):
+                if rotated:
+                    target_w, target_h = target_h, target_w
+                reader.setScaledSize(QSize(target_w, target_h))
+                if not reader.supportsOption(QImageIOHandler.ImageOption.ScaledSize):
+                    # 读取器先按原尺寸解码再缩小
+                    limit_mb = max(limit_mb, MAX_FULL_DECODE_MB)
+                    if width * height * 4 > limit_mb * 1024 * 1024:
+                        return QImage(), f"image too large to decode ({width}x{height})"
+        reader.setAllocationLimit(limit_mb)
+        image = reader.read()
+        return image, ("" if not image.isNull() else reader.errorString())
+
+    def _downsample(self, image, max_width, max_height):
+        target_w, target_h = fit_source_size(image.width(), image.height(), max_width, max_height)
+        if (target_w, target_h) == (image.width(), image.height()):
+            return image
+        return image.scaled(target_w, target_h, Qt.AspectRatioMode.IgnoreAspectRatio,
+                            Qt.TransformationMode.SmoothTransformation)
@@ -1,16 +1,29 @@
 """语言管理器"""
 
+import hashlib
 import json
 import os
 import locale
 
+# 当前语言缺少某个键时回退到的语言
+FALLBACK_LANGUAGE = "en_US"
+# 语言文件元数据索引，按文件的 mtime、大小和内容哈希判断是否失效；
+# 位于项目根目录的 cache/，不随启动时的工作目录变化
+DEFAULT_INDEX_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "cache", "lang_index.json"))
+INDEX_VERSION = 2
+
 
 class LanguageManager:
-    def __init__(self, config_manager=None, lang_dir="lang"):
+    def __init__(self, config_manager=None, lang_dir="lang", index_path=None):
         self.config_manager = config_manager
         self.lang_dir = lang_dir
+        self.index_path = os.path.abspath(index_path or DEFAULT_INDEX_PATH)
         self.languages = self._load_languages()
         self.current_language = self._get_current_language()
+        self._catalog = {}
+        self.missing_keys = []
+        self._build_catalog()
 
     def _get_system_language(self):
         """获取系统默认语言"""
@@ -38,39 +51,116 @@ class LanguageManager:
 
         return 'en_US'
 
-    def _load_languages(self):
-        """从lang目录加载所有语言文件"""
+    def _load_languages(self, changed=None):
+        """扫描lang目录，只读取各语言文件的元数据
+
+        元数据来自索引文件，只有新增或内容变化（mtime/大小变化且内容哈希不同）的语言文件
+        才会重新解析，其文件名加入 changed；翻译内容在 get_translations() 首次访问时才加载。
+        """
         languages = {}
-        
+
         if not os.path.exists(self.lang_dir):
             return languages
-        
+
         try:
-            for filename in os.listdir(self.lang_dir):
-                if filename.endswith('.json'):
-                    filepath = os.path.join(self.lang_dir, filename)
-                    try:
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            lang_data = json.load(f)
-                            
-                            # 验证语言文件格式
-                            if 'metadata' in lang_data and 'translations' in lang_data:
-                                metadata = lang_data['metadata']
-                                lang_code = metadata.get('code', filename[:-5])
-                                languages[lang_code] = {
-                                    'name': metadata.get('name', lang_code),
-                                    'code': lang_code,
-                                    'author': metadata.get('author', 'Unknown'),
-                                    'translations': lang_data['translations'],
-                                    'filename': filename
-                                }
-                    except json.JSONDecodeError:
-                        continue
-        except Exception as e:
-            pass
-        
+            filenames = os.listdir(self.lang_dir)
+        except OSError:
+            return languages
+
+        index = self._read_index()
+        lang_dir = os.path.abspath(self.lang_dir)
+        # 保留其他语言目录的条目
+        new_index = {path: entry for path, entry in index.items() if os.path.dirname(path) != lang_dir}
+        for filename in filenames:
+            if not filename.endswith('.json'):
+                continue
+            filepath = os.path.join(lang_dir, filename)
+            try:
+                st = os.stat(filepath)
+            except OSError:
+                continue
+            entry = index.get(filepath)
+            if not entry or entry.get('mtime') != st.st_mtime_ns or entry.get('size') != st.st_size:
+                try:
+                    with open(filepath, 'rb') as f:
+                        data = f.read()
+                except OSError:
+                    continue
+                digest = hashlib.sha1(data).hexdigest()
+                if entry and entry.get('hash') == digest:
+                    # 只有 mtime 变化（如编辑器保存了相同内容），无需重新解析
+                    entry = dict(entry)
+                else:
+                    entry = self._read_metadata(data, filename)
+                    entry['hash'] = digest
+                    if changed is not None:
+                        changed.add(filename)
+                entry['mtime'] = st.st_mtime_ns
+                entry['size'] = st.st_size
+            new_index[filepath] = entry
+
+            # 格式无效的文件也记入索引（code 为空），未修改前不再重复解析
+            lang_code = entry.get('code')
+            if lang_code:
+                languages[lang_code] = {
+                    'name': entry.get('name', lang_code),
+                    'code': lang_code,
+                    'author': entry.get('author', 'Unknown'),
+                    'filename': filename
+                }
+
+        if new_index != index:
+            self._write_index(new_index)
         return languages
-    
+
+    def _read_metadata(self, data, filename):
+        """解析语言文件内容，返回索引条目（不保留翻译内容）"""
+        try:
+            lang_data = json.loads(data.decode('utf-8'))
+        except ValueError:
+            return {'code': None}
+
+        # 验证语言文件格式
+        if not isinstance(lang_data, dict) or 'metadata' not in lang_data or 'translations' not in lang_data:
+            return {'code': None}
+        metadata = lang_data['metadata']
+        lang_code = metadata.get('code', filename[:-5])
+        return {
+            'code': lang_code,
+            'name': metadata.get('name', lang_code),
+            'author': metadata.get('author', 'Unknown')
+        }
+
+    def _read_translations(self, filename):
+        try:
+            with open(os.path.join(self.lang_dir, filename), 'r', encoding='utf-8') as f:
+                return json.load(f).get('translations', {})
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') == INDEX_VERSION:
+                return index.get('files', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {}
+
+    def _write_index(self, files):
+        """原子写入索引文件，失败时忽略（下次启动重新解析）"""
+        try:
+            directory = os.path.dirname(self.index_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = self.index_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_VERSION, 'files': files}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass
+
     def _get_current_language(self):
         """获取当前语言"""
         saved_lang = None
@@ -96,28 +186,80 @@ class LanguageManager:
     def reload_languages(self):
         """重新加载语言文件（用于用户添加新语言后刷新）"""
         old_current = self.current_language
-        self.languages = self._load_languages()
+        self.refresh_languages()
+        return old_current != self.current_language
+
+    def refresh_languages(self):
+        """重新扫描lang目录，只重新解析内容有变化的文件
 
+        返回内容变化、新增或被移除的语言代码集合。当前语言被移除时切换到第一个可用语言；
+        当前语言或回退语言变化时重建翻译目录。
+        """
+        changed_files = set()
+        languages = self._load_languages(changed_files)
+        changed = {code for code, info in languages.items() if info['filename'] in changed_files}
+        changed.update(code for code in self.languages if code not in languages)
+
+        # 未变化的语言沿用已加载的翻译
+        for code, info in languages.items():
+            old = self.languages.get(code)
+            if code not in changed and old and 'translations' in old and old['filename'] == info['filename']:
+                info['translations'] = old['translations']
+        self.languages = languages
+
+        rebuild = self.current_language in changed or FALLBACK_LANGUAGE in changed
         # 如果当前语言不在新加载的语言列表中，切换到第一个可用语言
         if self.current_language not in self.languages:
             if self.languages:
                 self.current_language = list(self.languages.keys())[0]
             else:
                 self.current_language = "zh_CN"
+            rebuild = True
+            # 保存新语言设置
+            self._save_language_config()
 
-        # 保存新语言设置
-        self._save_language_config()
-
-        return old_current != self.current_language
+        if rebuild:
+            self._build_catalog()
+        return changed
 
     def set_language(self, language_code):
         """设置当前语言"""
         if language_code in self.languages:
             self.current_language = language_code
+            self._build_catalog()
             self._save_language_config()
             return True
         return False
 
+    def _build_catalog(self):
+        """合并当前语言与回退语言的翻译，translate 只需一次字典查找
+
+        内存中只保留这两种语言的翻译，其余语言的翻译随之释放。
+        """
+        fallback = self.get_translations(FALLBACK_LANGUAGE)
+        translations = self.get_translations(self.current_language)
+        catalog = dict(fallback)
+        catalog.update(translations)
+        self._catalog = catalog
+        # 当前语言缺少、需要回退的键
+        self.missing_keys = sorted(set(fallback).difference(translations))
+
+        for code, info in self.languages.items():
+            if code not in (self.current_language, FALLBACK_LANGUAGE):
+                info.pop('translations', None)
+
+    def find_missing_keys(self, language_code):
+        """指定语言中缺少、其他语言中存在的翻译键（按字母排序，需要加载全部语言）"""
+        translations = self.get_translations(language_code)
+        all_keys = set()
+        for code in self.languages:
+            all_keys.update(self.get_translations(code))
+        return sorted(all_keys.difference(translations))
+
+    def get_missing_keys(self):
+        """所有语言缺少的翻译键 {language_code: [key, ...]}"""
+        return {code: self.find_missing_keys(code) for code in self.languages}
+
     def _save_language_config(self):
         """保存语言配置"""
         if self.config_manager:
@@ -140,45 +282,33 @@ class LanguageManager:
     def get_language_info(self, language_code):
         """获取语言完整信息"""
         if language_code in self.languages:
+            self.get_translations(language_code)
             return self.languages[language_code]
         return None
     
     def translate(self, key, default=None):
         """获取翻译文本
-        
+
         优先级：
         1. 当前语言中的翻译
         2. 英语(en_US)中的翻译（如果存在）
         3. 默认值
         4. 翻译键本身
+        前两级在切换语言时已合并到同一个字典中。
         """
-        if default is None:
-            default = key
-        
-        # 首先尝试从当前语言获取翻译
-        if self.current_language in self.languages:
-            translations = self.languages[self.current_language]['translations']
-            if key in translations:
-                return translations[key]
-        
-        # 如果当前语言中没有找到，尝试从英语(en_US)获取翻译
-        if 'en_US' in self.languages and self.current_language != 'en_US':
-            translations = self.languages['en_US']['translations']
-            if key in translations:
-                return translations[key]
-        
-        # 都没有找到，返回默认值
-        return default
-    
-    def tr(self, key, default=None):
-        """translate的简写"""
-        return self.translate(key, default)
+        return self._catalog.get(key, key if default is None else default)
+
+    # translate的简写
+    tr = translate
     
     def get_translations(self, language_code):
-        """获取指定语言的所有翻译"""
-        if language_code in self.languages:
-            return self.languages[language_code]['translations']
-        return {}
+        """获取指定语言的所有翻译（首次访问时从文件加载）"""
+        info = self.languages.get(language_code)
+        if info is None:
+            return {}
+        if 'translations' not in info:
+            info['translations'] = self._read_translations(info['filename'])
+        return info['translations']
     
     def get_available_languages(self):
         """获取所有可用语言的代码列表"""
@@ -0,0 +1,68 @@
+"""语言文件热重载"""
+
+import os
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer
+
+from .language import FALLBACK_LANGUAGE
+
+
+class LanguageWatcher(QObject):
+    """监听 lang 目录，语言文件保存后增量重新加载
+
+    编辑器保存时往往连续触发多次修改（或先写临时文件再重命名），修改停止
+    DEBOUNCE_MS 后才统一处理；只有内容变化的文件会重新解析。
+    """
+
+    DEBOUNCE_MS = 300
+
+    def __init__(self, language_manager, on_reloaded=None, parent=None):
+        """on_reloaded(active_changed, languages_changed): 重新加载后的回调
+        active_changed: 当前显示的翻译有变化，需要重新翻译界面
+        languages_changed: 可选语言列表（代码或显示名称）有变化
+        """
+        super().__init__(parent)
+        self.language_manager = language_manager
+        self._on_reloaded = on_reloaded or (lambda active_changed, languages_changed: None)
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._schedule)
+        self._watcher.fileChanged.connect(self._schedule)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DEBOUNCE_MS)
+        self._timer.timeout.connect(self.reload)
+
+        self._watch_paths()
+
+    def _watch_paths(self):
+        """监听目录（新增、删除、重命名）和各语言文件（原地修改）"""
+        lang_dir = self.language_manager.lang_dir
+        try:
+            names = os.listdir(lang_dir)
+        except OSError:
+            return
+        paths = [lang_dir] + [os.path.join(lang_dir, name) for name in names if name.endswith('.json')]
+        watched = set(self._watcher.files()) | set(self._watcher.directories())
+        missing = [path for path in paths if path not in watched]
+        if missing:
+            self._watcher.addPaths(missing)
+
+    def _schedule(self, path=None):
+        self._timer.start()
+
+    def reload(self):
+        manager = self.language_manager
+        old_current = manager.current_language
+        old_languages = manager.get_all_languages()
+        changed = manager.refresh_languages()
+        # 通过重命名保存的文件会从监听列表中移除，需要重新添加
+        self._watch_paths()
+
+        active_changed = (manager.current_language != old_current
+                          or manager.current_language in changed
+                          or FALLBACK_LANGUAGE in changed)
+        languages_changed = manager.get_all_languages() != old_languages
+        if active_changed or languages_changed:
+            self._on_reloaded(active_changed, languages_changed)
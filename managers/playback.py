@@ -0,0 +1,122 @@
+"""背景视频播放控制"""
+
+from PyQt6.QtCore import QObject, QEvent, QTimer
+
+
+class PlaybackController(QObject):
+    """根据窗口可见性暂停/恢复背景视频、文件夹轮播与动画图片
+
+    窗口最小化、隐藏、未暴露（如位于其他虚拟桌面）或背景被完全遮挡时立即暂停；
+    窗口失去焦点超过宽限期后暂停，重新激活时恢复。
+    启用空闲暂停时，窗口内长时间没有鼠标或键盘输入也会暂停，有输入时恢复。
+    暂停使用 pause() 而非 stop()，恢复时保留最后一帧，不会出现黑屏。
+    """
+
+    INACTIVE_GRACE_MS = 30000
+    IDLE_TIMEOUT_MS = 120000
+
+    _INPUT_EVENTS = (
+        QEvent.Type.MouseMove,
+        QEvent.Type.MouseButtonPress,
+        QEvent.Type.Wheel,
+        QEvent.Type.KeyPress,
+    )
+
+    _WINDOW_EVENTS = (
+        QEvent.Type.Show,
+        QEvent.Type.Hide,
+        QEvent.Type.WindowStateChange,
+        QEvent.Type.WindowActivate,
+        QEvent.Type.WindowDeactivate,
+    )
+
+    def __init__(self, window, bg_manager, is_covered=None, pause_when_idle=None):
+        """is_covered: 可选回调，返回 True 表示背景被不透明内容完全遮挡
+        pause_when_idle: 可选回调，返回 True 时在窗口空闲后暂停
+        """
+        super().__init__(window)
+        self.window = window
+        self.bg_manager = bg_manager
+        self._is_covered = is_covered or (lambda: False)
+        self._pause_when_idle = pause_when_idle or (lambda: False)
+        self._idle = False
+        self._window_handle = None
+        self._exposed = True
+        self._grace_elapsed = False
+
+        self._grace_timer = QTimer(self)
+        self._grace_timer.setSingleShot(True)
+        self._grace_timer.setInterval(self.INACTIVE_GRACE_MS)
+        self._grace_timer.timeout.connect(self._on_grace_elapsed)
+
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(self.IDLE_TIMEOUT_MS)
+        self._idle_timer.timeout.connect(self._on_idle)
+        self._idle_timer.start()
+
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self.window:
+            if event.type() in self._WINDOW_EVENTS:
+                if event.type() == QEvent.Type.Show:
+                    self._watch_window_handle()
+                self.update()
+        elif obj is self._window_handle:
+            # 输入事件先经过原生窗口再分发给子控件，在这里即可覆盖整个窗口
+            if event.type() in self._INPUT_EVENTS:
+                self._on_input()
+            elif event.type() == QEvent.Type.Expose:
+                self._exposed = self._window_handle.isExposed()
+                self.update()
+        return False
+
+    def _on_input(self):
+        self._idle_timer.start()
+        if self._idle:
+            self._idle = False
+            self.update()
+
+    def _on_idle(self):
+        self._idle = True
+        self.update()
+
+    def _watch_window_handle(self):
+        """原生窗口在首次显示时才创建，此时再监听其 Expose 与输入事件"""
+        handle = self.window.windowHandle()
+        if handle is not None and handle is not self._window_handle:
+            self._window_handle = handle
+            handle.installEventFilter(self)
+
+    def _on_grace_elapsed(self):
+        self._grace_elapsed = True
+        self.update()
+
+    def is_shown(self):
+        """窗口可见且背景未被完全遮挡"""
+        window = self.window
+        if not window.isVisible() or window.isMinimized() or not self._exposed:
+            return False
+        return not self._is_covered()
+
+    def should_play(self):
+        window = self.window
+        if not self.is_shown():
+            return False
+        if self._idle and self._pause_when_idle():
+            return False
+
+        if window.isActiveWindow():
+            self._grace_timer.stop()
+            self._grace_elapsed = False
+            return True
+        if not self._grace_elapsed and not self._grace_timer.isActive():
+            self._grace_timer.start()
+        return not self._grace_elapsed
+
+    def update(self):
+        """重新评估是否允许播放（可见性相关状态变化后调用）"""
+        self.bg_manager.set_video_playback_allowed(self.should_play())
+        # 文件夹轮播与动画图片只在窗口不可见时暂停，失去焦点时继续
+        self.bg_manager.set_background_visible(self.is_shown())
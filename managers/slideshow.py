@@ -0,0 +1,175 @@
+"""文件夹背景轮播"""
+
+import os
+
+from PyQt6.QtCore import QTimer
+
+from .image_decoder import ImageDecodeThread
+
+IMAGE_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.bmp', '.webp', '.tif', '.tiff']
+
+DEFAULT_ROTATION_INTERVAL = 300
+
+
+def list_images(folder):
+    """文件夹中可作为背景的图片，按文件名排序"""
+    try:
+        names = sorted(os.listdir(folder), key=str.lower)
+    except OSError:
+        return []
+    return [os.path.join(folder, name) for name in names
+            if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS
+            and os.path.isfile(os.path.join(folder, name))]
+
+
+class Prefetched:
+    """已在后台解码并缩放好的下一张图片"""
+
+    def __init__(self, path, key):
+        self.path = path
+        self.key = key
+        self.source = None
+        self.image = None
+
+
+class BackgroundSlideshow:
+    """按固定间隔轮换文件夹中的图片
+
+    下一张图片提前在独立的解码线程中解码并缩放到当前窗口尺寸，轮到它时直接显示；
+    内存中只保留当前图片和下一张图片。窗口不可见时暂停计时。
+    """
+
+    def __init__(self, manager, interval=DEFAULT_ROTATION_INTERVAL):
+        self.manager = manager
+        self.folder = None
+        self.files = []
+        self.index = 0
+        self._running = True
+        self._remaining_ms = None
+
+        self._prefetcher = None
+        self._prefetch_id = 0
+        self._prefetched = None
+
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(max(1, int(interval)) * 1000)
+        self._timer.timeout.connect(self.advance)
+
+    def start(self, folder):
+        """开始轮播 folder，返回第一张图片路径（文件夹中没有图片时返回 None）"""
+        self.stop()
+        self.folder = folder
+        self.files = list_images(folder)
+        self.index = 0
+        if not self.files:
+            return None
+        self._restart_timer()
+        self._prefetch_next()
+        return self.files[0]
+
+    def stop(self):
+        self.folder = None
+        self.files = []
+        self._timer.stop()
+        self._remaining_ms = None
+        self._drop_prefetch()
+
+    def current_path(self):
+        return self.files[self.index] if self.files else None
+
+    def set_running(self, running):
+        """窗口不可见时暂停计时，恢复后继续剩余时间"""
+        if running == self._running:
+            return
+        self._running = running
+        if not self.files:
+            return
+        if running:
+            self._timer.start(self._remaining_ms if self._remaining_ms is not None else self._timer.interval())
+            self._remaining_ms = None
+        elif self._timer.isActive():
+            self._remaining_ms = max(0, self._timer.remainingTime())
+            self._timer.stop()
+
+    def advance(self):
+        """切换到下一张图片"""
+        if not self.files:
+            return
+        self.index += 1
+        if self.index >= len(self.files):
+            # 一轮结束后重新扫描文件夹，以便加入新增或移除已删除的图片
+            self.files = list_images(self.folder) or self.files
+            self.index = 0
+
+        path = self.files[self.index]
+        prefetched = self._prefetched
+        self._prefetched = None
+        if prefetched is not None and (prefetched.path != path or prefetched.image is None):
+            prefetched = None
+        self.manager.show_slideshow_image(path, prefetched)
+
+        self._restart_timer()
+        self._prefetch_next()
+
+    def refresh_prefetch(self):
+        """窗口尺寸变化后，用已解码的源图重新缩放下一张图片"""
+        prefetched = self._prefetched
+        if prefetched is None or prefetched.source is None:
+            return
+        w, h = self.manager.parent.width(), self.manager.parent.height()
+        if prefetched.image is not None and (prefetched.image.width(), prefetched.image.height()) == (w, h):
+            return
+        prefetched.image = None
+        self._prefetch_id += 1
+        self._ensure_prefetcher().request(self._prefetch_id, prefetched.path, w, h, source=prefetched.source)
+
+    def shutdown(self):
+        self.stop()
+        if self._prefetcher is not None:
+            self._prefetcher.stop()
+            self._prefetcher = None
+
+    def _restart_timer(self):
+        self._remaining_ms = None
+        if self._running:
+            self._timer.start()
+        else:
+            self._timer.stop()
+
+    def _prefetch_next(self):
+        self._drop_prefetch()
+        if len(self.files) < 2:
+            return
+        path = self.files[(self.index + 1) % len(self.files)]
+        try:
+            key = (path, os.path.getmtime(path))
+        except OSError:
+            return
+        self._prefetched = Prefetched(path, key)
+        self._prefetch_id += 1
+        w, h = self.manager.parent.width(), self.manager.parent.height()
+        self._ensure_prefetcher().request(self._prefetch_id, path, w, h,
+                                          source_size=self.manager.screen_size())
+
+    def _drop_prefetch(self):
+        self._prefetched = None
+        if self._prefetcher is not None:
+            self._prefetch_id += 1
+            self._prefetcher.cancel(self._prefetch_id)
+
+    def _ensure_prefetcher(self):
+        if self._prefetcher is None:
+            self._prefetcher = ImageDecodeThread(self.manager.memory_limit_mb)
+            self._prefetcher.source_ready.connect(self._on_source_ready)
+            self._prefetcher.decoded.connect(self._on_decoded)
+            self._prefetcher.start()
+        return self._prefetcher
+
+    def _on_source_ready(self, request_id, path, image):
+        if request_id == self._prefetch_id and self._prefetched is not None:
+            self._prefetched.source = image
+
+    def _on_decoded(self, request_id, path, image):
+        if request_id == self._prefetch_id and self._prefetched is not None:
+            self._prefetched.image = image
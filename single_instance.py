@@ -0,0 +1,86 @@
+"""单实例运行
+
+第一个实例在本地套接字（Windows 上为命名管道）上监听。之后启动的实例在导入
+主窗口等重量级模块之前连接它，把命令行参数转发过去后立即退出。
+本模块只依赖 QtCore 与 QtNetwork，转发路径不会加载 QtWidgets。
+"""
+
+import hashlib
+import json
+import os
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+
+# 连接与发送的超时时间，已有实例无响应时不会长时间阻塞启动
+CONNECT_TIMEOUT_MS = 500
+
+
+def server_name(directory=None):
+    """实例标识：按用户和工作目录区分（配置、缓存等均相对于工作目录）"""
+    directory = os.path.normcase(os.path.abspath(directory or os.getcwd()))
+    user = os.environ.get("USERNAME") or os.environ.get("USER") or ""
+    digest = hashlib.sha1(f"{user}|{directory}".encode("utf-8")).hexdigest()[:16]
+    return f"spectra-{digest}"
+
+
+def forward_arguments(args, name=None, timeout_ms=CONNECT_TIMEOUT_MS):
+    """已有实例在运行时把 args 转发给它并返回 True，否则返回 False"""
+    socket = QLocalSocket()
+    socket.connectToServer(name or server_name())
+    if not socket.waitForConnected(timeout_ms):
+        return False
+    socket.write(json.dumps(list(args)).encode("utf-8") + b"\n")
+    socket.waitForBytesWritten(timeout_ms)
+    socket.disconnectFromServer()
+    if socket.state() != QLocalSocket.LocalSocketState.UnconnectedState:
+        socket.waitForDisconnected(timeout_ms)
+    return True
+
+
+class SingleInstanceServer(QObject):
+    """接收后续启动的实例转发来的命令行参数"""
+
+    arguments_received = pyqtSignal(list)
+
+    def __init__(self, name=None, parent=None):
+        super().__init__(parent)
+        self.name = name or server_name()
+        self._server = QLocalServer(self)
+        self._server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self._server.newConnection.connect(self._on_new_connection)
+
+    def listen(self):
+        """开始监听，失败（如另一个实例恰好同时启动）时返回 False"""
+        if self._server.listen(self.name):
+            return True
+        if self._server.serverError() != QAbstractSocket.SocketError.AddressInUseError:
+            return False
+        # 名称已被占用：能连上说明另一个实例正在运行，否则是上次异常退出残留的套接字
+        probe = QLocalSocket()
+        probe.connectToServer(self.name)
+        if probe.waitForConnected(CONNECT_TIMEOUT_MS):
+            probe.abort()
+            return False
+        QLocalServer.removeServer(self.name)
+        return self._server.listen(self.name)
+
+    def close(self):
+        self._server.close()
+
+    def _on_new_connection(self):
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            socket.readyRead.connect(lambda socket=socket: self._read(socket))
+            socket.disconnected.connect(socket.deleteLater)
+            self._read(socket)
+
+    def _read(self, socket):
+        while socket.canReadLine():
+            line = bytes(socket.readLine()).decode("utf-8", "replace")
+            try:
+                args = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(args, list):
+                self.arguments_received.emit([str(arg) for arg in args])
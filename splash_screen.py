@@ -1,10 +1,19 @@
 """启动画面"""
 
 import os
-from PyQt6.QtWidgets import QApplication, QWidget, QHBoxLayout, QLabel
+from PyQt6.QtWidgets import QApplication, QWidget, QHBoxLayout, QLabel, QProgressBar
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPixmap
 
+# 启动阶段的显示文本（启动画面早于语言管理器创建，不做翻译）
+PHASE_TEXT = {
+    "config": "Loading settings",
+    "font": "Loading fonts",
+    "nav": "Building navigation",
+    "content": "Building pages",
+    "background": "Loading background",
+    "ready": "Ready",
+}
 
 class SplashScreen(QWidget):
     def __init__(self):
@@ -31,3 +40,26 @@ class SplashScreen(QWidget):
             icon_label.setPixmap(icon_pixmap.scaled(179, 179, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
             icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             layout.addWidget(icon_label)
+
+        # 启动进度条（覆盖在图标底部）
+        self.progress_bar = QProgressBar(self)
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setGeometry(40, self.height() - 12, self.width() - 80, 3)
+        self.progress_bar.setStyleSheet(
+            "QProgressBar{background:rgba(255,255,255,0.2);border:none;border-radius:1px;}"
+            "QProgressBar::chunk{background:white;border-radius:1px;}")
+
+        # 当前启动阶段（显示在进度条上方）
+        self.phase_label = QLabel(self)
+        self.phase_label.setGeometry(0, self.height() - 30, self.width(), 14)
+        self.phase_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.phase_label.setStyleSheet("color:rgba(255,255,255,0.85);font-size:9px;background:transparent;")
+
+    def set_progress(self, percent, phase=""):
+        """更新启动进度和阶段文本，主窗口在同步构建时调用，需立即重绘"""
+        self.phase_label.setText(PHASE_TEXT.get(phase, phase))
+        self.progress_bar.setValue(int(percent))
+        self.phase_label.repaint()
+        self.progress_bar.repaint()
@@ -1,25 +1,270 @@
 """样式定义"""
 
-STYLE_BTN = "QPushButton{background:transparent;border:none;border-radius:8px;}QPushButton:hover{background:rgba(255,255,255,0.2);}"
-STYLE_BTN_ACTIVE = "QPushButton{background:rgba(255,255,255,0.15);border:none;border-radius:8px;}QPushButton:hover{background:rgba(255,255,255,0.1);}"
-STYLE_ICON = "color:white;background:transparent;font-size:16px;font-family:'Segoe Fluent Icons';"
-STYLE_TEXT = "color:white;background:transparent;font-size:14px;font-family:'微软雅黑';"
+# 应用样式表模板（string.Template），由 ui.theme.Theme 填入变量后设置到 QApplication：
+#   $sN        按 DPI 缩放后的尺寸 N，如 $s13
+#   $accent    强调色
+# 控件按 objectName 选择规则，选中等状态使用动态属性（[selected="true"]）。
+# 规则中只指定字号，字体由 QApplication.setFont 传播。
+APP_STYLE_TEMPLATE = """
+QLabel#nav_text, QLabel#app_title {
+    color: white;
+    background: transparent;
+    font-size: ${s14}px;
+}
+QPushButton#nav_btn {
+    background: transparent;
+    border: none;
+    border-radius: 8px;
+}
+QPushButton#nav_btn[active="true"] {
+    background: rgba(255,255,255,0.15);
+}
+QPushButton#nav_btn:hover {
+    background: rgba(255,255,255,0.2);
+}
+QPushButton#nav_btn[active="true"]:hover {
+    background: rgba(255,255,255,0.1);
+}
+QLabel#nav_icon {
+    color: white;
+    background: transparent;
+    font-size: ${s16}px;
+    font-family: 'Segoe Fluent Icons';
+}
+QWidget#nav_indicator {
+    background: transparent;
+    border-radius: ${s1}px;
+}
+QWidget#nav_indicator[active="true"] {
+    background: $accent;
+}
+QPushButton#title_btn {
+    background: transparent;
+    color: white;
+    border: none;
+    border-radius: ${s16}px;
+    font-size: ${s16}px;
+}
+QPushButton#title_btn:hover {
+    background: rgba(255,255,255,0.2);
+}
+
+QLabel#page_title {
+    color: white;
+    font-size: ${s20}px;
+    font-weight: bold;
+}
+QScrollArea#page_scroll {
+    background: transparent;
+    border: none;
+}
+QWidget#page_content {
+    background: transparent;
+}
+QScrollArea#page_scroll QScrollBar:vertical {
+    background: rgba(255, 255, 255, 0.1);
+    width: 8px;
+    border-radius: 4px;
+    margin: 0px;
+}
+QScrollArea#page_scroll QScrollBar::handle:vertical {
+    background: rgba(255, 255, 255, 0.3);
+    min-height: 20px;
+    border-radius: 4px;
+}
+QScrollArea#page_scroll QScrollBar::handle:vertical:hover {
+    background: rgba(255, 255, 255, 0.5);
+}
+QScrollArea#page_scroll QScrollBar::add-line:vertical, QScrollArea#page_scroll QScrollBar::sub-line:vertical {
+    border: none;
+    background: none;
+    height: 0px;
+}
+QScrollArea#page_scroll QScrollBar::add-page:vertical, QScrollArea#page_scroll QScrollBar::sub-page:vertical {
+    background: none;
+}
+
+QWidget#settings_group {
+    background: rgba(255,255,255,0.08);
+    border-radius: 8px;
+}
+QPushButton#group_header {
+    background: transparent;
+    border: none;
+    border-top-left-radius: ${s8}px;
+    border-top-right-radius: ${s8}px;
+}
+QPushButton#group_header:hover {
+    background: rgba(255,255,255,0.05);
+}
+QPushButton#group_header:pressed {
+    background: rgba(255,255,255,0.02);
+}
+QPushButton#option_card {
+    background: rgba(255,255,255,0.05);
+    border: none;
+    border-radius: 0px;
+}
+QPushButton#option_card[selected="true"] {
+    background: rgba(255,255,255,0.15);
+}
+QPushButton#option_card:hover {
+    background: rgba(255,255,255,0.1);
+}
+QPushButton#option_card:pressed {
+    background: rgba(255,255,255,0.03);
+}
+QPushButton#option_card[selected="true"]:pressed {
+    background: rgba(255,255,255,0.05);
+}
+QLabel#card_title {
+    color: white;
+    font-size: ${s14}px;
+    background: transparent;
+}
+QLabel#card_desc {
+    color: rgba(255,255,255,0.6);
+    font-size: ${s12}px;
+    background: transparent;
+}
 
-SLIDER_STYLE = """
-QSlider::groove:horizontal {
+QLabel#setting_label {
+    color: rgba(255,255,255,0.8);
+    font-size: ${s13}px;
+}
+QLineEdit#setting_input {
+    background: rgba(255,255,255,0.1);
+    border: 1px solid rgba(255,255,255,0.2);
+    border-radius: ${s4}px;
+    padding: ${s6}px;
+    color: white;
+    font-size: ${s13}px;
+}
+QLabel#browse_btn {
+    background: rgba(255,255,255,0.1);
+    border: none;
+    border-radius: ${s4}px;
+}
+QLabel#browse_btn:hover {
+    background: rgba(255,255,255,0.15);
+}
+QSlider#setting_slider::groove:horizontal {
     height: 4px;
     background: rgba(255,255,255,0.2);
     border-radius: 2px;
 }
-QSlider::handle:horizontal {
+QSlider#setting_slider::handle:horizontal {
     width: 16px;
     height: 16px;
     background: rgba(255,255,255,0.9);
     border-radius: 8px;
     margin: -6px 0;
 }
-QSlider::sub-page:horizontal {
+QSlider#setting_slider::sub-page:horizontal {
     background: #ffffff;
     border-radius: 2px;
 }
+
+QComboBox#setting_combo {
+    background: rgba(0,0,0,0.3);
+    border: 1px solid rgba(255,255,255,0.15);
+    border-radius: ${s4}px;
+    padding: ${s6}px;
+    color: rgba(255,255,255,0.95);
+    font-size: ${s13}px;
+}
+QComboBox#setting_combo:hover {
+    background: rgba(0,0,0,0.4);
+    border: 1px solid rgba(255,255,255,0.25);
+}
+QComboBox#setting_combo:focus {
+    background: rgba(0,0,0,0.5);
+    border: 1px solid rgba(100,150,255,0.6);
+}
+QComboBox#setting_combo:on {
+    padding-top: ${combo_padding_on}px;
+    padding-bottom: ${combo_padding_on}px;
+}
+QComboBox#setting_combo::drop-down {
+    border: none;
+    width: 28px;
+    background: transparent;
+}
+QComboBox#setting_combo QAbstractItemView {
+    border: 1px solid rgba(255,255,255,0.1);
+    border-radius: ${s4}px;
+    selection-background-color: rgba(255,255,255,0.15);
+    selection-color: white;
+    outline: none;
+    padding: ${s2}px;
+}
+QComboBox#setting_combo QAbstractItemView::item {
+    height: ${s28}px;
+    padding: ${s6}px ${s8}px;
+    color: rgba(255,255,255,0.85);
+    border-radius: ${item_radius}px;
+}
+QComboBox#setting_combo QAbstractItemView::item:hover {
+    background: rgba(255,255,255,0.1);
+}
+QComboBox#setting_combo QAbstractItemView::item:selected {
+    background: rgba(255,255,255,0.15);
+    color: white;
+}
+QComboBox#setting_combo QScrollBar:vertical {
+    background: rgba(255,255,255,0.05);
+    width: 8px;
+    margin: 0px;
+    border-radius: 4px;
+}
+QComboBox#setting_combo QScrollBar::handle:vertical {
+    background: rgba(255,255,255,0.3);
+    min-height: 20px;
+    border-radius: 4px;
+}
+QComboBox#setting_combo QScrollBar::handle:vertical:hover {
+    background: rgba(255,255,255,0.5);
+}
+QComboBox#setting_combo QScrollBar::add-line:vertical, QComboBox#setting_combo QScrollBar::sub-line:vertical {
+    border: none;
+    background: none;
+}
+QComboBox#setting_combo QScrollBar::add-page:vertical, QComboBox#setting_combo QScrollBar::sub-page:vertical {
+    background: none;
+}
+
+QWidget#news_card {
+    background: rgba(0, 0, 0, 0.45);
+    border: 1px solid rgba(255, 255, 255, 0.2);
+    border-radius: ${s12}px;
+}
+QWidget#news_card:hover {
+    background: rgba(0, 0, 0, 0.55);
+    border: 1px solid rgba(255, 255, 255, 0.3);
+}
+QLabel#news_title {
+    color: white;
+    background: transparent;
+    font-size: ${s13}pt;
+    font-weight: bold;
+}
+QLabel#news_content {
+    color: rgba(255, 255, 255, 0.85);
+    background: transparent;
+    font-size: ${s11}pt;
+}
+QPushButton#news_close {
+    background: transparent;
+    border: none;
+    color: white;
+    font-size: 18px;
+    font-weight: bold;
+}
+QPushButton#news_close:hover {
+    background: rgba(255, 255, 255, 0.15);
+    border-radius: 12px;
+}
 """
+
+# 下拉列表自身的样式表，背景不透明度随 blur_opacity 变化
+DROPDOWN_STYLE_TEMPLATE = "QAbstractItemView{background:rgba(0,0,0,$dropdown_alpha);}"
@@ -1,5 +1,6 @@
 """UI构建器模块"""
 
 from .builder import UIBuilder
+from .theme import Theme, set_variant
 
-__all__ = ['UIBuilder']
+__all__ = ['UIBuilder', 'Theme', 'set_variant']
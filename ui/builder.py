@@ -5,28 +5,36 @@ from PyQt6.QtWidgets import (QWidget, QPushButton, QHBoxLayout, QVBoxLayout, QLa
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPixmap, QColor
 
-from widgets import JellyButton, CardButton, ClickableLabel, make_transparent, get_current_font, set_current_font
-from styles import STYLE_BTN, STYLE_ICON, SLIDER_STYLE
+from widgets import JellyButton, CardButton, ClickableLabel, make_transparent
 from utils import load_svg_icon, scale_icon_for_display
+from .theme import set_variant
+from .translation import TranslationRegistry
 
 
 class UIBuilder:
     def __init__(self, window):
         self.window = window
         self.dpi_scale = getattr(window, 'dpi_scale', 1.0)
+        # 界面文本在创建时绑定翻译键，切换语言时统一更新
+        self.translations = TranslationRegistry(window.language_manager)
 
     def _scale_size(self, size):
         return int(size * self.dpi_scale)
 
-    def _get_font_family(self):
-        """获取当前字体系列"""
-        return get_current_font()
+    def _translated_label(self, key, object_name=None):
+        """创建显示翻译文本的标签，并绑定到翻译键
 
-    def create_nav_btn(self, icon, text, handler, page_index=None,
+        object_name 对应应用样式表（styles.APP_STYLE_TEMPLATE）中的规则。
+        """
+        label = QLabel(self.window.language_manager.translate(key))
+        if object_name:
+            label.setObjectName(object_name)
+        return self.translations.bind(label, key)
+
+    def create_nav_btn(self, icon, text_key, handler, page_index=None,
                        icon_path=None, icon_path_active=None):
         container = QWidget()
         container.setFixedHeight(self._scale_size(40))
-        container.setStyleSheet("background:transparent;")
         container.setMouseTracking(True)
         cl = QHBoxLayout(container)
         cl.setContentsMargins(0, 0, 0, 0)
@@ -34,7 +42,7 @@ class UIBuilder:
 
         btn = JellyButton()
         btn.setFixedHeight(self._scale_size(40))
-        btn.setStyleSheet(STYLE_BTN)
+        btn.setObjectName("nav_btn")
         btn.clicked.connect(handler)
 
         outer = QHBoxLayout(btn)
@@ -43,7 +51,7 @@ class UIBuilder:
 
         indicator = QWidget()
         indicator.setFixedSize(self._scale_size(3), self._scale_size(18))
-        indicator.setStyleSheet("background:transparent;border-radius:1px;")
+        indicator.setObjectName("nav_indicator")
         indicator.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         outer.addWidget(indicator, 0, Qt.AlignmentFlag.AlignVCenter)
         if page_index is not None:
@@ -58,7 +66,6 @@ class UIBuilder:
         icon_lbl = QLabel()
         icon_lbl.setFixedSize(self._scale_size(20), self._scale_size(20))
         icon_lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        icon_lbl.setStyleSheet("background:transparent;")
         icon_lbl.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         icon_lbl.setMouseTracking(True)
         icon_lbl.setObjectName("nav_icon")
@@ -67,13 +74,10 @@ class UIBuilder:
             icon_lbl.setPixmap(scale_icon_for_display(icon, 20, self.dpi_scale))
         else:
             icon_lbl.setText(icon)
-            icon_lbl.setStyleSheet(STYLE_ICON)
 
         il.addWidget(icon_lbl)
 
-        text_lbl = QLabel(text)
-        font_size = int(14 * self.dpi_scale)
-        text_lbl.setStyleSheet(f"color:white;background:transparent;font-size:{font_size}px;font-family:'{self._get_font_family()}';")
+        text_lbl = self._translated_label(text_key, "nav_text")
         text_lbl.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         text_lbl.setMouseTracking(True)
         text_lbl.hide()
@@ -89,21 +93,17 @@ class UIBuilder:
     def create_title_btn(self, text, handler):
         b = JellyButton(text)
         b.setFixedSize(self._scale_size(32), self._scale_size(32))
-        font_size = self._scale_size(16)
-        b.setStyleSheet(
-            f"QPushButton{{background:transparent;color:white;border:none;border-radius:{self._scale_size(16)}px;font-size:{font_size}px;font-family:'{self._get_font_family()}';}}QPushButton:hover{{background:rgba(255,255,255,0.2);}}")
+        b.setObjectName("title_btn")
         b.clicked.connect(handler)
         return b
 
-    def create_bg_card(self, title, desc, selected, handler):
+    def create_bg_card(self, title_key, desc_key, selected, handler):
         card = CardButton()
         card.setFixedHeight(self._scale_size(70))
         card.setCursor(Qt.CursorShape.PointingHandCursor)
         card.clicked.connect(handler)
-
-        style = "background:rgba(255,255,255,0.15);" if selected else "background:rgba(255,255,255,0.05);"
-        card.setStyleSheet(
-            f"QPushButton{{{style}border:none;border-radius:0px;}}QPushButton:hover{{background:rgba(255,255,255,0.1);}}QPushButton:pressed{{background:rgba(255,255,255,0.05);}}")
+        card.setObjectName("option_card")
+        set_variant(card, "selected", selected)
 
         layout = QHBoxLayout(card)
         layout.setContentsMargins(self._scale_size(15), self._scale_size(12), self._scale_size(15), self._scale_size(12))
@@ -112,7 +112,6 @@ class UIBuilder:
         check_label = QLabel()
         check_label.setFixedSize(self._scale_size(20), self._scale_size(20))
         check_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        check_label.setStyleSheet("background:transparent;")
         check_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
 
         if selected:
@@ -126,14 +125,11 @@ class UIBuilder:
         text_layout.setSpacing(self._scale_size(4))
         text_layout.setContentsMargins(0, 0, 0, 0)
 
-        title_lbl = QLabel(title)
-        title_lbl.setStyleSheet(f"color:white;font-size:{self._scale_size(14)}px;font-family:'{self._get_font_family()}';background:transparent;")
+        title_lbl = self._translated_label(title_key, "card_title")
         title_lbl.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         text_layout.addWidget(title_lbl)
 
-        desc_lbl = QLabel(desc)
-        desc_lbl.setStyleSheet(
-            f"color:rgba(255,255,255,0.6);font-size:{self._scale_size(12)}px;font-family:'{self._get_font_family()}';background:transparent;")
+        desc_lbl = self._translated_label(desc_key, "card_desc")
         desc_lbl.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         text_layout.addWidget(desc_lbl)
 
@@ -143,9 +139,9 @@ class UIBuilder:
         card.check_label = check_label
         return card
 
-    def create_expandable_menu(self, title, desc, icon_path=None, icon_path_active=None, toggle_handler=None, content_attr="appearance"):
+    def create_expandable_menu(self, title_key, desc_key, icon_path=None, icon_path_active=None, toggle_handler=None, content_attr="appearance"):
         container = QWidget()
-        container.setStyleSheet("background:rgba(255,255,255,0.08);border-radius:8px;")
+        container.setObjectName("settings_group")
         main_layout = QVBoxLayout(container)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
@@ -157,10 +153,7 @@ class UIBuilder:
             header.clicked.connect(toggle_handler)
         else:
             header.clicked.connect(self.window.toggle_appearance_menu)
-
-        border_radius = self._scale_size(8)
-        header.setStyleSheet(
-            f"QPushButton{{background:transparent;border:none;border-top-left-radius:{border_radius}px;border-top-right-radius:{border_radius}px;}}QPushButton:hover{{background:rgba(255,255,255,0.05);}}QPushButton:pressed{{background:rgba(255,255,255,0.02);}}")
+        header.setObjectName("group_header")
 
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(self._scale_size(15), self._scale_size(12), self._scale_size(15), self._scale_size(12))
@@ -171,7 +164,6 @@ class UIBuilder:
             icon_label = QLabel()
             icon_label.setFixedSize(self._scale_size(20), self._scale_size(20))
             icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            icon_label.setStyleSheet("background:transparent;")
             icon_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
             icon_label.setObjectName("menu_icon")
 
@@ -185,14 +177,11 @@ class UIBuilder:
         text_layout.setSpacing(self._scale_size(4))
         text_layout.setContentsMargins(0, 0, 0, 0)
 
-        title_lbl = QLabel(title)
-        title_lbl.setStyleSheet(f"color:white;font-size:{self._scale_size(14)}px;font-family:'{self._get_font_family()}';background:transparent;")
+        title_lbl = self._translated_label(title_key, "card_title")
         title_lbl.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         text_layout.addWidget(title_lbl)
 
-        desc_lbl = QLabel(desc)
-        desc_lbl.setStyleSheet(
-            f"color:rgba(255,255,255,0.6);font-size:{self._scale_size(12)}px;font-family:'{self._get_font_family()}';background:transparent;")
+        desc_lbl = self._translated_label(desc_key, "card_desc")
         desc_lbl.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         text_layout.addWidget(desc_lbl)
 
@@ -207,7 +196,6 @@ class UIBuilder:
 
         content_widget = QWidget()
         content_widget.setLayout(content_layout)
-        content_widget.setStyleSheet("background:transparent;")
 
         main_layout.addWidget(content_widget)
 
@@ -218,69 +206,47 @@ class UIBuilder:
 
         return container
 
-    def create_config_page(self):
-        """创建设置页面"""
-        from PyQt6.QtWidgets import QScrollArea
-
-        page = QWidget()
-        page.setStyleSheet("background:transparent;")
-        pl = QVBoxLayout(page)
-        pl.setContentsMargins(self._scale_size(20), self._scale_size(10), self._scale_size(20), self._scale_size(20))
-        pl.setSpacing(self._scale_size(15))
+    def create_scroll_area(self, top_margin=0):
+        """创建页面的滚动区域，返回 (scroll_area, scroll_layout)
 
-        title = QLabel(self.window.language_manager.translate("page_settings"))
-        title.setStyleSheet(f"color:white;font-size:{self._scale_size(20)}px;font-family:'{self._get_font_family()}';font-weight:bold;")
-        pl.addWidget(title)
+        scroll_layout 末尾有一个 stretch，内容插入到它之前。
+        """
+        from PyQt6.QtWidgets import QScrollArea
 
-        # 创建滚动区域
         scroll_area = QScrollArea()
+        scroll_area.setObjectName("page_scroll")
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background: rgba(255, 255, 255, 0.1);
-                width: 8px;
-                border-radius: 4px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(255, 255, 255, 0.3);
-                min-height: 20px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(255, 255, 255, 0.5);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
 
         # 滚动内容区域
         scroll_content = QWidget()
-        scroll_content.setStyleSheet("background: transparent;")
+        scroll_content.setObjectName("page_content")
         scroll_layout = QVBoxLayout(scroll_content)
-        scroll_layout.setContentsMargins(0, 0, 0, 0)
+        scroll_layout.setContentsMargins(0, top_margin, 0, 0)
         scroll_layout.setSpacing(self._scale_size(15))
         scroll_layout.addStretch()
 
         scroll_area.setWidget(scroll_content)
+        return scroll_area, scroll_layout
+
+    def create_config_page(self):
+        """创建设置页面"""
+        page = QWidget()
+        pl = QVBoxLayout(page)
+        pl.setContentsMargins(self._scale_size(20), self._scale_size(10), self._scale_size(20), self._scale_size(20))
+        pl.setSpacing(self._scale_size(15))
+
+        title = self._translated_label("page_settings", "page_title")
+        pl.addWidget(title)
+
+        # 滚动区域
+        scroll_area, scroll_layout = self.create_scroll_area()
         pl.addWidget(scroll_area, 1)
 
         # 外观设置容器
         self.window.appearance_container = self.create_expandable_menu(
-            self.window.language_manager.translate("settings_appearance"),
-            self.window.language_manager.translate("settings_appearance_desc"),
+            "settings_appearance", "settings_appearance_desc",
             "svg/palette.svg", "svg/palette-fill.svg",
             content_attr="appearance"
         )
@@ -290,8 +256,7 @@ class UIBuilder:
 
         # 模糊背景卡片
         self.window.blur_card = self.create_bg_card(
-            self.window.language_manager.translate("background_blur"),
-            self.window.language_manager.translate("background_blur_desc"),
+            "background_blur", "background_blur_desc",
             self.window.config.get("background_mode") == "blur",
             lambda: self.window.set_background("blur")
         )
@@ -303,8 +268,7 @@ class UIBuilder:
 
         # 纯色背景卡片
         self.window.solid_card = self.create_bg_card(
-            self.window.language_manager.translate("background_solid"),
-            self.window.language_manager.translate("background_solid_desc"),
+            "background_solid", "background_solid_desc",
             self.window.config.get("background_mode") == "solid",
             lambda: self.window.set_background("solid")
         )
@@ -316,8 +280,7 @@ class UIBuilder:
 
         # 图片背景卡片
         self.window.image_card = self.create_bg_card(
-            self.window.language_manager.translate("background_image"),
-            self.window.language_manager.translate("background_image_desc"),
+            "background_image", "background_image_desc",
             self.window.config.get("background_mode") == "image",
             lambda: self.window.set_background("image")
         )
@@ -327,12 +290,15 @@ class UIBuilder:
         self._create_path_input()
         self.window.appearance_content_layout.addWidget(self.window.path_widget)
 
+        # 视频帧率上限滑块
+        self._create_video_fps_slider()
+        self.window.appearance_content_layout.addWidget(self.window.video_fps_widget)
+
         self.window.appearance_content.setVisible(False)
 
         # 语言设置容器
         self.window.language_container = self.create_expandable_menu(
-            self.window.language_manager.translate("settings_language"),
-            self.window.language_manager.translate("settings_language_desc"),
+            "settings_language", "settings_language_desc",
             "svg/translate.svg", "svg/file-earmark-font.svg",
             toggle_handler=self.window.toggle_language_menu,
             content_attr="language"
@@ -348,8 +314,7 @@ class UIBuilder:
 
         # 字体设置容器
         self.window.font_container = self.create_expandable_menu(
-            self.window.language_manager.translate("settings_font"),
-            self.window.language_manager.translate("settings_font_desc"),
+            "settings_font", "settings_font_desc",
             "svg/type.svg", "svg/file-earmark-font.svg",
             toggle_handler=self.window.toggle_font_menu,
             content_attr="font"
@@ -360,8 +325,7 @@ class UIBuilder:
 
         # 选择字体卡片
         self.window.font_select_card = self.create_bg_card(
-            self.window.language_manager.translate("font_select"),
-            self.window.language_manager.translate("font_select_desc"),
+            "font_select", "font_select_desc",
             self.window.config.get("font_mode") == 0,
             lambda: self.window.set_font_mode(0)
         )
@@ -373,8 +337,7 @@ class UIBuilder:
 
         # 自定义字体卡片
         self.window.font_custom_card = self.create_bg_card(
-            self.window.language_manager.translate("font_custom"),
-            self.window.language_manager.translate("font_custom_desc"),
+            "font_custom", "font_custom_desc",
             self.window.config.get("font_mode") == 1,
             lambda: self.window.set_font_mode(1)
         )
@@ -390,141 +353,49 @@ class UIBuilder:
 
     def create_instance_page(self):
         """创建实例页面"""
-        from PyQt6.QtWidgets import QScrollArea
-
         page = QWidget()
-        page.setStyleSheet("background:transparent;")
         pl = QVBoxLayout(page)
         pl.setContentsMargins(self._scale_size(20), self._scale_size(10), self._scale_size(20), self._scale_size(20))
         pl.setSpacing(self._scale_size(15))
 
-        title = QLabel(self.window.language_manager.translate("page_instances"))
-        title.setStyleSheet(f"color:white;font-size:{self._scale_size(20)}px;font-family:'{self._get_font_family()}';font-weight:bold;")
+        title = self._translated_label("page_instances", "page_title")
         pl.addWidget(title)
 
-        # 创建滚动区域
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background: rgba(255, 255, 255, 0.1);
-                width: 8px;
-                border-radius: 4px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(255, 255, 255, 0.3);
-                min-height: 20px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(255, 255, 255, 0.5);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
-
-        # 滚动内容区域
-        scroll_content = QWidget()
-        scroll_content.setStyleSheet("background: transparent;")
-        scroll_layout = QVBoxLayout(scroll_content)
-        scroll_layout.setContentsMargins(0, self._scale_size(10), 0, 0)
-        scroll_layout.setSpacing(self._scale_size(15))
-        scroll_layout.addStretch()
-
-        scroll_area.setWidget(scroll_content)
+        # 滚动区域
+        scroll_area, scroll_layout = self.create_scroll_area(self._scale_size(10))
         pl.addWidget(scroll_area, 1)
 
         return page
 
     def create_download_page(self):
         """创建下载页面"""
-        from PyQt6.QtWidgets import QScrollArea
-
         page = QWidget()
-        page.setStyleSheet("background:transparent;")
         pl = QVBoxLayout(page)
         pl.setContentsMargins(self._scale_size(20), self._scale_size(10), self._scale_size(20), self._scale_size(20))
         pl.setSpacing(self._scale_size(15))
 
-        title = QLabel(self.window.language_manager.translate("page_downloads"))
-        title.setStyleSheet(f"color:white;font-size:{self._scale_size(20)}px;font-family:'{self._get_font_family()}';font-weight:bold;")
+        title = self._translated_label("page_downloads", "page_title")
         pl.addWidget(title)
 
-        # 创建滚动区域
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background: rgba(255, 255, 255, 0.1);
-                width: 8px;
-                border-radius: 4px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(255, 255, 255, 0.3);
-                min-height: 20px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(255, 255, 255, 0.5);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
-
-        # 滚动内容区域
-        scroll_content = QWidget()
-        scroll_content.setStyleSheet("background: transparent;")
-        scroll_layout = QVBoxLayout(scroll_content)
-        scroll_layout.setContentsMargins(0, self._scale_size(10), 0, 0)
-        scroll_layout.setSpacing(self._scale_size(15))
-        scroll_layout.addStretch()
-
-        scroll_area.setWidget(scroll_content)
+        # 滚动区域
+        scroll_area, scroll_layout = self.create_scroll_area(self._scale_size(10))
         pl.addWidget(scroll_area, 1)
 
         return page
 
     def _create_opacity_slider(self):
         self.window.opacity_widget = QWidget()
-        border_radius = self._scale_size(8)
-        self.window.opacity_widget.setStyleSheet(f"background:rgba(255,255,255,0);border-bottom-left-radius:{border_radius}px;border-bottom-right-radius:{border_radius}px;")
         opacity_layout = QVBoxLayout(self.window.opacity_widget)
         opacity_layout.setContentsMargins(self._scale_size(35), self._scale_size(8), self._scale_size(15), self._scale_size(8))
         opacity_layout.setSpacing(self._scale_size(4))
 
         opacity_header_layout = QHBoxLayout()
-        opacity_label = QLabel(self.window.language_manager.translate("blur_opacity"))
-        opacity_label.setStyleSheet(f"color:rgba(255,255,255,0.8);font-size:{self._scale_size(13)}px;font-family:'{self._get_font_family()}';")
+        opacity_label = self._translated_label("blur_opacity", "setting_label")
         opacity_value = QLabel()
-        opacity_value.setText(str(int((self.window.config.get("blur_opacity", 150) - 10) / (255 - 10) * 100)) + "%")
-        opacity_value.setStyleSheet(f"color:rgba(255,255,255,0.8);font-size:{self._scale_size(13)}px;font-family:'{self._get_font_family()}';")
+        opacity_value.setText(self.format_opacity(self.window.config.get("blur_opacity", 80)))
+        opacity_value.setObjectName("setting_label")
         self.window.opacity_value_label = opacity_value
+        self.window.config_manager.subscribe("blur_opacity", lambda value: opacity_value.setText(self.format_opacity(value)))
         opacity_header_layout.addWidget(opacity_label)
         opacity_header_layout.addStretch()
         opacity_header_layout.addWidget(opacity_value)
@@ -532,42 +403,69 @@ class UIBuilder:
 
         self.window.opacity_slider = QSlider(Qt.Orientation.Horizontal)
         self.window.opacity_slider.setRange(10, 255)
-        self.window.opacity_slider.setValue(self.window.config.get("blur_opacity", 150))
-        self.window.opacity_slider.setStyleSheet(SLIDER_STYLE)
+        self.window.opacity_slider.setValue(self.window.config.get("blur_opacity", 80))
+        self.window.opacity_slider.setObjectName("setting_slider")
         self.window.opacity_slider.valueChanged.connect(self.window.on_opacity_changed)
         opacity_layout.addWidget(self.window.opacity_slider)
 
         self.window.opacity_widget.setVisible(self.window.config.get("background_mode") == "blur")
 
+    def format_opacity(self, value):
+        """不透明度滑块值（10-255）的百分比显示文本"""
+        return str(int((value - 10) / (255 - 10) * 100)) + "%"
+
+    def format_video_fps(self, value):
+        """帧率上限的显示文本，0 表示不限制"""
+        if value <= 0:
+            return self.window.language_manager.translate("video_fps_unlimited")
+        return f"{value} FPS"
+
+    def _create_video_fps_slider(self):
+        self.window.video_fps_widget = QWidget()
+        fps_layout = QVBoxLayout(self.window.video_fps_widget)
+        fps_layout.setContentsMargins(self._scale_size(35), self._scale_size(8), self._scale_size(15), self._scale_size(8))
+        fps_layout.setSpacing(self._scale_size(4))
+
+        fps_header_layout = QHBoxLayout()
+        fps_label = self._translated_label("video_max_fps", "setting_label")
+        fps_value = QLabel(self.format_video_fps(self.window.config.get("video_max_fps", 0)))
+        fps_value.setObjectName("setting_label")
+        self.window.video_fps_value_label = fps_value
+        self.translations.bind(fps_value, "video_fps_unlimited", lambda text: fps_value.setText(
+            self.format_video_fps(self.window.config.get("video_max_fps", 0))))
+        fps_header_layout.addWidget(fps_label)
+        fps_header_layout.addStretch()
+        fps_header_layout.addWidget(fps_value)
+        fps_layout.addLayout(fps_header_layout)
+
+        self.window.video_fps_slider = QSlider(Qt.Orientation.Horizontal)
+        self.window.video_fps_slider.setRange(0, 60)
+        self.window.video_fps_slider.setValue(self.window.config.get("video_max_fps", 0))
+        self.window.video_fps_slider.setObjectName("setting_slider")
+        self.window.video_fps_slider.valueChanged.connect(self.window.on_video_fps_changed)
+        fps_layout.addWidget(self.window.video_fps_slider)
+
+        self.window.video_fps_widget.setVisible(self.window.config.get("background_mode") == "image")
+
     def _create_path_input(self):
         self.window.path_widget = QWidget()
-        border_radius = self._scale_size(8)
-        self.window.path_widget.setStyleSheet(f"background:rgba(255,255,255,0);border-bottom-left-radius:{border_radius}px;border-bottom-right-radius:{border_radius}px;")
         path_layout = QHBoxLayout(self.window.path_widget)
         path_layout.setContentsMargins(self._scale_size(35), self._scale_size(12), self._scale_size(15), self._scale_size(12))
         path_layout.setSpacing(self._scale_size(10))
 
-        path_label = QLabel(self.window.language_manager.translate("bg_image_path"))
-        path_label.setStyleSheet(f"color:rgba(255,255,255,0.8);font-size:{self._scale_size(13)}px;font-family:'{self._get_font_family()}';")
+        path_label = self._translated_label("bg_image_path", "setting_label")
         path_layout.addWidget(path_label)
 
         self.window.path_input = QLineEdit()
         self.window.path_input.setText(self.window.config.get("background_image_path", ""))
-        padding = self._scale_size(6)
-        border_radius_input = self._scale_size(4)
-        self.window.path_input.setStyleSheet(
-            f"QLineEdit{{background:rgba(255,255,255,0.1);border:1px solid rgba(255,255,255,0.2);border-radius:{border_radius_input}px;padding:{padding}px;color:white;font-size:{self._scale_size(13)}px;font-family:'{self._get_font_family()}';}}")
+        self.window.path_input.setObjectName("setting_input")
         self.window.path_input.editingFinished.connect(self.window.on_path_changed)
         path_layout.addWidget(self.window.path_input, 1)
 
         # 浏览按钮
         browse_btn = ClickableLabel()
         browse_btn.setFixedSize(self._scale_size(32), self._scale_size(32))
-        border_radius_btn = self._scale_size(4)
-        browse_btn.setHoverStyle(
-            f"background:rgba(255,255,255,0.1);border:none;border-radius:{border_radius_btn}px;",
-            f"background:rgba(255,255,255,0.15);border:none;border-radius:{border_radius_btn}px;"
-        )
+        browse_btn.setObjectName("browse_btn")
         browse_btn.setAlignment(Qt.AlignmentFlag.AlignCenter)
         browse_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         browse_btn.setCallback(self.window.choose_background_image)
@@ -582,23 +480,17 @@ class UIBuilder:
 
     def _create_color_picker(self):
         self.window.color_widget = QWidget()
-        border_radius = self._scale_size(8)
-        self.window.color_widget.setStyleSheet(f"background:rgba(255,255,255,0);border-bottom-left-radius:{border_radius}px;border-bottom-right-radius:{border_radius}px;")
         color_layout = QHBoxLayout(self.window.color_widget)
         color_layout.setContentsMargins(self._scale_size(35), self._scale_size(12), self._scale_size(15), self._scale_size(12))
         color_layout.setSpacing(self._scale_size(10))
 
-        color_label = QLabel(self.window.language_manager.translate("bg_color"))
-        color_label.setStyleSheet(f"color:rgba(255,255,255,0.8);font-size:{self._scale_size(13)}px;font-family:'{self._get_font_family()}';")
+        color_label = self._translated_label("bg_color", "setting_label")
         color_layout.addWidget(color_label)
 
         # 颜色预览和输入
         self.window.color_input = QLineEdit()
         self.window.color_input.setText(self.window.config.get("background_color", "#00000000"))
-        padding = self._scale_size(6)
-        border_radius_input = self._scale_size(4)
-        self.window.color_input.setStyleSheet(
-            f"QLineEdit{{background:rgba(255,255,255,0.1);border:1px solid rgba(255,255,255,0.2);border-radius:{border_radius_input}px;padding:{padding}px;color:white;font-size:{self._scale_size(13)}px;font-family:'{self._get_font_family()}';}}")
+        self.window.color_input.setObjectName("setting_input")
         self.window.color_input.editingFinished.connect(self.window.on_color_changed)
         color_layout.addWidget(self.window.color_input, 1)
 
@@ -632,14 +524,11 @@ class UIBuilder:
 
     def _create_font_select_widget(self):
         self.window.font_select_widget = QWidget()
-        border_radius = self._scale_size(8)
-        self.window.font_select_widget.setStyleSheet(f"background:rgba(255,255,255,0);border-bottom-left-radius:{border_radius}px;border-bottom-right-radius:{border_radius}px;")
         font_select_layout = QHBoxLayout(self.window.font_select_widget)
         font_select_layout.setContentsMargins(self._scale_size(35), self._scale_size(12), self._scale_size(15), self._scale_size(12))
         font_select_layout.setSpacing(self._scale_size(10))
 
-        font_select_label = QLabel(self.window.language_manager.translate("font_select_label"))
-        font_select_label.setStyleSheet(f"color:rgba(255,255,255,0.8);font-size:{self._scale_size(13)}px;font-family:'{self._get_font_family()}';")
+        font_select_label = self._translated_label("font_select_label", "setting_label")
         font_select_layout.addWidget(font_select_label)
 
         font_select_layout.addStretch()
@@ -650,92 +539,8 @@ class UIBuilder:
         self.window.font_combo.setFixedHeight(self._scale_size(32))
         self.window.font_combo.setFixedWidth(self._scale_size(200))
         self.window.font_combo.setMaxVisibleItems(8)
-        padding = self._scale_size(6)
-        border_radius = self._scale_size(4)
-
-        # 获取当前下拉框透明度（主页透明度 + 20）
-        blur_opacity = self.window.config.get("blur_opacity", 150)
-        dropdown_opacity_value = min(255, blur_opacity + 20)
-        dropdown_opacity_rgba = dropdown_opacity_value / 255.0
-
-        self.window.font_combo.setStyleSheet(
-            f"QComboBox{{"
-            f"background:rgba(0,0,0,0.3);"
-            f"border:1px solid rgba(255,255,255,0.15);"
-            f"border-radius:{border_radius}px;"
-            f"padding:{padding}px;"
-            f"color:rgba(255,255,255,0.95);"
-            f"font-size:{self._scale_size(13)}px;"
-            f"font-family:'{self._get_font_family()}';"
-            f"}}"
-            f"QComboBox:hover{{"
-            f"background:rgba(0,0,0,0.4);"
-            f"border:1px solid rgba(255,255,255,0.25);"
-            f"}}"
-            f"QComboBox:focus{{"
-            f"background:rgba(0,0,0,0.5);"
-            f"border:1px solid rgba(100,150,255,0.6);"
-            f"}}"
-            f"QComboBox:on{{"
-            f"padding-top:{padding - 1}px;"
-            f"padding-bottom:{padding - 1}px;"
-            f"}}"
-            f"QComboBox::drop-down{{"
-            f"border:none;"
-            f"width:28px;"
-            f"background:transparent;"
-            f"}}"
-            # f"QComboBox::down-arrow{{"
-            # f"image:url(svg/x-diamond.svg);"
-            # f"width:12px;"
-            # f"height:12px;"
-            # f"}}"
-            f"QComboBox QAbstractItemView{{"
-            f"background:rgba(0,0,0,{dropdown_opacity_rgba:.2f});"
-            f"border:1px solid rgba(255,255,255,0.1);"
-            f"border-radius:{border_radius}px;"
-            f"selection-background-color:rgba(255,255,255,0.15);"
-            f"selection-color:white;"
-            f"outline:none;"
-            f"padding:{self._scale_size(2)}px;"
-            f"}}"
-            f"QComboBox QAbstractItemView::item{{"
-            f"height:{self._scale_size(28)}px;"
-            f"padding:{self._scale_size(6)}px {self._scale_size(8)}px;"
-            f"color:rgba(255,255,255,0.85);"
-            f"border-radius:{border_radius - 1}px;"
-            f"}}"
-            f"QComboBox QAbstractItemView::item:hover{{"
-            f"background:rgba(255,255,255,0.1);"
-            f"}}"
-            f"QComboBox QAbstractItemView::item:selected{{"
-            f"background:rgba(255,255,255,0.15);"
-            f"color:white;"
-            f"}}"
-            f"QComboBox QScrollBar:vertical{{"
-            f"background:rgba(255,255,255,0.05);"
-            f"width:8px;"
-            f"margin:0px;"
-            f"border-radius:4px;"
-            f"}}"
-            f"QComboBox QScrollBar::handle:vertical{{"
-            f"background:rgba(255,255,255,0.3);"
-            f"min-height:20px;"
-            f"border-radius:4px;"
-            f"}}"
-            f"QComboBox QScrollBar::handle:vertical:hover{{"
-            f"background:rgba(255,255,255,0.5);"
-            f"}}"
-            f"QComboBox QScrollBar::add-line:vertical,"
-            f"QComboBox QScrollBar::sub-line:vertical{{"
-            f"border:none;"
-            f"background:none;"
-            f"}}"
-            f"QComboBox QScrollBar::add-page:vertical,"
-            f"QComboBox QScrollBar::sub-page:vertical{{"
-            f"background:none;"
-            f"}}"
-        )
+        self.window.font_combo.setObjectName("setting_combo")
+        self.window.theme.bind_dropdown(self.window.font_combo)
         # 获取系统字体
         families = QFontDatabase.families()
         # 过滤一些常见的系统字体
@@ -766,33 +571,23 @@ class UIBuilder:
 
     def _create_font_path_widget(self):
         self.window.font_path_widget = QWidget()
-        border_radius = self._scale_size(8)
-        self.window.font_path_widget.setStyleSheet(f"background:rgba(255,255,255,0);border-bottom-left-radius:{border_radius}px;border-bottom-right-radius:{border_radius}px;")
         font_path_layout = QHBoxLayout(self.window.font_path_widget)
         font_path_layout.setContentsMargins(self._scale_size(35), self._scale_size(12), self._scale_size(15), self._scale_size(12))
         font_path_layout.setSpacing(self._scale_size(10))
 
-        font_path_label = QLabel(self.window.language_manager.translate("font_custom_label"))
-        font_path_label.setStyleSheet(f"color:rgba(255,255,255,0.8);font-size:{self._scale_size(13)}px;font-family:'{self._get_font_family()}';")
+        font_path_label = self._translated_label("font_custom_label", "setting_label")
         font_path_layout.addWidget(font_path_label)
 
         self.window.font_path_input = QLineEdit()
         self.window.font_path_input.setText(self.window.config.get("custom_font_path", ""))
-        padding = self._scale_size(6)
-        border_radius_input = self._scale_size(4)
-        self.window.font_path_input.setStyleSheet(
-            f"QLineEdit{{background:rgba(255,255,255,0.1);border:1px solid rgba(255,255,255,0.2);border-radius:{border_radius_input}px;padding:{padding}px;color:white;font-size:{self._scale_size(13)}px;font-family:'{self._get_font_family()}';}}")
+        self.window.font_path_input.setObjectName("setting_input")
         self.window.font_path_input.editingFinished.connect(self.window.on_font_path_changed)
         font_path_layout.addWidget(self.window.font_path_input, 1)
 
         # 浏览按钮
         browse_btn = ClickableLabel()
         browse_btn.setFixedSize(self._scale_size(32), self._scale_size(32))
-        border_radius_btn = self._scale_size(4)
-        browse_btn.setHoverStyle(
-            f"background:rgba(255,255,255,0.1);border:none;border-radius:{border_radius_btn}px;",
-            f"background:rgba(255,255,255,0.15);border:none;border-radius:{border_radius_btn}px;"
-        )
+        browse_btn.setObjectName("browse_btn")
         browse_btn.setAlignment(Qt.AlignmentFlag.AlignCenter)
         browse_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         browse_btn.setCallback(self.window.choose_font_file)
@@ -809,13 +604,11 @@ class UIBuilder:
 
     def _create_language_card(self):
         language_widget = QWidget()
-        language_widget.setStyleSheet(f"background:rgba(255,255,255,0);border-bottom-left-radius:{self._scale_size(8)}px;border-bottom-right-radius:{self._scale_size(8)}px;")
         language_layout = QHBoxLayout(language_widget)
         language_layout.setContentsMargins(self._scale_size(35), self._scale_size(12), self._scale_size(15), self._scale_size(12))
         language_layout.setSpacing(self._scale_size(10))
 
-        language_label = QLabel(self.window.language_manager.translate("settings_language_label"))
-        language_label.setStyleSheet(f"color:rgba(255,255,255,0.8);font-size:{self._scale_size(13)}px;font-family:'{self._get_font_family()}';")
+        language_label = self._translated_label("settings_language_label", "setting_label")
         language_layout.addWidget(language_label)
 
         language_layout.addStretch()
@@ -825,104 +618,10 @@ class UIBuilder:
         self.window.language_combo.setFixedHeight(self._scale_size(32))
         self.window.language_combo.setFixedWidth(self._scale_size(150))
         self.window.language_combo.setMaxVisibleItems(5)
-        padding = self._scale_size(6)
-        border_radius = self._scale_size(4)
-
-        # 获取当前下拉框透明度（主页透明度 + 20）
-        blur_opacity = self.window.config.get("blur_opacity", 150)
-        dropdown_opacity_value = min(255, blur_opacity + 20)
-        dropdown_opacity_rgba = dropdown_opacity_value / 255.0
-
-        self.window.language_combo.setStyleSheet(
-            f"QComboBox{{"
-            f"background:rgba(0,0,0,0.3);"
-            f"border:1px solid rgba(255,255,255,0.15);"
-            f"border-radius:{border_radius}px;"
-            f"padding:{padding}px;"
-            f"color:rgba(255,255,255,0.95);"
-            f"font-size:{self._scale_size(13)}px;"
-            f"font-family:'{self._get_font_family()}';"
-            f"}}"
-            f"QComboBox:hover{{"
-            f"background:rgba(0,0,0,0.4);"
-            f"border:1px solid rgba(255,255,255,0.25);"
-            f"}}"
-            f"QComboBox:focus{{"
-            f"background:rgba(0,0,0,0.5);"
-            f"border:1px solid rgba(100,150,255,0.6);"
-            f"}}"
-            f"QComboBox:on{{"
-            f"padding-top:{padding - 1}px;"
-            f"padding-bottom:{padding - 1}px;"
-            f"}}"
-            f"QComboBox::drop-down{{"
-            f"border:none;"
-            f"width:28px;"
-            f"background:transparent;"
-            f"}}"
-            # f"QComboBox::down-arrow{{"
-            # f"image:url(svg/x-diamond.svg);"
-            # f"width:12px;"
-            # f"height:12px;"
-            # f"}}"
-            f"QComboBox QAbstractItemView{{"
-            f"background:rgba(0,0,0,{dropdown_opacity_rgba:.2f});"
-            f"border:1px solid rgba(255,255,255,0.1);"
-            f"border-radius:{border_radius}px;"
-            f"selection-background-color:rgba(255,255,255,0.15);"
-            f"selection-color:white;"
-            f"outline:none;"
-            f"padding:{self._scale_size(2)}px;"
-            f"}}"
-            f"QComboBox QAbstractItemView::item{{"
-            f"height:{self._scale_size(28)}px;"
-            f"padding:{self._scale_size(6)}px {self._scale_size(8)}px;"
-            f"color:rgba(255,255,255,0.85);"
-            f"border-radius:{border_radius - 1}px;"
-            f"}}"
-            f"QComboBox QAbstractItemView::item:hover{{"
-            f"background:rgba(255,255,255,0.1);"
-            f"}}"
-            f"QComboBox QAbstractItemView::item:selected{{"
-            f"background:rgba(255,255,255,0.15);"
-            f"color:white;"
-            f"}}"
-            f"QComboBox QScrollBar:vertical{{"
-            f"background:rgba(255,255,255,0.05);"
-            f"width:8px;"
-            f"margin:0px;"
-            f"border-radius:4px;"
-            f"}}"
-            f"QComboBox QScrollBar::handle:vertical{{"
-            f"background:rgba(255,255,255,0.3);"
-            f"min-height:20px;"
-            f"border-radius:4px;"
-            f"}}"
-            f"QComboBox QScrollBar::handle:vertical:hover{{"
-            f"background:rgba(255,255,255,0.5);"
-            f"}}"
-            f"QComboBox QScrollBar::add-line:vertical,"
-            f"QComboBox QScrollBar::sub-line:vertical{{"
-            f"border:none;"
-            f"background:none;"
-            f"}}"
-            f"QComboBox QScrollBar::add-page:vertical,"
-            f"QComboBox QScrollBar::sub-page:vertical{{"
-            f"background:none;"
-            f"}}"
-        )
-        # 添加语言选项
-        languages = self.window.language_manager.get_all_languages()
-        for lang_code, display_name in languages:
-            self.window.language_combo.addItem(display_name, lang_code)
-        
-        # 设置当前语言
-        current_lang = self.window.language_manager.get_language()
-        for i in range(self.window.language_combo.count()):
-            if self.window.language_combo.itemData(i) == current_lang:
-                self.window.language_combo.setCurrentIndex(i)
-                break
-        
+        self.window.language_combo.setObjectName("setting_combo")
+        self.window.theme.bind_dropdown(self.window.language_combo)
+        self._fill_language_combo(self.window.language_combo)
+
         # 连接语言切换事件
         self.window.language_combo.currentIndexChanged.connect(self.window.change_language)
 
@@ -932,514 +631,26 @@ class UIBuilder:
 
         return language_widget
     
-    def _update_page_titles(self):
-        """更新页面标题"""
-        # 主页没有标题，跳过
-        
-        # 更新实例页面标题
-        instance_page = self.window.stack.widget(1)
-        if instance_page and instance_page.layout():
-            title = instance_page.layout().itemAt(0).widget()
-            if title and hasattr(title, 'setText'):
-                title.setText(self.window.language_manager.translate("page_instances"))
-        
-        # 更新下载页面标题
-        download_page = self.window.stack.widget(2)
-        if download_page and download_page.layout():
-            title = download_page.layout().itemAt(0).widget()
-            if title and hasattr(title, 'setText'):
-                title.setText(self.window.language_manager.translate("page_downloads"))
-        
-        # 更新设置页面标题
-        settings_page = self.window.stack.widget(3)
-        if settings_page and settings_page.layout():
-            title = settings_page.layout().itemAt(0).widget()
-            if title and hasattr(title, 'setText'):
-                title.setText(self.window.language_manager.translate("page_settings"))
-    
-    def _update_settings_page(self):
-        """更新设置页面的文本"""
-        settings_page = self.window.stack.widget(3)
-        if not settings_page or not settings_page.layout():
-            return
-        
-        layout = settings_page.layout()
-        
-        # 更新外观设置容器
-        appearance_header = self.window.appearance_container.layout().itemAt(0).widget()
-        if appearance_header and appearance_header.layout():
-            header_layout = appearance_header.layout()
-            # 查找文本布局
-            for i in range(header_layout.count()):
-                item = header_layout.itemAt(i)
-                if item and isinstance(item.layout(), QVBoxLayout):
-                    text_layout = item.layout()
-                    # 第一个是标题，第二个是描述
-                    if text_layout.count() >= 2:
-                        title = text_layout.itemAt(0).widget()
-                        desc = text_layout.itemAt(1).widget()
-                        title.setText(self.window.language_manager.translate("settings_appearance"))
-                        desc.setText(self.window.language_manager.translate("settings_appearance_desc"))
-                        break
-        
-        # 更新背景卡片
-        self._update_bg_card(self.window.blur_card, "background_blur", "background_blur_desc")
-        self._update_bg_card(self.window.solid_card, "background_solid", "background_solid_desc")
-        self._update_bg_card(self.window.image_card, "background_image", "background_image_desc")
-        
-        # 更新透明度标签
-        if hasattr(self.window, 'opacity_widget'):
-            opacity_layout = self.window.opacity_widget.layout()
-            if opacity_layout and opacity_layout.count() > 0:
-                header_layout = opacity_layout.itemAt(0)
-                if header_layout and isinstance(header_layout, QHBoxLayout):
-                    label = header_layout.itemAt(0).widget()
-                    label.setText(self.window.language_manager.translate("blur_opacity"))
-        
-        # 更新路径标签
-        if hasattr(self.window, 'path_widget'):
-            path_layout = self.window.path_widget.layout()
-            if path_layout and path_layout.count() > 0:
-                label = path_layout.itemAt(0).widget()
-                label.setText(self.window.language_manager.translate("bg_image_path"))
-        
-        # 更新颜色标签
-        if hasattr(self.window, 'color_widget'):
-            color_layout = self.window.color_widget.layout()
-            if color_layout and color_layout.count() > 0:
-                label = color_layout.itemAt(0).widget()
-                label.setText(self.window.language_manager.translate("bg_color"))
-        
-        # 更新语言设置容器
-        language_header = self.window.language_container.layout().itemAt(0).widget()
-        if language_header and language_header.layout():
-            header_layout = language_header.layout()
-            # 查找文本布局
-            for i in range(header_layout.count()):
-                item = header_layout.itemAt(i)
-                if item and isinstance(item.layout(), QVBoxLayout):
-                    text_layout = item.layout()
-                    # 第一个是标题，第二个是描述
-                    if text_layout.count() >= 2:
-                        title = text_layout.itemAt(0).widget()
-                        desc = text_layout.itemAt(1).widget()
-                        if title and hasattr(title, 'setText'):
-                            title.setText(self.window.language_manager.translate("settings_language"))
-                        if desc and hasattr(desc, 'setText'):
-                            desc.setText(self.window.language_manager.translate("settings_language_desc"))
-                        break
-
-        # 更新语言标签
-        if hasattr(self.window, 'language_content_layout'):
-            if self.window.language_content_layout.count() > 0:
-                language_widget = self.window.language_content_layout.itemAt(0).widget()
-                if language_widget and language_widget.layout():
-                    label = language_widget.layout().itemAt(0).widget()
-                    if label and hasattr(label, 'setText'):
-                        label.setText(self.window.language_manager.translate("settings_language_label"))
-
-        # 更新字体设置容器
-        font_header = self.window.font_container.layout().itemAt(0).widget()
-        if font_header and font_header.layout():
-            header_layout = font_header.layout()
-            for i in range(header_layout.count()):
-                item = header_layout.itemAt(i)
-                if item and isinstance(item.layout(), QVBoxLayout):
-                    text_layout = item.layout()
-                    if text_layout.count() >= 2:
-                        title = text_layout.itemAt(0).widget()
-                        desc = text_layout.itemAt(1).widget()
-                        if title and hasattr(title, 'setText'):
-                            title.setText(self.window.language_manager.translate("settings_font"))
-                        if desc and hasattr(desc, 'setText'):
-                            desc.setText(self.window.language_manager.translate("settings_font_desc"))
-                        break
-
-        # 更新字体卡片
-        self._update_bg_card(self.window.font_select_card, "font_select", "font_select_desc")
-        self._update_bg_card(self.window.font_custom_card, "font_custom", "font_custom_desc")
-
-        # 更新字体选择标签
-        if hasattr(self.window, 'font_select_widget'):
-            font_select_layout = self.window.font_select_widget.layout()
-            if font_select_layout and font_select_layout.count() > 0:
-                label = font_select_layout.itemAt(0).widget()
-                if label and hasattr(label, 'setText'):
-                    label.setText(self.window.language_manager.translate("font_select_label"))
-
-        # 更新字体路径标签
-        if hasattr(self.window, 'font_path_widget'):
-            font_path_layout = self.window.font_path_widget.layout()
-            if font_path_layout and font_path_layout.count() > 0:
-                label = font_path_layout.itemAt(0).widget()
-                if label and hasattr(label, 'setText'):
-                    label.setText(self.window.language_manager.translate("font_custom_label"))
-
-    def _update_settings_font(self, font_family):
-        """更新设置页面的字体"""
-        # 转义字体名称中的特殊字符
-        escaped_font = font_family.replace("\\", "\\\\").replace("'", "\\'").replace('"', '\\"')
-        font_family_quoted = f'"{escaped_font}"'
-
-        # 更新设置页面标题
-        settings_page = self.window.stack.widget(3)
-        if settings_page and settings_page.layout():
-            title = settings_page.layout().itemAt(0).widget()
-            if title:
-                title.setStyleSheet(f"color:white;font-size:{self._scale_size(20)}px;font-family:{font_family_quoted};font-weight:bold;")
-
-        # 更新其他页面标题（主页没有标题，实例和下载页面的标题在 itemAt(0)）
-        for i in [1, 2]:  # 实例页面和下载页面
-            page = self.window.stack.widget(i)
-            if page and page.layout():
-                title = page.layout().itemAt(0).widget()
-                if title and hasattr(title, 'setText'):
-                    title.setStyleSheet(f"color:white;font-size:{self._scale_size(20)}px;font-family:{font_family_quoted};font-weight:bold;")
-
-        # 更新外观设置容器的标题和描述
-        if hasattr(self.window, 'appearance_container'):
-            self._update_expandable_menu_font(self.window.appearance_container, font_family)
-
-        # 更新语言设置容器的标题和描述
-        if hasattr(self.window, 'language_container'):
-            self._update_expandable_menu_font(self.window.language_container, font_family)
-
-        # 更新字体设置容器的标题和描述
-        if hasattr(self.window, 'font_container'):
-            self._update_expandable_menu_font(self.window.font_container, font_family)
-
-        # 更新所有卡片的标题和描述
-        if hasattr(self.window, 'blur_card'):
-            self._update_bg_card_font(self.window.blur_card, font_family)
-        if hasattr(self.window, 'solid_card'):
-            self._update_bg_card_font(self.window.solid_card, font_family)
-        if hasattr(self.window, 'image_card'):
-            self._update_bg_card_font(self.window.image_card, font_family)
-        if hasattr(self.window, 'font_select_card'):
-            self._update_bg_card_font(self.window.font_select_card, font_family)
-        if hasattr(self.window, 'font_custom_card'):
-            self._update_bg_card_font(self.window.font_custom_card, font_family)
-
-        # 更新透明度标签
-        if hasattr(self.window, 'opacity_widget'):
-            opacity_layout = self.window.opacity_widget.layout()
-            if opacity_layout and opacity_layout.count() > 0:
-                header_layout = opacity_layout.itemAt(0)
-                if header_layout and isinstance(header_layout, QHBoxLayout):
-                    label = header_layout.itemAt(0).widget()
-                    if label:
-                        label.setStyleSheet(f"color:rgba(255,255,255,0.8);font-size:{self._scale_size(13)}px;font-family:{font_family_quoted};")
-                    value_label = header_layout.itemAt(1).widget()
-                    if value_label:
-                        value_label.setStyleSheet(f"color:rgba(255,255,255,0.8);font-size:{self._scale_size(13)}px;font-family:{font_family_quoted};")
-
-        # 更新路径标签
-        if hasattr(self.window, 'path_widget'):
-            path_layout = self.window.path_widget.layout()
-            if path_layout and path_layout.count() > 0:
-                label = path_layout.itemAt(0).widget()
-                if label:
-                    label.setStyleSheet(f"color:rgba(255,255,255,0.8);font-size:{self._scale_size(13)}px;font-family:{font_family_quoted};")
-                # 更新输入框（直接从 window 属性获取）
-                if hasattr(self.window, 'path_input'):
-                    padding = self._scale_size(6)
-                    border_radius_input = self._scale_size(4)
-                    self.window.path_input.setStyleSheet(
-                        f"QLineEdit{{background:rgba(255,255,255,0.1);border:1px solid rgba(255,255,255,0.2);border-radius:{border_radius_input}px;padding:{padding}px;color:white;font-size:{self._scale_size(13)}px;font-family:{font_family_quoted};}}")
-
-        # 更新颜色标签
-        if hasattr(self.window, 'color_widget'):
-            color_layout = self.window.color_widget.layout()
-            if color_layout and color_layout.count() > 0:
-                label = color_layout.itemAt(0).widget()
-                if label:
-                    label.setStyleSheet(f"color:rgba(255,255,255,0.8);font-size:{self._scale_size(13)}px;font-family:{font_family_quoted};")
-                # 更新输入框（直接从 window 属性获取）
-                if hasattr(self.window, 'color_input'):
-                    padding = self._scale_size(6)
-                    border_radius_input = self._scale_size(4)
-                    self.window.color_input.setStyleSheet(
-                        f"QLineEdit{{background:rgba(255,255,255,0.1);border:1px solid rgba(255,255,255,0.2);border-radius:{border_radius_input}px;padding:{padding}px;color:white;font-size:{self._scale_size(13)}px;font-family:{font_family_quoted};}}")
-
-        # 更新字体选择标签
-        if hasattr(self.window, 'font_select_widget'):
-            font_select_layout = self.window.font_select_widget.layout()
-            if font_select_layout and font_select_layout.count() > 0:
-                label = font_select_layout.itemAt(0).widget()
-                if label:
-                    label.setStyleSheet(f"color:rgba(255,255,255,0.8);font-size:{self._scale_size(13)}px;font-family:{font_family_quoted};")
-                # 更新 QComboBox 字体（直接从 window 属性获取）
-                if hasattr(self.window, 'font_combo'):
-                    self._update_combobox_font(self.window.font_combo, font_family_quoted)
-
-        # 更新字体路径标签
-        if hasattr(self.window, 'font_path_widget'):
-            font_path_layout = self.window.font_path_widget.layout()
-            if font_path_layout and font_path_layout.count() > 0:
-                label = font_path_layout.itemAt(0).widget()
-                if label:
-                    label.setStyleSheet(f"color:rgba(255,255,255,0.8);font-size:{self._scale_size(13)}px;font-family:{font_family_quoted};")
-                # 更新输入框（直接从 window 属性获取）
-                if hasattr(self.window, 'font_path_input'):
-                    padding = self._scale_size(6)
-                    border_radius_input = self._scale_size(4)
-                    self.window.font_path_input.setStyleSheet(
-                        f"QLineEdit{{background:rgba(255,255,255,0.1);border:1px solid rgba(255,255,255,0.2);border-radius:{border_radius_input}px;padding:{padding}px;color:white;font-size:{self._scale_size(13)}px;font-family:{font_family_quoted};}}")
-
-        # 更新语言标签
-        if hasattr(self.window, 'language_content_layout'):
-            if self.window.language_content_layout.count() > 0:
-                language_widget = self.window.language_content_layout.itemAt(0).widget()
-                if language_widget and language_widget.layout():
-                    label = language_widget.layout().itemAt(0).widget()
-                    if label:
-                        label.setStyleSheet(f"color:rgba(255,255,255,0.8);font-size:{self._scale_size(13)}px;font-family:{font_family_quoted};")
-                    # 更新语言 QComboBox 字体（直接从 window 属性获取）
-                    if hasattr(self.window, 'language_combo'):
-                        self._update_combobox_font(self.window.language_combo, font_family_quoted)
-
-    def _update_combobox_font(self, combo_widget, font_family_quoted):
-        """更新 QComboBox 的字体"""
-        padding = self._scale_size(6)
-        border_radius = self._scale_size(4)
-        combo_widget.setStyleSheet(
-            f"QComboBox{{"
-            f"background:rgba(0,0,0,0.3);"
-            f"border:1px solid rgba(255,255,255,0.15);"
-            f"border-radius:{border_radius}px;"
-            f"padding:{padding}px;"
-            f"color:rgba(255,255,255,0.95);"
-            f"font-size:{self._scale_size(13)}px;"
-            f"font-family:{font_family_quoted};"
-            f"}}"
-            f"QComboBox:hover{{"
-            f"background:rgba(0,0,0,0.4);"
-            f"border:1px solid rgba(255,255,255,0.25);"
-            f"}}"
-            f"QComboBox:focus{{"
-            f"background:rgba(0,0,0,0.5);"
-            f"border:1px solid rgba(100,150,255,0.6);"
-            f"}}"
-            f"QComboBox:on{{"
-            f"padding-top:{padding - 1}px;"
-            f"padding-bottom:{padding - 1}px;"
-            f"}}"
-            f"QComboBox::drop-down{{"
-            f"border:none;"
-            f"width:28px;"
-            f"background:transparent;"
-            f"}}"
-            # f"QComboBox::down-arrow{{"
-            # f"image:url(svg/x-diamond.svg);"
-            # f"width:12px;"
-            # f"height:12px;"
-            # f"}}"
-            f"QComboBox QAbstractItemView{{"
-            f"background:rgba(0,0,0,0.5);"
-            f"border:1px solid rgba(255,255,255,0.1);"
-            f"border-radius:{border_radius}px;"
-            f"selection-background-color:rgba(255,255,255,0.15);"
-            f"selection-color:white;"
-            f"outline:none;"
-            f"padding:{self._scale_size(2)}px;"
-            f"font-family:{font_family_quoted};"
-            f"}}"
-            f"QComboBox QAbstractItemView::item{{"
-            f"height:{self._scale_size(28)}px;"
-            f"padding:{self._scale_size(6)}px {self._scale_size(8)}px;"
-            f"color:rgba(255,255,255,0.85);"
-            f"border-radius:{border_radius - 1}px;"
-            f"font-family:{font_family_quoted};"
-            f"}}"
-            f"QComboBox QAbstractItemView::item:hover{{"
-            f"background:rgba(255,255,255,0.1);"
-            f"}}"
-            f"QComboBox QAbstractItemView::item:selected{{"
-            f"background:rgba(255,255,255,0.15);"
-            f"color:white;"
-            f"}}"
-            f"QComboBox QScrollBar:vertical{{"
-            f"background:rgba(255,255,255,0.05);"
-            f"width:8px;"
-            f"margin:0px;"
-            f"border-radius:4px;"
-            f"}}"
-            f"QComboBox QScrollBar::handle:vertical{{"
-            f"background:rgba(255,255,255,0.3);"
-            f"min-height:20px;"
-            f"border-radius:4px;"
-            f"}}"
-            f"QComboBox QScrollBar::handle:vertical:hover{{"
-            f"background:rgba(255,255,255,0.5);"
-            f"}}"
-            f"QComboBox QScrollBar::add-line:vertical,"
-            f"QComboBox QScrollBar::sub-line:vertical{{"
-            f"border:none;"
-            f"background:none;"
-            f"}}"
-            f"QComboBox QScrollBar::add-page:vertical,"
-            f"QComboBox QScrollBar::sub-page:vertical{{"
-            f"background:none;"
-            f"}}"
-        )
+    def _fill_language_combo(self, combo):
+        """填充语言选项并选中当前语言"""
+        # 添加语言选项
+        languages = self.window.language_manager.get_all_languages()
+        for lang_code, display_name in languages:
+            combo.addItem(display_name, lang_code)
 
-    def _update_expandable_menu_font(self, container, font_family):
-        """更新可展开菜单的字体"""
-        # 转义字体名称中的特殊字符
-        escaped_font = font_family.replace("\\", "\\\\").replace("'", "\\'").replace('"', '\\"')
-        font_family_quoted = f'"{escaped_font}"'
-
-        header = container.layout().itemAt(0).widget()
-        if header and header.layout():
-            header_layout = header.layout()
-            # 查找文本布局
-            for i in range(header_layout.count()):
-                item = header_layout.itemAt(i)
-                if item and isinstance(item.layout(), QVBoxLayout):
-                    text_layout = item.layout()
-                    # 第一个是标题，第二个是描述
-                    if text_layout.count() >= 2:
-                        title = text_layout.itemAt(0).widget()
-                        desc = text_layout.itemAt(1).widget()
-                        if title and hasattr(title, 'setStyleSheet'):
-                            title.setStyleSheet(f"color:white;font-size:{self._scale_size(14)}px;font-family:{font_family_quoted};background:transparent;")
-                        if desc and hasattr(desc, 'setStyleSheet'):
-                            desc.setStyleSheet(f"color:rgba(255,255,255,0.6);font-size:{self._scale_size(12)}px;font-family:{font_family_quoted};background:transparent;")
-                        break
-
-    def _update_bg_card_font(self, card, font_family):
-        """更新卡片字体的样式"""
-        # 转义字体名称中的特殊字符
-        escaped_font = font_family.replace("\\", "\\\\").replace("'", "\\'").replace('"', '\\"')
-        font_family_quoted = f'"{escaped_font}"'
-
-        if not card or not card.layout():
-            return
+        # 设置当前语言
+        current_lang = self.window.language_manager.get_language()
+        for i in range(combo.count()):
+            if combo.itemData(i) == current_lang:
+                combo.setCurrentIndex(i)
+                break
 
-        card_layout = card.layout()
-        if card_layout.count() >= 2:
-            text_container = card_layout.itemAt(1).layout()
-            if text_container and text_container.count() >= 2:
-                title = text_container.itemAt(0).widget()
-                desc = text_container.itemAt(1).widget()
-                if title and hasattr(title, 'setStyleSheet'):
-                    title.setStyleSheet(f"color:white;font-size:{self._scale_size(14)}px;font-family:{font_family_quoted};background:transparent;")
-                if desc and hasattr(desc, 'setStyleSheet'):
-                    desc.setStyleSheet(f"color:rgba(255,255,255,0.6);font-size:{self._scale_size(12)}px;font-family:{font_family_quoted};background:transparent;")
-
-    def _update_bg_card(self, card, title_key, desc_key):
-        """更新背景卡片的文本"""
-        if not card or not card.layout():
+    def update_language_combo(self):
+        """语言列表变化后重新填充语言下拉框（不触发切换语言）"""
+        if not hasattr(self.window, 'language_combo'):
             return
-
-        card_layout = card.layout()
-        if card_layout.count() >= 2:
-            text_container = card_layout.itemAt(1).layout()
-            if text_container and text_container.count() >= 2:
-                title = text_container.itemAt(0).widget()
-                desc = text_container.itemAt(1).widget()
-                if title and hasattr(title, 'setText'):
-                    title.setText(self.window.language_manager.translate(title_key))
-                if desc and hasattr(desc, 'setText'):
-                    desc.setText(self.window.language_manager.translate(desc_key))
-
-    def update_combobox_opacity(self, opacity_rgba):
-        """更新下拉框的透明度"""
-        # 更新字体选择下拉框
-        if hasattr(self.window, 'font_combo'):
-            self._update_single_combobox_opacity(self.window.font_combo, opacity_rgba)
-        # 更新语言选择下拉框
-        if hasattr(self.window, 'language_combo'):
-            self._update_single_combobox_opacity(self.window.language_combo, opacity_rgba)
-
-    def _update_single_combobox_opacity(self, combo, opacity_rgba):
-        """更新单个下拉框的透明度"""
-        # 获取当前字体
-        font_family = self._get_font_family()
-        # 转义字体名称中的特殊字符
-        escaped_font = font_family.replace("\\", "\\\\").replace("'", "\\'").replace('"', '\\"')
-        font_family_quoted = f'"{escaped_font}"'
-
-        padding = self._scale_size(6)
-        border_radius = self._scale_size(4)
-
-        combo.setStyleSheet(
-            f"QComboBox{{"
-            f"background:rgba(0,0,0,0.3);"
-            f"border:1px solid rgba(255,255,255,0.15);"
-            f"border-radius:{border_radius}px;"
-            f"padding:{padding}px;"
-            f"color:rgba(255,255,255,0.95);"
-            f"font-size:{self._scale_size(13)}px;"
-            f"font-family:{font_family_quoted};"
-            f"}}"
-            f"QComboBox:hover{{"
-            f"background:rgba(0,0,0,0.4);"
-            f"border:1px solid rgba(255,255,255,0.25);"
-            f"}}"
-            f"QComboBox:focus{{"
-            f"background:rgba(0,0,0,0.5);"
-            f"border:1px solid rgba(100,150,255,0.6);"
-            f"}}"
-            f"QComboBox:on{{"
-            f"padding-top:{padding - 1}px;"
-            f"padding-bottom:{padding - 1}px;"
-            f"}}"
-            f"QComboBox::drop-down{{"
-            f"border:none;"
-            f"width:28px;"
-            f"background:transparent;"
-            f"}}"
-            # f"QComboBox::down-arrow{{"
-            # f"image:url(svg/x-diamond.svg);"
-            # f"width:12px;"
-            # f"height:12px;"
-            # f"}}"
-            f"QComboBox QAbstractItemView{{"
-            f"background:rgba(0,0,0,{opacity_rgba:.2f});"
-            f"border:1px solid rgba(255,255,255,0.1);"
-            f"border-radius:{border_radius}px;"
-            f"selection-background-color:rgba(255,255,255,0.15);"
-            f"selection-color:white;"
-            f"outline:none;"
-            f"padding:{self._scale_size(2)}px;"
-            f"font-family:{font_family_quoted};"
-            f"}}"
-            f"QComboBox QAbstractItemView::item{{"
-            f"height:{self._scale_size(28)}px;"
-            f"padding:{self._scale_size(6)}px {self._scale_size(8)}px;"
-            f"color:rgba(255,255,255,0.85);"
-            f"border-radius:{border_radius - 1}px;"
-            f"font-family:{font_family_quoted};"
-            f"}}"
-            f"QComboBox QAbstractItemView::item:hover{{"
-            f"background:rgba(255,255,255,0.1);"
-            f"}}"
-            f"QComboBox QAbstractItemView::item:selected{{"
-            f"background:rgba(255,255,255,0.15);"
-            f"color:white;"
-            f"}}"
-            f"QComboBox QScrollBar:vertical{{"
-            f"background:rgba(255,255,255,0.05);"
-            f"width:8px;"
-            f"margin:0px;"
-            f"border-radius:4px;"
-            f"}}"
-            f"QComboBox QScrollBar::handle:vertical{{"
-            f"background:rgba(255,255,255,0.3);"
-            f"min-height:20px;"
-            f"border-radius:4px;"
-            f"}}"
-            f"QComboBox QScrollBar::handle:vertical:hover{{"
-            f"background:rgba(255,255,255,0.5);"
-            f"}}"
-            f"QComboBox QScrollBar::add-line:vertical,"
-            f"QComboBox QScrollBar::sub-line:vertical{{"
-            f"border:none;"
-            f"background:none;"
-            f"}}"
-            f"QComboBox QScrollBar::add-page:vertical,"
-            f"QComboBox QScrollBar::sub-page:vertical{{"
-            f"background:none;"
-            f"}}"
-        )
+        combo = self.window.language_combo
+        combo.blockSignals(True)
+        combo.clear()
+        self._fill_language_combo(combo)
+        combo.blockSignals(False)
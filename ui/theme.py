@@ -0,0 +1,101 @@
+"""应用样式表与主题"""
+
+from string import Template
+
+from PyQt6 import sip
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QApplication
+
+from styles import APP_STYLE_TEMPLATE, DROPDOWN_STYLE_TEMPLATE
+
+ACCENT_COLOR = "#a0a0ff"
+# 模板中使用的缩放尺寸（$s1, $s2, ...）
+SCALED_SIZES = (1, 2, 4, 6, 8, 11, 12, 13, 14, 16, 20, 28)
+
+
+def set_variant(widget, name, value):
+    """设置控件的样式变体（动态属性），只重新计算该控件的样式"""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
+
+
+class Theme:
+    """主题变量：DPI 缩放、强调色、字体和透明度
+
+    样式表由模板生成，在创建控件之前整体设置到 QApplication。替换应用样式表会让 Qt
+    重新计算所有控件的样式，因此运行时会变化的变量不写入应用样式表：
+    字体通过 QApplication.setFont 传播到各控件（样式表规则只指定字号，需要在创建
+    QApplication 之前开启 AA_UseStyleSheetPropagationInWidgetStyles），
+    透明度只重新设置各下拉列表自身的样式表。
+    """
+
+    def __init__(self, dpi_scale=1.0, font_family="Microsoft YaHei UI", opacity=150, accent=ACCENT_COLOR):
+        self.dpi_scale = dpi_scale
+        self.font_family = font_family
+        self.opacity = opacity
+        self.accent = accent
+        self._template = Template(APP_STYLE_TEMPLATE)
+        self._dropdown_template = Template(DROPDOWN_STYLE_TEMPLATE)
+        self._applied = None
+        self._dropdowns = []
+
+    def variables(self):
+        """应用样式表模板的变量"""
+        variables = {f"s{size}": int(size * self.dpi_scale) for size in SCALED_SIZES}
+        variables.update(
+            accent=self.accent,
+            combo_padding_on=int(6 * self.dpi_scale) - 1,
+            item_radius=int(4 * self.dpi_scale) - 1,
+        )
+        return variables
+
+    def render(self):
+        return self._template.substitute(self.variables())
+
+    def render_dropdown(self):
+        # 下拉列表比主界面更不透明一些（主页透明度 + 20）
+        return self._dropdown_template.substitute(
+            dropdown_alpha=f"{min(255, self.opacity + 20) / 255.0:.2f}")
+
+    def apply(self):
+        """设置字体与应用样式表（样式表与当前相同时跳过）"""
+        app = QApplication.instance()
+        if app is None:
+            return
+        if app.font().family() != self.font_family:
+            app.setFont(QFont(self.font_family))
+        stylesheet = self.render()
+        if stylesheet != self._applied:
+            self._applied = stylesheet
+            app.setStyleSheet(stylesheet)
+
+    def update(self, font_family=None, opacity=None, accent=None):
+        """修改变量并只更新受影响的部分（未传入的变量保持不变）"""
+        if opacity is not None and opacity != self.opacity:
+            self.opacity = opacity
+            stylesheet = self.render_dropdown()
+            for view in self._live_dropdowns():
+                view.setStyleSheet(stylesheet)
+        if font_family is not None:
+            self.font_family = font_family
+        if accent is not None:
+            self.accent = accent
+        self.apply()
+
+    def bind_dropdown(self, combo):
+        """下拉框弹出列表的背景跟随透明度"""
+        view = combo.view()
+        # 弹出窗口不继承下拉框由样式表得到的调色板（否则弹出框背景变为半透明），字体仍取自应用字体
+        view.window().setAttribute(Qt.WidgetAttribute.WA_WindowPropagation, False)
+        view.setStyleSheet(self.render_dropdown())
+        self._dropdowns.append(view)
+
+    def _live_dropdowns(self):
+        self._dropdowns = [view for view in self._dropdowns if not sip.isdeleted(view)]
+        return self._dropdowns
@@ -0,0 +1,43 @@
+"""界面文本与翻译键的绑定"""
+
+from PyQt6 import sip
+
+
+class TranslationRegistry:
+    """控件与翻译键的绑定表
+
+    控件在创建时绑定到翻译键，切换语言时只遍历已绑定的条目，不再按布局位置查找控件；
+    控件销毁后对应条目在下次重新翻译时移除。
+    """
+
+    def __init__(self, language_manager):
+        self.language_manager = language_manager
+        # (widget, key, apply)，apply(text) 为 None 时调用 widget.setText(text)
+        self._bindings = []
+
+    def bind(self, widget, key, apply=None):
+        """绑定 widget 到翻译键 key，返回 widget"""
+        self._bindings.append((widget, key, apply))
+        return widget
+
+    def retranslate(self):
+        """按当前语言更新所有绑定的文本
+
+        setText 只标记需要重绘和重新布局，Qt 会在回到事件循环后合并为一次处理，
+        因此无需用 setUpdatesEnabled(False) 包裹（重新启用时会使整个窗口重绘）。
+        """
+        translate = self.language_manager.translate
+        alive = []
+        for binding in self._bindings:
+            widget, key, apply = binding
+            if sip.isdeleted(widget):
+                continue
+            alive.append(binding)
+            if apply is None:
+                widget.setText(translate(key))
+            else:
+                apply(translate(key))
+        self._bindings = alive
+
+    def __len__(self):
+        return len(self._bindings)
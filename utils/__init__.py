@@ -1,5 +1,6 @@
 """工具函数模块"""
 
 from .icons import load_svg_icon, scale_icon_for_display
+from .icon_cache import IconCache
 
-__all__ = ['load_svg_icon', 'scale_icon_for_display']
+__all__ = ['load_svg_icon', 'scale_icon_for_display', 'IconCache']
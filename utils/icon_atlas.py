@@ -0,0 +1,206 @@
+"""持久化图标图集（磁盘缓存）
+
+将光栅化后的图标像素保存在单个图集文件中，下次启动时一次性 mmap 读入，
+跳过 SVG 解析和光栅化。文件格式：
+
+    b"SPIA" | 版本 (uint32) | 索引长度 (uint32) | JSON 索引 | 像素数据
+
+索引中 files 记录每个 SVG 的 mtime/大小/内容哈希，entries 以
+"内容哈希:像素尺寸:DPR:着色" 为键记录像素数据在文件中的偏移与尺寸。
+只有内容哈希变化的 SVG 才会重新渲染，其余条目原样保留。
+新渲染的条目先保存在内存中，退出时（或累积超过 MAX_PENDING_BYTES 时）写入图集。
+"""
+
+import atexit
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+from PyQt6.QtGui import QImage
+
+
+MAGIC = b"SPIA"
+VERSION = 1
+_HEADER = struct.Struct("<4sII")
+# 相对于项目根目录，不随启动时的工作目录变化
+DEFAULT_ATLAS_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "cache", "icon_atlas.bin"))
+# 未写入图集的新条目的像素数据上限，超过时提前写入
+MAX_PENDING_BYTES = 4 * 1024 * 1024
+
+
+class IconAtlas:
+    def __init__(self, atlas_path=DEFAULT_ATLAS_PATH):
+        self.atlas_path = os.path.abspath(atlas_path)
+        self._loaded = False
+        self._dirty = False
+        self._file = None
+        self._map = None
+        self._data_offset = 0
+        # abs_path -> {"mtime": int, "size": int, "hash": str}
+        self._files = {}
+        # key -> {"offset": int, "width": int, "height": int}，offset 相对于像素数据起点
+        self._entries = {}
+        # key -> (width, height, bytes)，本次运行新渲染、尚未写入的条目
+        self._pending = {}
+        self._pending_bytes = 0
+        atexit.register(self.save)
+
+    def load(self):
+        """读取图集索引并映射像素数据（只在首次调用时执行）"""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        try:
+            self._file = open(self.atlas_path, "rb")
+        except OSError:
+            return
+
+        try:
+            try:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                self._map = self._file.read()
+
+            magic, version, index_len = _HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("incompatible icon atlas")
+            index_start = _HEADER.size
+            index = json.loads(bytes(self._map[index_start:index_start + index_len]).decode("utf-8"))
+            self._files = index.get("files", {})
+            self._entries = index.get("entries", {})
+            self._data_offset = index_start + index_len
+        except (ValueError, struct.error, UnicodeDecodeError):
+            self._close()
+            self._files = {}
+            self._entries = {}
+            self._dirty = True
+
+    def _close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._map = None
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _content_hash(self, svg_path):
+        """获取 SVG 内容哈希，mtime 和大小未变时直接复用索引中的结果"""
+        try:
+            st = os.stat(svg_path)
+        except OSError:
+            return None
+        info = self._files.get(svg_path)
+        if info and info["mtime"] == st.st_mtime_ns and info["size"] == st.st_size:
+            return info["hash"]
+
+        with open(svg_path, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        self._files[svg_path] = {"mtime": st.st_mtime_ns, "size": st.st_size, "hash": digest}
+        self._dirty = True
+        return digest
+
+    @staticmethod
+    def _key(content_hash, pixel_size, device_pixel_ratio, tint):
+        return f"{content_hash}:{pixel_size}:{device_pixel_ratio:g}:{tint}"
+
+    def lookup(self, svg_path, pixel_size, device_pixel_ratio, tint):
+        """查找已渲染的图标，返回 QImage 或 None"""
+        self.load()
+        content_hash = self._content_hash(svg_path)
+        if content_hash is None:
+            return None
+        key = self._key(content_hash, pixel_size, device_pixel_ratio, tint)
+
+        pending = self._pending.get(key)
+        if pending:
+            width, height, data = pending
+        else:
+            entry = self._entries.get(key)
+            if entry is None or self._map is None:
+                return None
+            width, height = entry["width"], entry["height"]
+            start = self._data_offset + entry["offset"]
+            data = bytes(self._map[start:start + width * height * 4])
+
+        image = QImage(data, width, height, width * 4, QImage.Format.Format_ARGB32_Premultiplied)
+        # 脱离 data 缓冲区，避免其被回收后图像失效
+        return image.copy()
+
+    def store(self, svg_path, pixel_size, device_pixel_ratio, tint, image):
+        """记录新渲染的图标，退出时写入图集"""
+        self.load()
+        content_hash = self._content_hash(svg_path)
+        if content_hash is None:
+            return
+        image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+        width, height = image.width(), image.height()
+        # 逐行拷贝以去除可能存在的行尾填充
+        bits = image.constBits()
+        bits.setsize(image.sizeInBytes())
+        raw = bytes(bits)
+        stride = image.bytesPerLine()
+        if stride != width * 4:
+            raw = b"".join(raw[y * stride:y * stride + width * 4] for y in range(height))
+        key = self._key(content_hash, pixel_size, device_pixel_ratio, tint)
+        old = self._pending.get(key)
+        if old:
+            self._pending_bytes -= len(old[2])
+        self._pending[key] = (width, height, raw)
+        self._pending_bytes += len(raw)
+        self._dirty = True
+        if self._pending_bytes > MAX_PENDING_BYTES:
+            self.save()
+
+    def save(self):
+        """原子写入图集文件，丢弃内容已变化的 SVG 对应的旧条目"""
+        if not self._dirty:
+            return
+        live_hashes = {info["hash"] for info in self._files.values()}
+
+        blobs = []
+        entries = {}
+        offset = 0
+        for key, entry in self._entries.items():
+            if key in self._pending or key.split(":", 1)[0] not in live_hashes or self._map is None:
+                continue
+            size = entry["width"] * entry["height"] * 4
+            start = self._data_offset + entry["offset"]
+            blobs.append(bytes(self._map[start:start + size]))
+            entries[key] = {"offset": offset, "width": entry["width"], "height": entry["height"]}
+            offset += size
+        for key, (width, height, raw) in self._pending.items():
+            blobs.append(raw)
+            entries[key] = {"offset": offset, "width": width, "height": height}
+            offset += len(raw)
+
+        index = json.dumps({"files": self._files, "entries": entries}, separators=(",", ":")).encode("utf-8")
+        # Windows 上被映射的文件无法替换，先释放映射
+        self._close()
+
+        try:
+            directory = os.path.dirname(self.atlas_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = self.atlas_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(_HEADER.pack(MAGIC, VERSION, len(index)))
+                f.write(index)
+                for blob in blobs:
+                    f.write(blob)
+            os.replace(tmp_path, self.atlas_path)
+        except OSError:
+            return
+
+        self._entries = entries
+        self._pending = {}
+        self._pending_bytes = 0
+        self._dirty = False
+        self._loaded = False
+        self.load()
+
+
+icon_atlas = IconAtlas()
@@ -0,0 +1,97 @@
+"""进程级着色图标缓存"""
+
+import os
+import time
+from collections import OrderedDict
+
+
+# 默认内存预算：8 MB，足够容纳数百个 2x DPI 下的 20px 图标
+DEFAULT_BUDGET_BYTES = 8 * 1024 * 1024
+# 同一文件两次 mtime 检查的最小间隔（秒），避免每次取图标都访问磁盘
+MTIME_CHECK_INTERVAL = 2.0
+
+
+class IconCache:
+    """按 (路径, 像素尺寸, 设备像素比, 着色) 缓存渲染好的 QPixmap
+
+    使用 LRU 淘汰并限制总内存占用；SVG 文件的 mtime 变化时自动失效。
+    """
+
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES, mtime_check_interval=MTIME_CHECK_INTERVAL):
+        self.budget_bytes = budget_bytes
+        self.mtime_check_interval = mtime_check_interval
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        # path -> (mtime, 上次检查时间)
+        self._mtimes = {}
+
+    @staticmethod
+    def _pixmap_bytes(pixmap):
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+    def _current_mtime(self, path):
+        """获取文件 mtime，在检查间隔内直接复用上次结果"""
+        now = time.monotonic()
+        cached = self._mtimes.get(path)
+        if cached and now - cached[1] < self.mtime_check_interval:
+            return cached[0]
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if cached and cached[0] != mtime:
+            self.invalidate(path)
+        self._mtimes[path] = (mtime, now)
+        return mtime
+
+    def get(self, path, pixel_size, device_pixel_ratio, tint, factory):
+        """取缓存图标，未命中时调用 factory() 渲染并存入缓存"""
+        mtime = self._current_mtime(path)
+        if mtime is None:
+            return None
+
+        key = (path, pixel_size, device_pixel_ratio, tint)
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] == mtime:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        pixmap = factory()
+        if pixmap is None or pixmap.isNull():
+            return None
+        self._store(key, pixmap, mtime)
+        return pixmap
+
+    def _store(self, key, pixmap, mtime):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.used_bytes -= self._pixmap_bytes(old[0])
+
+        size = self._pixmap_bytes(pixmap)
+        self._entries[key] = (pixmap, mtime)
+        self.used_bytes += size
+
+        while self.used_bytes > self.budget_bytes and len(self._entries) > 1:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self.used_bytes -= self._pixmap_bytes(evicted)
+
+    def invalidate(self, path=None):
+        """使指定路径（或全部）的缓存失效"""
+        if path is None:
+            self._entries.clear()
+            self._mtimes.clear()
+            self.used_bytes = 0
+            return
+        for key in [k for k in self._entries if k[0] == path]:
+            pixmap, _ = self._entries.pop(key)
+            self.used_bytes -= self._pixmap_bytes(pixmap)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+icon_cache = IconCache()
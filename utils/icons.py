@@ -1,10 +1,18 @@
 """图标工具函数"""
 
 import os
-from PyQt6.QtGui import QPixmap, QColor, QIcon
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmap, QColor, QImage, QPainter
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtSvg import QSvgRenderer
 from PyQt6.QtWidgets import QApplication
 
+from .icon_cache import icon_cache
+from .icon_atlas import icon_atlas
+
+
+# 默认图标显示尺寸（逻辑像素，未乘 DPI 缩放）
+DEFAULT_ICON_SIZE = 20
+
 
 def _get_device_pixel_ratio():
     """获取当前设备像素比"""
@@ -14,32 +22,94 @@ def _get_device_pixel_ratio():
     return 1.0
 
 
-def load_svg_icon(path, dpi_scale=1.0):
+def resolve_icon_path(path):
+    """将相对于项目根目录的图标路径转换为绝对路径"""
     svg_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", path.replace('\\', os.sep))
-    svg_path = os.path.abspath(svg_path)
-    if os.path.exists(svg_path):
-        icon = QIcon(svg_path)
-        if not icon.isNull():
-            base_size = 32
-            pixmap = icon.pixmap(base_size, base_size)
-            if not pixmap.isNull():
-                image = pixmap.toImage()
-                for y in range(image.height()):
-                    for x in range(image.width()):
-                        color = image.pixelColor(x, y)
-                        if color.alpha() > 0:
-                            image.setPixelColor(x, y, QColor(255, 255, 255, color.alpha()))
-                result = QPixmap.fromImage(image)
-                return result
-    return None
+    return os.path.abspath(svg_path)
+
+
+def render_svg_icon(svg_path, pixel_size, device_pixel_ratio=1.0, color="white"):
+    """将 SVG 直接渲染到目标设备像素尺寸并整体着色
+
+    svg_path 为绝对路径，pixel_size 为逻辑像素尺寸（已包含 DPI 缩放）。
+    返回的 QPixmap 设置了 devicePixelRatio，逻辑尺寸等于 pixel_size。
+    """
+    renderer = QSvgRenderer(svg_path)
+    if not renderer.isValid():
+        return None
+
+    device_size = max(1, round(pixel_size * device_pixel_ratio))
+    image = QImage(device_size, device_size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+
+    # 保持宽高比居中绘制
+    view_box = renderer.viewBoxF()
+    target = QRectF(0, 0, device_size, device_size)
+    if view_box.width() > 0 and view_box.height() > 0 and view_box.width() != view_box.height():
+        ratio = view_box.width() / view_box.height()
+        if ratio > 1:
+            h = device_size / ratio
+            target = QRectF(0, (device_size - h) / 2, device_size, h)
+        else:
+            w = device_size * ratio
+            target = QRectF((device_size - w) / 2, 0, w, device_size)
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+    renderer.render(painter, target)
+    if color is not None:
+        # SourceIn 只保留已有像素的 alpha，用目标颜色整体替换 RGB
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+        painter.fillRect(image.rect(), QColor(color))
+    painter.end()
+
+    pixmap = QPixmap.fromImage(image)
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    return pixmap
+
+
+def load_svg_icon(path, dpi_scale=1.0, size=DEFAULT_ICON_SIZE, color="white"):
+    """加载 SVG 图标，按显示尺寸一次性渲染为白色（或指定颜色）图标
+
+    结果存放在进程级 icon_cache 中，重复调用不会再访问磁盘或重新光栅化；
+    内存缓存未命中时先查找磁盘图集 icon_atlas，冷启动无需重新解析 SVG。
+    """
+    svg_path = resolve_icon_path(path)
+    pixel_size = int(size * dpi_scale)
+    device_pixel_ratio = _get_device_pixel_ratio()
+    return icon_cache.get(
+        svg_path, pixel_size, device_pixel_ratio, color,
+        lambda: _load_from_atlas_or_render(svg_path, pixel_size, device_pixel_ratio, color)
+    )
+
+
+def _load_from_atlas_or_render(svg_path, pixel_size, device_pixel_ratio, color):
+    """优先从磁盘图集读取，未命中时渲染并写回图集"""
+    image = icon_atlas.lookup(svg_path, pixel_size, device_pixel_ratio, color)
+    if image is not None:
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        return pixmap
+
+    pixmap = render_svg_icon(svg_path, pixel_size, device_pixel_ratio, color)
+    if pixmap is not None and not pixmap.isNull():
+        icon_atlas.store(svg_path, pixel_size, device_pixel_ratio, color, pixmap.toImage())
+    return pixmap
 
 
 def scale_icon_for_display(pixmap, size, dpi_scale=1.0):
     if pixmap.isNull():
         return pixmap
     target_size = int(size * dpi_scale)
-    return pixmap.scaled(
-        target_size, target_size,
+    # 已按目标尺寸渲染的图标直接返回，避免二次重采样导致模糊
+    dpr = pixmap.devicePixelRatio()
+    if round(pixmap.width() / dpr) == target_size and round(pixmap.height() / dpr) == target_size:
+        return pixmap
+    scaled = pixmap.scaled(
+        round(target_size * dpr), round(target_size * dpr),
         Qt.AspectRatioMode.KeepAspectRatio,
         Qt.TransformationMode.SmoothTransformation
     )
+    scaled.setDevicePixelRatio(dpr)
+    return scaled
@@ -0,0 +1,146 @@
+"""启动与交互耗时追踪
+
+可选的追踪功能，记录嵌套的耗时区间并在退出时写出 Chrome/Perfetto
+可读取的 JSON 文件（chrome://tracing 或 ui.perfetto.dev 打开）。
+
+启用方式（需在导入被追踪模块之前）：
+- 环境变量 SPECTRA_TRACE=<输出路径>（值为 1 时使用默认路径）
+- 启动参数 --trace [输出路径]，由 main.py 调用 enable()
+
+未启用时 traced 直接返回原函数，trace_span 返回共享的空上下文，几乎没有额外开销。
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+
+DEFAULT_TRACE_PATH = "spectra_trace.json"
+
+_enabled = False
+_output_path = None
+_events = []
+_lock = threading.Lock()
+_start = time.perf_counter()
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "args", "begin")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+        self.begin = 0.0
+
+    def __enter__(self):
+        self.begin = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        event = {
+            "name": self.name,
+            "cat": "spectra",
+            "ph": "X",
+            "ts": (self.begin - _start) * 1e6,
+            "dur": (end - self.begin) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if self.args:
+            event["args"] = self.args
+        with _lock:
+            _events.append(event)
+        return False
+
+
+def enable(path=None):
+    """启用追踪，退出时写出到 path"""
+    global _enabled, _output_path
+    if _enabled:
+        return
+    _enabled = True
+    _output_path = path or DEFAULT_TRACE_PATH
+    atexit.register(write_trace)
+
+
+def is_enabled():
+    return _enabled
+
+
+def trace_span(name, **args):
+    """记录一个耗时区间：with trace_span("phase"): ..."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def instant(name, **args):
+    """记录一个瞬时事件（如首帧绘制完成）"""
+    if not _enabled:
+        return
+    event = {
+        "name": name,
+        "cat": "spectra",
+        "ph": "i",
+        "s": "p",
+        "ts": (time.perf_counter() - _start) * 1e6,
+        "pid": os.getpid(),
+        "tid": threading.get_ident(),
+    }
+    if args:
+        event["args"] = args
+    with _lock:
+        _events.append(event)
+
+
+def traced(name=None):
+    """函数装饰器，将每次调用记录为一个耗时区间
+
+    是否追踪在装饰时决定，未启用时返回原函数本身。
+    """
+    def decorator(func):
+        if not _enabled:
+            return func
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*a, **kw):
+            with _Span(span_name, None):
+                return func(*a, **kw)
+        return wrapper
+    return decorator
+
+
+def write_trace(path=None):
+    """将已记录的事件写出为 Chrome trace JSON"""
+    path = path or _output_path
+    if not path:
+        return
+    with _lock:
+        events = list(_events)
+    metadata = [{
+        "name": "process_name", "ph": "M", "pid": os.getpid(), "tid": 0,
+        "args": {"name": "Spectra"},
+    }]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f)
+
+
+_env_path = os.environ.get("SPECTRA_TRACE")
+if _env_path:
+    enable(None if _env_path == "1" else _env_path)
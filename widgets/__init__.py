@@ -3,5 +3,6 @@
 from .buttons import JellyButton, CardButton, make_transparent
 from .labels import ClickableLabel
 from .cards import NewsCard, get_current_font, set_current_font
+from .panels import TintedPanel
 
-__all__ = ['JellyButton', 'CardButton', 'ClickableLabel', 'make_transparent', 'NewsCard', 'get_current_font', 'set_current_font']
+__all__ = ['JellyButton', 'CardButton', 'ClickableLabel', 'make_transparent', 'NewsCard', 'get_current_font', 'set_current_font', 'TintedPanel']
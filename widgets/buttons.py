@@ -3,7 +3,6 @@
 from PyQt6.QtWidgets import QPushButton, QHBoxLayout, QVBoxLayout, QLabel, QWidget, QStylePainter, QStyleOptionButton
 from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve
 from PyQt6.QtGui import QPainter
-from styles import STYLE_BTN, STYLE_BTN_ACTIVE, STYLE_ICON, STYLE_TEXT
 
 
 def make_transparent(widget):
@@ -0,0 +1,25 @@
+"""自定义面板组件"""
+
+from PyQt6.QtGui import QColor, QPainter
+from PyQt6.QtWidgets import QWidget
+
+
+class TintedPanel(QWidget):
+    """用半透明黑色填充背景的容器
+
+    背景直接绘制而不使用样式表，修改透明度时只重绘自身，不会重新计算子控件的样式。
+    """
+
+    def __init__(self, alpha=0, parent=None):
+        super().__init__(parent)
+        self._alpha = alpha
+
+    def set_alpha(self, alpha):
+        if alpha == self._alpha:
+            return
+        self._alpha = alpha
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), QColor(0, 0, 0, self._alpha))
@@ -7,17 +7,16 @@ import json
 import functools
 from PyQt6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QLabel,
                              QFileDialog, QStackedWidget, QApplication,
-                             QColorDialog)
-from PyQt6.QtCore import Qt, QRect, QPropertyAnimation, QEasingCurve, QTimer, QThread, QUrl, QEventLoop, QPoint
+                             QColorDialog, QMessageBox)
+from PyQt6.QtCore import Qt, QRect, QPropertyAnimation, QEasingCurve, QTimer, QThread, QUrl, QEventLoop, QPoint, pyqtSignal
 from PyQt6.QtGui import QCursor, QColor
-from PyQt6.QtNetwork import QNetworkRequest, QNetworkReply, QNetworkAccessManager
-from BlurWindow.blurWindow import blur
 
-from styles import STYLE_BTN, STYLE_BTN_ACTIVE
 from utils import load_svg_icon, scale_icon_for_display
-from managers import ConfigManager, BackgroundManager, LanguageManager
-from ui import UIBuilder
-from widgets import NewsCard, set_current_font
+from utils.tracing import traced
+from managers import ConfigManager, BackgroundManager, LanguageManager, LanguageWatcher, PlaybackController
+from managers.background import VIDEO_EXTENSIONS
+from ui import UIBuilder, Theme, set_variant
+from widgets import NewsCard, TintedPanel, get_current_font, set_current_font
 
 
 class NewsFetchThread(QThread):
@@ -31,6 +30,8 @@ class NewsFetchThread(QThread):
     
     def run(self):
         """使用 QNetworkAccessManager 进行异步网络请求"""
+        # QtNetwork 只在真正获取新闻时才加载
+        from PyQt6.QtNetwork import QNetworkRequest, QNetworkAccessManager
         self.manager = QNetworkAccessManager()
         self.manager.finished.connect(self._on_request_finished)
         request = QNetworkRequest(QUrl(self.url))
@@ -42,6 +43,7 @@ class NewsFetchThread(QThread):
     
     def _on_request_finished(self, reply):
         """请求完成回调"""
+        from PyQt6.QtNetwork import QNetworkReply
         try:
             if reply.error() == QNetworkReply.NetworkError.NoError:
                 data = reply.readAll().data().decode('utf-8')
@@ -57,20 +59,53 @@ class NewsFetchThread(QThread):
 
 class Window(QWidget):
     EDGE = 8  # 基础边缘宽度，会在 __init__ 中根据 DPI 缩放
+    LAZY_PAGES = True  # 页面首次访问时才构建
+    PREBUILD_PAGES_WHEN_IDLE = True  # 首帧绘制后在空闲时预构建其余页面
+    NEWS_URL = "https://ipv4-beta.kxcym.top:5244/d/ServerPack/Spectra.json?sign=FrsiElECQW_oWeZRUC2AQLSIz55-uzB-2uKik-_6dBY=:0"
 
-    def __init__(self):
+    # 首个页面完整绘制到屏幕后发出
+    first_frame_shown = pyqtSignal()
+
+    @traced()
+    def __init__(self, progress=None):
+        """progress: 可选的启动进度回调 progress(percent, phase)"""
         super().__init__()
+        self._report_progress = progress or (lambda percent, phase: None)
+        self._first_frame_done = False
+
+        self._report_progress(5, "config")
         self.config_manager = ConfigManager()
         self.config = self.config_manager.config
-        self.bg_manager = BackgroundManager(self)
+        self.bg_manager = BackgroundManager(self, self.config.get("background_memory_limit_mb", 256),
+                                            self.config.get("video_max_fps", 0),
+                                            self.config.get("background_rotation_interval", 300),
+                                            on_image_error=self._on_background_image_error)
+        # 不透明度为最大值时侧边栏和内容区完全遮挡背景，视频无需播放；
+        # 限制帧率（低功耗模式）时，窗口空闲后停在当前帧
+        self.playback_controller = PlaybackController(
+            self, self.bg_manager,
+            is_covered=lambda: self.config.get("blur_opacity", 80) >= 255,
+            pause_when_idle=lambda: self.config.get("video_max_fps", 0) > 0)
+        self.config_manager.subscribe("blur_opacity", lambda value: self.playback_controller.update())
         self.language_manager = LanguageManager(self.config_manager)
+        # 语言文件修改后自动重新加载
+        self.language_watcher = LanguageWatcher(self.language_manager, self._on_languages_reloaded, self)
 
         self.dpi_scale = self._get_system_dpi_scale()
 
         self.ui_builder = UIBuilder(self)
         self.edge_size = self.ui_builder._scale_size(8)
 
+        # 应用样式表由模板生成，创建控件前设置一次；字体通过 setFont 传播，
+        # 透明度变化只更新下拉列表自身的样式表，都不替换应用样式表
+        self.theme = Theme(self.dpi_scale, get_current_font(), self.config.get("blur_opacity", 80))
+        self.config_manager.subscribe("blur_opacity", lambda value: self.theme.update(opacity=value))
+        # 在创建控件之前确定字体，控件创建时即按最终样式计算
+        self._report_progress(10, "font")
+        self.apply_font()
+
         self.setWindowTitle(self.language_manager.translate("app_title"))
+        self.ui_builder.translations.bind(self, "app_title", self.setWindowTitle)
         if os.path.exists("icon.png"):
             from PyQt6.QtGui import QIcon
             self.setWindowIcon(QIcon("icon.png"))
@@ -82,7 +117,9 @@ class Window(QWidget):
         self.setMouseTracking(True)
 
         self._init_ui()
+        self._report_progress(20, "nav")
         self._init_nav()
+        self._report_progress(40, "content")
         self._init_content()
         self._apply_dpi_scaling()
 
@@ -91,9 +128,6 @@ class Window(QWidget):
         self.current_bg_path = None
         self.switch_page(0)
 
-        # 应用初始字体设置（在所有 UI 初始化完成后立即应用）
-        self.apply_font()
-
         self.cursor_timer = QTimer()
         def update_cursor_safe():
             try:
@@ -103,9 +137,21 @@ class Window(QWidget):
         self.cursor_timer.timeout.connect(update_cursor_safe)
         self.cursor_timer.start(50)
 
+        self._report_progress(90, "background")
         if self.config.get("background_mode") == "image" and self.config.get("background_image_path"):
             if os.path.exists(self.config.get("background_image_path")):
                 self.set_background_image(self.config.get("background_image_path"))
+        self._report_progress(100, "ready")
+
+        if self.LAZY_PAGES and self.PREBUILD_PAGES_WHEN_IDLE:
+            self.first_frame_shown.connect(self._build_pages_when_idle)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._first_frame_done:
+            self._first_frame_done = True
+            # 本轮绘制（含所有子控件）提交后再通知
+            QTimer.singleShot(0, self.first_frame_shown.emit)
 
     def _get_system_dpi_scale(self):
         if sys.platform == 'win32':
@@ -172,12 +218,12 @@ class Window(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
+    @traced()
     def _init_nav(self):
         """初始化导航栏"""
-        self.sidebar = QWidget()
+        self.sidebar = TintedPanel(self.config.get("blur_opacity", 80))
+        self.config_manager.subscribe("blur_opacity", self.sidebar.set_alpha)
         self.sidebar.setFixedWidth(self.ui_builder._scale_size(50))
-        opacity_value = self.config.get("blur_opacity", 150)
-        self.sidebar.setStyleSheet(f"background:rgba(0,0,0,{opacity_value});")
         self.sidebar.setMouseTracking(True)
         self.sidebar_expanded = False
         self.nav_texts = []
@@ -197,59 +243,53 @@ class Window(QWidget):
         tl = QHBoxLayout(title)
         tl.setContentsMargins(self.ui_builder._scale_size(42), 0, self.ui_builder._scale_size(5), 0)
         self.title_lbl = QLabel("Spectra")
-        font_size = int(14 * self.dpi_scale)
-        self.title_lbl.setStyleSheet(f"color:white;background:transparent;font-size:{font_size}px;font-family:'{self.ui_builder._get_font_family()}';")
+        self.title_lbl.setObjectName("app_title")
         self.title_lbl.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         self.title_lbl.setMouseTracking(True)
         self.title_lbl.hide()
         tl.addWidget(self.title_lbl)
         sb.addWidget(title)
         menu_icon = load_svg_icon("svg/chevron-bar-right.svg", self.dpi_scale)
-        menu_icon_active = load_svg_icon("svg/chevron-bar-left.svg", self.dpi_scale)
         menu_btn_container = self.ui_builder.create_nav_btn(
-            menu_icon if menu_icon else "\uE700", self.language_manager.translate("nav_collapse"), self.toggle_sidebar,
+            menu_icon if menu_icon else "\uE700", "nav_collapse", self.toggle_sidebar,
             None, "svg/chevron-bar-right.svg", "svg/chevron-bar-left.svg"
         )
         self.menu_icon_label = menu_btn_container.findChild(QLabel, "nav_icon")
         sb.addWidget(menu_btn_container)
 
         home_icon = load_svg_icon("svg/grid-1x2.svg", self.dpi_scale)
-        home_icon_active = load_svg_icon("svg/grid-1x2-fill.svg", self.dpi_scale)
         sb.addWidget(self.ui_builder.create_nav_btn(
-            home_icon if home_icon else "\uE80F", self.language_manager.translate("nav_home"),
+            home_icon if home_icon else "\uE80F", "nav_home",
             lambda: self.switch_page(0), 0, "svg/grid-1x2.svg", "svg/grid-1x2-fill.svg"
         ))
 
-        instance_icon = load_svg_icon("svg/box.svg")
-        instance_icon_active = load_svg_icon("svg/box-fill.svg")
+        instance_icon = load_svg_icon("svg/box.svg", self.dpi_scale)
         sb.addWidget(self.ui_builder.create_nav_btn(
-            instance_icon if instance_icon else "\uE7A8", self.language_manager.translate("nav_instances"),
+            instance_icon if instance_icon else "\uE7A8", "nav_instances",
             lambda: self.switch_page(1), 1, "svg/box.svg", "svg/box-fill.svg"
         ))
 
-        download_icon = load_svg_icon("svg/arrow-down-circle.svg")
-        download_icon_active = load_svg_icon("svg/arrow-down-circle-fill.svg")
+        download_icon = load_svg_icon("svg/arrow-down-circle.svg", self.dpi_scale)
         sb.addWidget(self.ui_builder.create_nav_btn(
-            download_icon if download_icon else "\uE7A8", self.language_manager.translate("nav_downloads"),
+            download_icon if download_icon else "\uE7A8", "nav_downloads",
             lambda: self.switch_page(2), 2, "svg/arrow-down-circle.svg", "svg/arrow-down-circle-fill.svg"
         ))
 
         sb.addStretch()
 
         settings_icon = load_svg_icon("svg/gear.svg", self.dpi_scale)
-        settings_icon_active = load_svg_icon("svg/gear-fill.svg", self.dpi_scale)
         sb.addWidget(self.ui_builder.create_nav_btn(
-            settings_icon if settings_icon else "\uE713", self.language_manager.translate("nav_settings"),
+            settings_icon if settings_icon else "\uE713", "nav_settings",
             lambda: self.switch_page(3), 3, "svg/gear.svg", "svg/gear-fill.svg"
         ))
 
         self.layout().addWidget(self.sidebar)
 
+    @traced()
     def _init_content(self):
         """初始化右侧内容区"""
-        self.right_panel = QWidget()
-        opacity_value = self.config.get("blur_opacity", 150)
-        self.right_panel.setStyleSheet(f"background:rgba(0,0,0,{opacity_value});")
+        self.right_panel = TintedPanel(self.config.get("blur_opacity", 80))
+        self.config_manager.subscribe("blur_opacity", self.right_panel.set_alpha)
         self.right_panel.setMouseTracking(True)
         rl = QVBoxLayout(self.right_panel)
         rl.setContentsMargins(0, 0, 0, 0)
@@ -257,7 +297,6 @@ class Window(QWidget):
 
         titlebar = QWidget()
         titlebar.setFixedHeight(self.ui_builder._scale_size(40))
-        titlebar.setStyleSheet("background:transparent;")
         titlebar.setMouseTracking(True)
         tb = QHBoxLayout(titlebar)
         tb.setContentsMargins(0, 0, self.ui_builder._scale_size(8), 0)
@@ -266,77 +305,70 @@ class Window(QWidget):
             tb.addWidget(self.ui_builder.create_title_btn(t, s))
         rl.addWidget(titlebar)
         self.stack = QStackedWidget()
-        self.stack.setStyleSheet("background:transparent;")
-        self.stack.addWidget(self._create_home_page())
-        self.stack.addWidget(self.ui_builder.create_instance_page())
-        self.stack.addWidget(self.ui_builder.create_download_page())
-        self.stack.addWidget(self.ui_builder.create_config_page())
+        # 页面工厂：页面在首次切换到时才构建，之前用空占位控件代替
+        self._page_factories = [
+            self._create_home_page,
+            self.ui_builder.create_instance_page,
+            self.ui_builder.create_download_page,
+            self.ui_builder.create_config_page,
+        ]
+        self._pages_built = [False] * len(self._page_factories)
+        for _ in self._page_factories:
+            self.stack.addWidget(QWidget())
+        if not self.LAZY_PAGES:
+            for index in range(len(self._page_factories)):
+                self._ensure_page(index)
         rl.addWidget(self.stack, 1)
 
         self.layout().addWidget(self.right_panel, 1)
+
+    @traced()
+    def _ensure_page(self, index):
+        """确保指定页面已构建，未构建时调用工厂替换占位控件"""
+        if self._pages_built[index]:
+            return self.stack.widget(index)
+        self._pages_built[index] = True
+
+        # 新页面使用当前的字体、语言和透明度配置构建，无需额外同步
+        page = self._page_factories[index]()
+        placeholder = self.stack.widget(index)
+        current = self.stack.currentIndex()
+        self.stack.insertWidget(index, page)
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        if current >= 0:
+            self.stack.setCurrentIndex(current)
+        return page
+
+    def _build_pages_when_idle(self):
+        """首帧绘制后，在空闲时逐个构建剩余页面"""
+        for index, built in enumerate(self._pages_built):
+            if not built:
+                self._ensure_page(index)
+                # 每次事件循环只构建一个页面，避免阻塞用户输入
+                QTimer.singleShot(0, self._build_pages_when_idle)
+                return
     
     def _create_home_page(self):
         """创建主页"""
-        from PyQt6.QtWidgets import QScrollArea
-
         home_widget = QWidget()
         home_layout = QVBoxLayout(home_widget)
         home_layout.setContentsMargins(self.ui_builder._scale_size(20), 0, self.ui_builder._scale_size(20), self.ui_builder._scale_size(20))
         home_layout.setSpacing(self.ui_builder._scale_size(15))
 
-        # 创建滚动区域
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background: rgba(255, 255, 255, 0.1);
-                width: 8px;
-                border-radius: 4px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(255, 255, 255, 0.3);
-                min-height: 20px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(255, 255, 255, 0.5);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
-
-        # 滚动内容区域
-        scroll_content = QWidget()
-        scroll_content.setStyleSheet("background: transparent;")
-        scroll_layout = QVBoxLayout(scroll_content)
-        scroll_layout.setContentsMargins(0, self.ui_builder._scale_size(10), 0, 0)
-        scroll_layout.setSpacing(self.ui_builder._scale_size(15))
-        scroll_layout.addStretch()
-
-        scroll_area.setWidget(scroll_content)
+        # 滚动区域
+        scroll_area, scroll_layout = self.ui_builder.create_scroll_area(self.ui_builder._scale_size(10))
+        scroll_content = scroll_area.widget()
         home_layout.addWidget(scroll_area, 1)
 
         # 存储新闻卡片的列表
         scroll_content.news_cards = []
 
-        # 启动新闻获取线程
-        news_url = "https://ipv4-beta.kxcym.top:5244/d/ServerPack/Spectra.json?sign=FrsiElECQW_oWeZRUC2AQLSIz55-uzB-2uKik-_6dBY=:0"
-        self.news_thread = NewsFetchThread(news_url)
-        self.news_thread.finished.connect(lambda: self._on_news_loaded(scroll_layout, self.news_thread))
-        self.news_thread.start()
+        # 启动新闻获取线程（NEWS_URL 为空时不获取）
+        if self.NEWS_URL:
+            self.news_thread = NewsFetchThread(self.NEWS_URL)
+            self.news_thread.finished.connect(lambda: self._on_news_loaded(scroll_layout, self.news_thread))
+            self.news_thread.start()
 
         return home_widget
     
@@ -419,13 +451,47 @@ class Window(QWidget):
             news_cards.remove(card)
         card.deleteLater()
 
+    def closeEvent(self, event):
+        self.config_manager.flush()
+        self.bg_manager.shutdown()
+        super().closeEvent(event)
+
+    def bring_to_front(self):
+        """恢复并激活窗口（另一个实例启动时调用）"""
+        if self.isMinimized():
+            self.showNormal()
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
     def showEvent(self, event):
         super().showEvent(event)
-        blur(self.winId())
-        ctypes.windll.dwmapi.DwmSetWindowAttribute(int(self.winId()), 33, ctypes.byref(ctypes.c_int(2)), 4)
+        self._apply_native_blur()
+        if sys.platform == 'win32':
+            ctypes.windll.dwmapi.DwmSetWindowAttribute(int(self.winId()), 33, ctypes.byref(ctypes.c_int(2)), 4)
         self.apply_opacity()
 
+    def _apply_native_blur(self):
+        """应用系统窗口模糊效果（BlurWindow 在窗口显示时才导入，仅支持 Windows）"""
+        if sys.platform != 'win32':
+            # 其他平台没有系统模糊，模糊背景模式下使用软件亚克力
+            if self.config.get("background_mode") == "blur":
+                self._apply_software_acrylic()
+            return
+        from BlurWindow.blurWindow import blur
+        blur(self.winId())
+
+    def _apply_software_acrylic(self):
+        """以已选择的背景图片为模糊源；未选择图片时不显示背景（无法获得窗口后方的内容）"""
+        path = self.config.get("background_image_path", "")
+        if not path or not os.path.isfile(path) or os.path.splitext(path)[1].lower() in VIDEO_EXTENSIONS:
+            self.bg_manager.hide()
+            return
+        self.bg_manager.set_acrylic(path)
+
+    @traced()
     def switch_page(self, index):
+        self._ensure_page(index)
         self.stack.setCurrentIndex(index)
         for item in self.nav_indicators:
             if len(item) == 3:
@@ -435,9 +501,9 @@ class Window(QWidget):
             else:
                 i, ind, btn, icon_path, icon_path_active, container = item
 
+            set_variant(ind, "active", i == index)
+            set_variant(btn, "active", i == index)
             if i == index:
-                ind.setStyleSheet(f"background:#a0a0ff;border-radius:{self.ui_builder._scale_size(1)}px;")
-                btn.setStyleSheet(STYLE_BTN_ACTIVE)
                 if icon_path_active and container:
                     icon_pixmap = load_svg_icon(icon_path_active, self.dpi_scale)
                     if icon_pixmap:
@@ -445,8 +511,6 @@ class Window(QWidget):
                         if icon_lbl:
                             icon_lbl.setPixmap(scale_icon_for_display(icon_pixmap, 20, self.dpi_scale))
             else:
-                ind.setStyleSheet(f"background:transparent;border-radius:{self.ui_builder._scale_size(1)}px;")
-                btn.setStyleSheet(STYLE_BTN)
                 if icon_path and container:
                     icon_pixmap = load_svg_icon(icon_path, self.dpi_scale)
                     if icon_pixmap:
@@ -454,6 +518,7 @@ class Window(QWidget):
                         if icon_lbl:
                             icon_lbl.setPixmap(scale_icon_for_display(icon_pixmap, 20, self.dpi_scale))
 
+    @traced()
     def toggle_sidebar(self):
         self.anim = QPropertyAnimation(self.sidebar, b"minimumWidth")
         self.anim2 = QPropertyAnimation(self.sidebar, b"maximumWidth")
@@ -515,75 +580,60 @@ class Window(QWidget):
             self.language_manager.set_language(lang_code)
             self.update_ui_language()
     
+    def _on_languages_reloaded(self, active_changed, languages_changed):
+        """语言文件热重载后刷新语言列表和界面文本"""
+        if languages_changed:
+            self.ui_builder.update_language_combo()
+        if active_changed:
+            self.update_ui_language()
+
+    @traced()
     def update_ui_language(self):
-        """更新界面语言"""
-        # 更新窗口标题
-        self.setWindowTitle(self.language_manager.translate("app_title"))
-        
-        # 更新导航栏文本
-        nav_texts = [
-            self.language_manager.translate("nav_collapse"),
-            self.language_manager.translate("nav_home"),
-            self.language_manager.translate("nav_instances"),
-            self.language_manager.translate("nav_downloads"),
-            self.language_manager.translate("nav_settings")
-        ]
-        
-        for i, text_widget in enumerate(self.nav_texts):
-            if i < len(nav_texts):
-                text_widget.setText(nav_texts[i])
-        
-        # 更新页面标题
-        self.ui_builder._update_page_titles()
-        
-        # 更新设置页面内容
-        self.ui_builder._update_settings_page()
+        """更新界面语言（只更新创建时绑定了翻译键的控件）"""
+        self.ui_builder.translations.retranslate()
 
+    @traced()
     def set_background(self, mode):
         self.config["background_mode"] = mode
         self.config_manager.save_config()
 
         if mode == "blur":
-            self.blur_card.setStyleSheet(
-                "QPushButton{background:rgba(255,255,255,0.15);border:none;border-radius:0px;}QPushButton:hover{background:rgba(255,255,255,0.1);}QPushButton:pressed{background:rgba(255,255,255,0.05);}")
+            set_variant(self.blur_card, "selected", True)
             check_pixmap = load_svg_icon("svg/check-lg.svg", self.dpi_scale)
             if check_pixmap:
                 self.blur_card.check_label.setPixmap(scale_icon_for_display(check_pixmap, 20, self.dpi_scale))
 
             # 清除其他卡片选中状态
             if hasattr(self, 'solid_card'):
-                self.solid_card.setStyleSheet(
-                    "QPushButton{background:rgba(255,255,255,0.05);border:none;border-radius:0px;}QPushButton:hover{background:rgba(255,255,255,0.1);}QPushButton:pressed{background:rgba(255,255,255,0.03);}")
+                set_variant(self.solid_card, "selected", False)
                 self.solid_card.check_label.clear()
                 self.color_widget.setVisible(False)
 
-            self.image_card.setStyleSheet(
-                "QPushButton{background:rgba(255,255,255,0.05);border:none;border-radius:0px;}QPushButton:hover{background:rgba(255,255,255,0.1);}QPushButton:pressed{background:rgba(255,255,255,0.03);}")
+            set_variant(self.image_card, "selected", False)
             self.image_card.check_label.clear()
             self.path_widget.setVisible(False)
             self.opacity_widget.setVisible(True)
+            self.video_fps_widget.setVisible(False)
             self.apply_opacity()
 
-            blur(self.winId())
             self.bg_manager.hide()
+            self._apply_native_blur()
 
         elif mode == "solid":
-            self.blur_card.setStyleSheet(
-                "QPushButton{background:rgba(255,255,255,0.05);border:none;border-radius:0px;}QPushButton:hover{background:rgba(255,255,255,0.1);}QPushButton:pressed{background:rgba(255,255,255,0.03);}")
+            set_variant(self.blur_card, "selected", False)
             self.blur_card.check_label.clear()
 
-            self.solid_card.setStyleSheet(
-                "QPushButton{background:rgba(255,255,255,0.15);border:none;border-radius:0px;}QPushButton:hover{background:rgba(255,255,255,0.1);}QPushButton:pressed{background:rgba(255,255,255,0.05);}")
+            set_variant(self.solid_card, "selected", True)
             check_pixmap = load_svg_icon("svg/check-lg.svg", self.dpi_scale)
             if check_pixmap:
                 self.solid_card.check_label.setPixmap(scale_icon_for_display(check_pixmap, 20, self.dpi_scale))
 
-            self.image_card.setStyleSheet(
-                "QPushButton{background:rgba(255,255,255,0.05);border:none;border-radius:0px;}QPushButton:hover{background:rgba(255,255,255,0.1);}QPushButton:pressed{background:rgba(255,255,255,0.03);}")
+            set_variant(self.image_card, "selected", False)
             self.image_card.check_label.clear()
 
             self.path_widget.setVisible(False)
             self.opacity_widget.setVisible(False)
+            self.video_fps_widget.setVisible(False)
             self.color_widget.setVisible(True)
 
             # 应用纯色背景
@@ -591,29 +641,28 @@ class Window(QWidget):
             self.bg_manager.set_solid_color(color)
 
         elif mode == "image":
-            self.blur_card.setStyleSheet(
-                "QPushButton{background:rgba(255,255,255,0.05);border:none;border-radius:0px;}QPushButton:hover{background:rgba(255,255,255,0.1);}QPushButton:pressed{background:rgba(255,255,255,0.03);}")
+            set_variant(self.blur_card, "selected", False)
             self.blur_card.check_label.clear()
 
             if hasattr(self, 'solid_card'):
-                self.solid_card.setStyleSheet(
-                    "QPushButton{background:rgba(255,255,255,0.05);border:none;border-radius:0px;}QPushButton:hover{background:rgba(255,255,255,0.1);}QPushButton:pressed{background:rgba(255,255,255,0.03);}")
+                set_variant(self.solid_card, "selected", False)
                 self.solid_card.check_label.clear()
                 self.color_widget.setVisible(False)
 
-            self.image_card.setStyleSheet(
-                "QPushButton{background:rgba(255,255,255,0.15);border:none;border-radius:0px;}QPushButton:hover{background:rgba(255,255,255,0.1);}QPushButton:pressed{background:rgba(255,255,255,0.05);}")
+            set_variant(self.image_card, "selected", True)
             check_pixmap = load_svg_icon("svg/check-lg.svg", self.dpi_scale)
             if check_pixmap:
                 self.image_card.check_label.setPixmap(scale_icon_for_display(check_pixmap, 20, self.dpi_scale))
 
             self.path_widget.setVisible(True)
             self.opacity_widget.setVisible(False)
+            self.video_fps_widget.setVisible(True)
             self.color_widget.setVisible(False)
 
             if self.config.get("background_image_path") and os.path.exists(self.config.get("background_image_path")):
                 self.set_background_image(self.config.get("background_image_path"))
 
+    @traced()
     def set_background_image(self, path):
         self.bg_manager.set_background_image(path)
         self.current_bg_path = path
@@ -628,27 +677,41 @@ class Window(QWidget):
             self.config["background_image_path"] = ""
             self.config_manager.save_config()
 
+    def _on_background_image_error(self, path, error):
+        """背景图片无法解码（如文件损坏或尺寸过大）时提示用户"""
+        tr = self.language_manager.translate
+        QMessageBox.warning(self, tr("bg_image_error_title"),
+                            tr("bg_image_error").format(file=os.path.basename(path), error=error))
+
     def on_opacity_changed(self, value):
-        self.config["blur_opacity"] = value
-        self.config_manager.save_config()
-        opacity_percent = int((value - 10) / (255 - 10) * 100)
-        self.opacity_value_label.setText(str(opacity_percent) + "%")
-        self.apply_opacity()
+        # 侧边栏、内容区、下拉框和百分比标签各自订阅了 blur_opacity
+        self.config_manager.set("blur_opacity", value)
 
+    def on_video_fps_changed(self, value):
+        self.config_manager.set("video_max_fps", value)
+        self.video_fps_value_label.setText(self.ui_builder.format_video_fps(value))
+        # 修改帧率上限会重新设置视频输出，拖动滑块时等数值停止变化后再应用
+        if not hasattr(self, '_video_fps_timer'):
+            self._video_fps_timer = QTimer()
+            self._video_fps_timer.setSingleShot(True)
+            self._video_fps_timer.timeout.connect(self._apply_video_max_fps)
+
+        self._video_fps_timer.start(300)
+
+    def _apply_video_max_fps(self):
+        self.bg_manager.set_video_max_fps(self.config.get("video_max_fps", 0))
+        self.playback_controller.update()
+
+    @traced()
     def apply_opacity(self):
-        opacity_value = self.config.get("blur_opacity", 150)
-        self.right_panel.setStyleSheet(f"background:rgba(0,0,0,{opacity_value});")
-        self.sidebar.setStyleSheet(f"background:rgba(0,0,0,{opacity_value});")
-        # 更新下拉框的透明度（主页透明度 + 20）
-        dropdown_opacity_value = min(255, opacity_value + 20)
-        dropdown_opacity_rgba = dropdown_opacity_value / 255.0
-        self.ui_builder.update_combobox_opacity(dropdown_opacity_rgba)
+        """重新应用所有绑定到 blur_opacity 的控件"""
+        self.config_manager.notify("blur_opacity")
 
     def choose_background_image(self):
         """选择背景图像"""
         file, _ = QFileDialog.getOpenFileName(
             self, "选择背景", "",
-            "媒体文件 (*.png *.jpg *.jpeg *.bmp *.mp4 *.avi *.mov *.mkv *.webm);;所有文件 (*.*)"
+            "媒体文件 (*.png *.jpg *.jpeg *.bmp *.gif *.webp *.mp4 *.avi *.mov *.mkv *.webm);;所有文件 (*.*)"
         )
         if file:
             self.config["background_image_path"] = file
@@ -758,7 +821,11 @@ class Window(QWidget):
 
     def resizeEvent(self, ev):
         super().resizeEvent(ev)
-        if hasattr(self, 'current_bg_path') and self.current_bg_path:
+        if self.config.get("background_mode") == "blur" and sys.platform != 'win32':
+            # 首次显示前由 showEvent 处理
+            if self.isVisible():
+                self._apply_software_acrylic()
+        elif hasattr(self, 'current_bg_path') and self.current_bg_path:
             self.set_background_image(self.current_bg_path)
 
         if not hasattr(self, '_resize_timer'):
@@ -807,14 +874,12 @@ class Window(QWidget):
 
         for card, card_mode in cards:
             if card_mode == mode:
-                card.setStyleSheet(
-                    "QPushButton{background:rgba(255,255,255,0.15);border:none;border-radius:0px;}QPushButton:hover{background:rgba(255,255,255,0.1);}QPushButton:pressed{background:rgba(255,255,255,0.05);}")
+                set_variant(card, "selected", True)
                 check_pixmap = load_svg_icon("svg/check-lg.svg", self.dpi_scale)
                 if check_pixmap:
                     card.check_label.setPixmap(scale_icon_for_display(check_pixmap, 20, self.dpi_scale))
             else:
-                card.setStyleSheet(
-                    "QPushButton{background:rgba(255,255,255,0.05);border:none;border-radius:0px;}QPushButton:hover{background:rgba(255,255,255,0.1);}QPushButton:pressed{background:rgba(255,255,255,0.03);}")
+                set_variant(card, "selected", False)
                 card.check_label.clear()
 
     def on_font_family_changed(self, font_family):
@@ -846,6 +911,7 @@ class Window(QWidget):
             self.font_path_input.setText(file)
             self.apply_font()
 
+    @traced()
     def apply_font(self):
         """应用字体设置"""
         from PyQt6.QtGui import QFontDatabase, QFont
@@ -867,55 +933,8 @@ class Window(QWidget):
 
     def _apply_font_to_app(self, font_family):
         """应用字体到应用的所有控件"""
-        from PyQt6.QtGui import QFont
-
         # 设置全局字体
         set_current_font(font_family)
 
-        app = QApplication.instance()
-        if app:
-            font = QFont(font_family)
-            app.setFont(font)
-
-            # 强制更新所有控件以应用新字体
-            # 注意：样式表中的字体设置优先级高于 setFont，所以需要手动更新
-            self._update_all_fonts(font_family)
-
-    def _update_all_fonts(self, font_family):
-        """更新所有控件的字体样式"""
-        # 转义字体名称中的特殊字符
-        escaped_font = font_family.replace("\\", "\\\\").replace("'", "\\'").replace('"', '\\"')
-        # 使用双引号包裹字体名称，避免单引号问题
-        font_family_quoted = f'"{escaped_font}"'
-
-        # 更新窗口中的导航文本和标题
-        for text_widget in self.nav_texts:
-            font_size = int(14 * self.dpi_scale)
-            text_widget.setStyleSheet(f"color:white;background:transparent;font-size:{font_size}px;font-family:{font_family_quoted};")
-
-        # 更新标题标签
-        if hasattr(self, 'title_lbl'):
-            font_size = int(14 * self.dpi_scale)
-            self.title_lbl.setStyleSheet(f"color:white;background:transparent;font-size:{font_size}px;font-family:{font_family_quoted};")
-
-        # 更新所有新闻卡片的字体
-        home_page = self.stack.widget(0)
-        if home_page:
-            # 获取主页的滚动区域（通过遍历布局查找）
-            from PyQt6.QtWidgets import QScrollArea
-            scroll_area = home_page.findChild(QScrollArea)
-            if scroll_area:
-                # 获取 scroll_content
-                scroll_content = scroll_area.widget()
-                if scroll_content and hasattr(scroll_content, 'news_cards'):
-                    for card in scroll_content.news_cards:
-                        card.update_font(font_family)
-
-        # 触发 UI 更新以刷新设置页面的字体
-        try:
-            self.ui_builder._update_settings_font(font_family)
-        except Exception as e:
-            # 静默处理字体更新错误，避免崩溃
-            pass
-
-
+        # 字体随 QApplication.setFont 传播到所有控件，无需逐个更新样式表
+        self.theme.update(font_family=font_family)